@@ -39,17 +39,38 @@ def _float_env(key: str, default: float) -> float:
         return default
 
 
+def _int_env(key: str, default: int) -> int:
+    """Parse env var as int; return default if missing or invalid."""
+    v = os.getenv(key)
+    if v is None:
+        return default
+    try:
+        return int(v)
+    except ValueError:
+        return default
+
+
 # -----------------------------------------------------------------------------
 # LLM Temperatures (0.0 = deterministic, 1.0 = more creative)
 # Override via env: CB_CONTENT_MODEL_TEMPERATURE, CB_DESIGN_EVALUATOR_MODEL_TEMPERATURE, etc.
 # -----------------------------------------------------------------------------
 CONTENT_MODEL_TEMPERATURE = _float_env("CB_CONTENT_MODEL_TEMPERATURE", 0.2)
-DESIGN_EVALUATOR_MODEL_TEMPERATURE = _float_env("CB_DESIGN_EVALUATOR_MODEL_TEMPERATURE", 0.2)
+DESIGN_EVALUATOR_MODEL_TEMPERATURE = _float_env("CB_DESIGN_EVALUATOR_MODEL_TEMPERATURE", 0.0)
 EXECUTOR_MODEL_TEMPERATURE = _float_env("CB_EXECUTOR_MODEL_TEMPERATURE", 0.7)
 IMAGE_EVALUATOR_MODEL_TEMPERATURE = _float_env("CB_IMAGE_EVALUATOR_MODEL_TEMPERATURE", 0.2)
 PINTEREST_MODEL_TEMPERATURE = _float_env("CB_PINTEREST_MODEL_TEMPERATURE", 0.7)
 GUIDE_CHAT_MODEL_TEMPERATURE = _float_env("CB_GUIDE_CHAT_MODEL_TEMPERATURE", 0.3)
 
+# Output cap for the design evaluator (structured JSON verdicts stay well below this)
+# Override via env: CB_DESIGN_EVALUATOR_MAX_TOKENS
+DESIGN_EVALUATOR_MAX_TOKENS = _int_env("CB_DESIGN_EVALUATOR_MAX_TOKENS", 1500)
+
+# On-disk memoization of design-generation LLM responses (for development replays)
+# Override via env: CB_LLM_CACHE=1 to enable, CB_LLM_CACHE_DIR, CB_LLM_CACHE_TTL (seconds)
+LLM_CACHE_ENABLED = os.getenv("CB_LLM_CACHE", "0").lower() in ("1", "true", "yes")
+LLM_CACHE_DIR = Path(os.path.expanduser(os.getenv("CB_LLM_CACHE_DIR", "~/.cache/coloring_book/llm")))
+LLM_CACHE_TTL_SECONDS = _int_env("CB_LLM_CACHE_TTL", 7 * 86400)
+
 # Image quality evaluator persistence
 IMAGE_EVALUATIONS_FILE = "image_evaluations.json"
 IMAGE_MIN_SCORE_THRESHOLD = 70
@@ -5,6 +5,12 @@ from pathlib import Path
 from typing import Optional, Dict, List
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config import (
     IMAGE_EVALUATIONS_FILE,
     SAVED_DESIGNS_DIR,
@@ -17,12 +23,25 @@ PINTEREST_CONFIG_FILE = PINTEREST_PUBLISH_DIR / "pinterest_config.json"
 SAVED_STATES_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# orjson.JSONEncodeError subclasses TypeError, so one except clause covers both encoders
+_dumps = (lambda value: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)) if ORJSON_AVAILABLE else json.dumps
+
+
+def _write_json(path: Path, data, default=None) -> None:
+    """Write data as indented UTF-8 JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=default)
+
+
 def _prepare_state_for_json(state: dict) -> dict:
     """Prepare state for JSON serialization. Skips/converts non-serializable values."""
     result = {}
     for key, value in state.items():
         try:
-            json.dumps(value)
+            _dumps(value)
             result[key] = value
         except (TypeError, ValueError):
             if key not in ["messages"]:
@@ -70,8 +89,7 @@ def save_workflow_state(state: Dict, name: Optional[str] = None) -> str:
     }
     
     # Save to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(state_to_save, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(filepath, state_to_save, default=str)
     
     return str(filepath)
 
@@ -425,8 +443,7 @@ def create_design_package(state: dict, name: Optional[str] = None) -> str:
         "version": "1.0"
     }
     design_file = pkg_path / DESIGN_JSON_FILE
-    with open(design_file, "w", encoding="utf-8") as f:
-        json.dump(state_to_save, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(design_file, state_to_save, default=str)
     return str(pkg_path.resolve())
 
 
@@ -482,16 +499,14 @@ def save_design_package(
         "saved_by": "save_design_package",
         "version": "1.0"
     }
-    with open(pkg / DESIGN_JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(state_to_save, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(pkg / DESIGN_JSON_FILE, state_to_save, default=str)
     # Write book_config.json for Pinterest
     book_config = {
         "title": state.get("title", ""),
         "description": state.get("description", ""),
         "seo_keywords": state.get("seo_keywords", [])
     }
-    with open(pkg / BOOK_CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(book_config, f, indent=2, ensure_ascii=False)
+    _write_json(pkg / BOOK_CONFIG_FILE, book_config)
     return str(pkg.resolve())
 
 
@@ -503,15 +518,13 @@ def _update_design_package_metadata(state: dict, package_path: str | Path) -> No
     state_copy["design_package_path"] = str(pkg.resolve())
     state_to_save = _prepare_state_for_json(state_copy)
     state_to_save["_metadata"] = {"saved_at": datetime.now().isoformat(), "version": "1.0"}
-    with open(pkg / DESIGN_JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(state_to_save, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(pkg / DESIGN_JSON_FILE, state_to_save, default=str)
     book_config = {
         "title": state.get("title", ""),
         "description": state.get("description", ""),
         "seo_keywords": state.get("seo_keywords", [])
     }
-    with open(pkg / BOOK_CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(book_config, f, indent=2, ensure_ascii=False)
+    _write_json(pkg / BOOK_CONFIG_FILE, book_config)
 
 
 def list_design_packages() -> List[Dict]:
@@ -4,6 +4,7 @@ from features.design_generation.workflow import (
     run_coloring_book_agent,
     run_design_for_concept,
     run_design_step_for_concept,
+    run_design_pipeline_for_concept,
     rerun_design_with_modifications,
     create_coloring_book_graph,
     DESIGN_STEPS,
@@ -13,6 +14,7 @@ __all__ = [
     "run_coloring_book_agent",
     "run_design_for_concept",
     "run_design_step_for_concept",
+    "run_design_pipeline_for_concept",
     "rerun_design_with_modifications",
     "create_coloring_book_graph",
     "DESIGN_STEPS",
@@ -3,14 +3,42 @@
 import os
 import json
 import re
+import asyncio
+import copy
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from io import StringIO
 from typing import Dict, List, Any
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import JsonOutputParser
 from dotenv import load_dotenv
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from features.design_generation.concurrency import run_sync
+from features.design_generation.logging_config import logger
+from features.design_generation import llm_cache
+
 load_dotenv()
 
+# One JSON decode function for batch output lines: orjson when available, else a shared stdlib decoder
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.JSONDecoder().decode
+
 # Expanded list of banned AI-sounding words
 BANNED_AI_WORDS = [
     # Overused enchantment words
@@ -98,30 +126,157 @@ REQUIRED_SECTION = """Why You Will Love this Book:
 - Large print 8.5" x 8.5" white pages with high-quality matte cover
 - Great for all skill levels"""
 
+# Joined word lists and the stripped required section, built once for the title/description judge
+_BANNED_WORDS_SAMPLE = ", ".join(BANNED_AI_WORDS[:15]) + "..."
+_BANNED_WORDS_FULL = ", ".join(BANNED_AI_WORDS)
+_REQUIRED_SECTION_STRIPPED = REQUIRED_SECTION.strip()
+
 MAX_ATTEMPTS = 10
 PASS_THRESHOLD = 80
 
+# Score given when pre-checks alone fail a component and the LLM judge is skipped
+PRECHECK_FAIL_SCORE = 40
+KEYWORDS_REQUIRED_COUNT = 10
+# Interior prompts with color words at or above which the LLM judge is skipped
+COLOR_PRECHECK_FAIL_COUNT = 5
+# Descriptions shorter than this (target ~200 words) fail without the LLM judge
+DESC_PRECHECK_MIN_WORDS = 80
+# Interior prompt sets smaller than this fail without the LLM judge
+PROMPTS_PRECHECK_MIN_COUNT = 10
 
+
+@lru_cache(maxsize=1)
 def get_evaluator_llm():
-    """Get the LLM for evaluation with lower temperature for consistency."""
-    from config import DESIGN_EVALUATOR_MODEL, DESIGN_EVALUATOR_MODEL_TEMPERATURE
+    """
+    Get the LLM for evaluation with lower temperature for consistency.
+    JSON mode makes the API guarantee a parseable object, so malformed output
+    no longer costs a refinement retry. Cached so all judges share one client.
+    """
+    from config import DESIGN_EVALUATOR_MODEL, DESIGN_EVALUATOR_MODEL_TEMPERATURE, DESIGN_EVALUATOR_MAX_TOKENS
     return ChatOpenAI(
         model=DESIGN_EVALUATOR_MODEL,
         temperature=DESIGN_EVALUATOR_MODEL_TEMPERATURE,
-        api_key=os.getenv("OPENAI_API_KEY")
+        max_tokens=DESIGN_EVALUATOR_MAX_TOKENS,
+        api_key=os.getenv("OPENAI_API_KEY"),
+        model_kwargs={"response_format": {"type": "json_object"}},
+    )
+
+
+def _compact_json(data: Any) -> str:
+    """Serialize data for a prompt without whitespace (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+# LLM verdicts keyed by a hash of (prompt template, judge model, inputs). Evaluators
+# are pure functions of their inputs, so refinement attempts that resubmit unchanged
+# content are answered from memory instead of a new judge call. With CB_LLM_CACHE
+# on, verdicts are also kept in the on-disk LLM cache and survive restarts.
+EVALUATION_CACHE_SIZE = 512
+_evaluation_cache: "OrderedDict[str, dict]" = OrderedDict()
+_evaluation_cache_lock = threading.Lock()
+
+
+def _evaluation_cache_key(template: str, inputs: dict, namespace: str = "evaluate") -> str:
+    """
+    Cache key of a verdict. Verdicts from the fused multi-part prompt use the
+    "evaluate-fused" namespace so they never answer a standalone judgement.
+    """
+    from config import DESIGN_EVALUATOR_MODEL, DESIGN_EVALUATOR_MODEL_TEMPERATURE
+    return llm_cache.llm_cache_key(
+        namespace, template, DESIGN_EVALUATOR_MODEL, DESIGN_EVALUATOR_MODEL_TEMPERATURE, inputs
     )
 
 
-def parse_json_response(response: str) -> dict:
-    """Parse JSON from LLM response, handling markdown code blocks."""
-    response = response.strip()
-    if response.startswith("```json"):
-        response = response[7:]
-    if response.startswith("```"):
-        response = response[3:]
-    if response.endswith("```"):
-        response = response[:-3]
-    return json.loads(response.strip())
+def _evaluation_memory_put(key: str, evaluation: dict) -> None:
+    with _evaluation_cache_lock:
+        _evaluation_cache[key] = copy.deepcopy(evaluation)
+        _evaluation_cache.move_to_end(key)
+        while len(_evaluation_cache) > EVALUATION_CACHE_SIZE:
+            _evaluation_cache.popitem(last=False)
+
+
+def _evaluation_cache_get(key: str):
+    with _evaluation_cache_lock:
+        cached = _evaluation_cache.get(key)
+        if cached is not None:
+            _evaluation_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+    from config import LLM_CACHE_ENABLED
+    if not LLM_CACHE_ENABLED:
+        return None
+    cached = llm_cache.cache_get(key)
+    if cached is not None:
+        _evaluation_memory_put(key, cached)
+    return cached
+
+
+def _evaluation_cache_put(key: str, evaluation: dict) -> None:
+    _evaluation_memory_put(key, evaluation)
+    from config import LLM_CACHE_ENABLED
+    if LLM_CACHE_ENABLED:
+        llm_cache.cache_set(key, evaluation)
+
+
+def clear_evaluation_cache() -> None:
+    """Drop all cached evaluator responses."""
+    with _evaluation_cache_lock:
+        _evaluation_cache.clear()
+
+
+@lru_cache(maxsize=None)
+def _evaluator_prompt(template: str) -> ChatPromptTemplate:
+    """Compiled prompt template, built once per evaluator prompt."""
+    return ChatPromptTemplate.from_template(template)
+
+
+@lru_cache(maxsize=None)
+def _evaluator_chain(template: str):
+    """Prompt | LLM | JSON parser chain, built once and shared across calls."""
+    return _evaluator_prompt(template) | get_evaluator_llm() | JsonOutputParser()
+
+
+def _run_evaluation(job: tuple | dict) -> dict:
+    """
+    Invoke an evaluator job built by one of the ``_*_job`` helpers.
+    A job that is already a dict is a verdict decided by the pre-checks.
+    """
+    if isinstance(job, dict):
+        return job
+    template, inputs, finalize, on_error = job
+    key = _evaluation_cache_key(template, inputs)
+    cached = _evaluation_cache_get(key)
+    if cached is not None:
+        return finalize(cached)
+    chain = _evaluator_chain(template)
+    try:
+        evaluation = chain.invoke(inputs)
+        _evaluation_cache_put(key, evaluation)
+        return finalize(evaluation)
+    except Exception as e:
+        return on_error(e)
+
+
+async def _arun_evaluation(job: tuple | dict) -> dict:
+    """Async counterpart of :func:`_run_evaluation` using ``chain.ainvoke``."""
+    if isinstance(job, dict):
+        return job
+    template, inputs, finalize, on_error = job
+    key = _evaluation_cache_key(template, inputs)
+    cached = _evaluation_cache_get(key)
+    if cached is not None:
+        return finalize(cached)
+    chain = _evaluator_chain(template)
+    try:
+        evaluation = await chain.ainvoke(inputs)
+        _evaluation_cache_put(key, evaluation)
+        return finalize(evaluation)
+    except Exception as e:
+        return on_error(e)
 
 
 # =============================================================================
@@ -213,57 +368,66 @@ TITLE_DESC_EVALUATOR_PROMPT = """You are a strict quality evaluator for coloring
 Return ONLY valid JSON, no other text."""
 
 
-def evaluate_title_description(title: str, description: str) -> dict:
+def _title_description_job(title: str, description: str) -> tuple | dict:
     """
-    Evaluate title and description with detailed criteria including creativity 
-    and human-quality assessment.
-    
-    Returns:
-        dict with: passed, score, creativity_scores, title_issues, description_issues, 
-                  strengths, human_quality, summary, metrics
+    Run the title/description pre-checks and build the LLM job for them.
+    Returns the verdict directly when the content is missing or far too short.
     """
-    llm = get_evaluator_llm()
-    
     # Pre-calculate metrics
     title_length = len(title)
     desc_word_count = len(description.split())
     
+    # Missing title or a stub description already guarantees a fail; skip the LLM judge
+    if not title.strip() or desc_word_count < DESC_PRECHECK_MIN_WORDS:
+        title_issues = []
+        description_issues = []
+        if not title.strip():
+            title_issues.append({"issue": "Title is empty", "severity": "critical", "suggestion": "Write a title of up to 60 characters"})
+        if desc_word_count < DESC_PRECHECK_MIN_WORDS:
+            description_issues.append({"issue": f"Description has only {desc_word_count} words (target 180-220)", "severity": "critical", "suggestion": "Write the full description, ending with the required section"})
+        return {
+            "passed": False,
+            "score": PRECHECK_FAIL_SCORE if title.strip() and desc_word_count else 0,
+            "creativity_scores": {},
+            "title_issues": title_issues,
+            "description_issues": description_issues,
+            "strengths": [],
+            "human_quality": {"sentence_variety": {}, "authenticity": {}, "cliches_found": []},
+            "summary": "Skipped LLM judge: title or description missing",
+            "metrics": {"title_length": title_length, "desc_word_count": desc_word_count},
+        }
+    
     # Check for banned words
     found_banned = []
-    desc_lower = description.lower()
-    title_lower = title.lower()
+    desc_ctx = make_text_ctx(description)
+    title_ctx = make_text_ctx(title)
     for word in BANNED_AI_WORDS:
-        if word.lower() in desc_lower or word.lower() in title_lower:
+        if word.lower() in desc_ctx.lower or word.lower() in title_ctx.lower:
             found_banned.append(word)
     
     # Check for clichés
-    found_cliches = check_cliches(description) + check_cliches(title)
+    found_cliches = check_cliches(desc_ctx) + check_cliches(title_ctx)
     
     # Check sentence variety
-    sentence_variety = check_sentence_variety(description)
+    sentence_variety = check_sentence_variety(desc_ctx)
     
     # Check authenticity
-    authenticity = check_authenticity(description)
+    authenticity = check_authenticity(desc_ctx)
     
     # Check for required section
-    has_required_section = REQUIRED_SECTION.strip() in description
+    has_required_section = _REQUIRED_SECTION_STRIPPED in description
     
-    prompt = ChatPromptTemplate.from_template(TITLE_DESC_EVALUATOR_PROMPT)
-    chain = prompt | llm | StrOutputParser()
+    inputs = {
+        "title": title,
+        "title_length": title_length,
+        "desc_word_count": desc_word_count,
+        "banned_words_sample": _BANNED_WORDS_SAMPLE,
+        "banned_words_full": _BANNED_WORDS_FULL,
+        "required_section": REQUIRED_SECTION,
+        "description": description
+    }
     
-    try:
-        result = chain.invoke({
-            "title": title,
-            "title_length": title_length,
-            "desc_word_count": desc_word_count,
-            "banned_words_sample": ", ".join(BANNED_AI_WORDS[:15]) + "...",
-            "banned_words_full": ", ".join(BANNED_AI_WORDS),
-            "required_section": REQUIRED_SECTION,
-            "description": description
-        })
-        
-        evaluation = parse_json_response(result)
-        
+    def finalize(evaluation: dict) -> dict:
         # Add human quality assessment
         evaluation["human_quality"] = {
             "sentence_variety": sentence_variety,
@@ -297,8 +461,8 @@ def evaluate_title_description(title: str, description: str) -> dict:
         }
         
         return evaluation
-        
-    except Exception as e:
+    
+    def on_error(e: Exception) -> dict:
         return {
             "passed": False,
             "score": 0,
@@ -310,6 +474,25 @@ def evaluate_title_description(title: str, description: str) -> dict:
             "summary": f"Evaluation failed: {e}",
             "metrics": {"title_length": title_length, "desc_word_count": desc_word_count}
         }
+    
+    return TITLE_DESC_EVALUATOR_PROMPT, inputs, finalize, on_error
+
+
+def evaluate_title_description(title: str, description: str) -> dict:
+    """
+    Evaluate title and description with detailed criteria including creativity 
+    and human-quality assessment.
+    
+    Returns:
+        dict with: passed, score, creativity_scores, title_issues, description_issues, 
+                  strengths, human_quality, summary, metrics
+    """
+    return _run_evaluation(_title_description_job(title, description))
+
+
+async def aevaluate_title_description(title: str, description: str) -> dict:
+    """Async variant of :func:`evaluate_title_description`."""
+    return await _arun_evaluation(_title_description_job(title, description))
 
 
 # =============================================================================
@@ -412,18 +595,48 @@ The main theme for this book is: **{main_theme}**
 - Score "main_theme_consistency_score" 0–25; below 15 is a serious failure.
 """
 
-def evaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
+# All banned color words as one pattern, compiled once; findall reports every hit in one scan
+_ANY_COLOR_WORD_RE = re.compile(
+    r'\b(?:' + "|".join(re.escape(word) for word in BANNED_COLOR_WORDS) + r')\b'
+)
+
+
+def prompt_breaks_bw_rules(prompt: str) -> bool:
     """
-    Evaluate MidJourney prompts with detailed criteria.
-    When theme_context is provided with a main_theme, evaluates that every prompt
-    stays on the main theme (primary subject); count is soft (target ~50, not a critical fail).
+    Quick rule check for one interior prompt: missing 'black and white' or a color
+    word in the keywords (MidJourney parameters such as '--no color' are ignored).
+    """
+    p_lower = prompt.lower()
+    keywords = p_lower.split("--", 1)[0]
+    return "black and white" not in keywords or bool(_ANY_COLOR_WORD_RE.search(keywords))
 
-    Returns:
-        dict with: passed, score, issues, diversity_assessment, main_theme_consistency_score,
-                   prompts_off_theme, summary
+
+
+def prompts_abort_verdict(prompts: list, violations: list) -> dict:
+    """
+    Verdict for a prompt set whose generation was stopped early because the first
+    prompts broke the black-and-white rules. Never passes and scores 0 (the set is
+    truncated, so it must not become the final content); the issues quote the
+    offending prompts so the next attempt can avoid them. No LLM call is made.
     """
-    llm = get_evaluator_llm()
+    quoted = "; ".join(f'"{str(p)[:120]}"' for p in violations[:5])
+    if len(violations) > 5:
+        quoted += f" (+{len(violations) - 5} more)"
+    return {
+        "passed": False,
+        "score": 0,
+        "truncated": True,
+        "issues": [{"issue": f"Generation stopped early: {len(violations)} of the first prompts break the black and white rules: {quoted}", "severity": "critical", "suggestion": "Include 'black and white' in every prompt and remove ALL color-related words"}],
+        "diversity_assessment": {"subjects_variety": "unknown", "styles_variety": "unknown", "themes_variety": "unknown"},
+        "summary": "Skipped LLM judge: generation stopped on black and white rule violations",
+        "metrics": {"prompt_count": len(prompts), "main_theme": None, "pre_check_issues": []},
+    }
 
+def _prompts_job(prompts: list, theme_context: dict = None) -> tuple | dict:
+    """
+    Run the interior prompt pre-checks and build the LLM job for them.
+    Returns the verdict directly when the pre-checks already fail the set.
+    """
     # Derive main theme for evaluation when theme_context is provided
     main_theme = ""
     if theme_context:
@@ -441,21 +654,66 @@ def evaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
 
     # Pre-check: validate format of each prompt
     format_issues = []
+    color_hits = []  # (prompt number, color words found)
     for i, p in enumerate(prompts):
+        p_lower = p.lower()
         if not p.endswith("--ar 1:1"):
             format_issues.append(f"Prompt {i+1} missing MidJourney parameters")
-        if "coloring book page" not in p.lower():
+        if "coloring book page" not in p_lower:
             format_issues.append(f"Prompt {i+1} missing 'coloring book page'")
-        if "clean and simple line art" not in p.lower():
+        if "clean and simple line art" not in p_lower:
             format_issues.append(f"Prompt {i+1} missing 'clean and simple line art'")
-        if "black and white" not in p.lower():
+        if "black and white" not in p_lower:
             format_issues.append(f"Prompt {i+1} missing 'black and white'")
-        # Check for banned color words (black and white line art only)
-        p_lower = p.lower()
-        for color_word in BANNED_COLOR_WORDS:
-            if re.search(r'\b' + re.escape(color_word) + r'\b', p_lower):
-                format_issues.append(f"Prompt {i+1} contains color word: '{color_word}' (forbidden for B&W)")
-                break
+        # Check for banned color words (black and white line art only); the
+        # MidJourney parameters are skipped since '--no color' is required
+        color_words = _ANY_COLOR_WORD_RE.findall(p_lower.split("--", 1)[0])
+        if color_words:
+            color_hits.append((i + 1, color_words))
+            format_issues.append(f"Prompt {i+1} contains color word: '{color_words[0]}' (forbidden for B&W)")
+
+    # Black and white violations are named in the verdict issues (format_feedback
+    # reads those, not metrics) so the next attempt hears about them
+    bw_issues = []
+    if color_hits:
+        offending = "; ".join(
+            f"Prompt {n}: {', '.join(dict.fromkeys(words))}" for n, words in color_hits[:10]
+        )
+        if len(color_hits) > 10:
+            offending += f" (+{len(color_hits) - 10} more prompts)"
+        bw_issues.append({"issue": f"{len(color_hits)} prompt(s) contain color keywords: {offending}", "severity": "critical", "suggestion": "Remove ALL color-related words from prompts - use only black and white line art descriptors"})
+    missing_bw = [str(i + 1) for i, p in enumerate(prompts) if "black and white" not in p.lower()]
+    if missing_bw:
+        listed = ", ".join(missing_bw[:10]) + (f" (+{len(missing_bw) - 10} more)" if len(missing_bw) > 10 else "")
+        bw_issues.append({"issue": f"{len(missing_bw)} prompt(s) missing 'black and white': prompts {listed}", "severity": "critical", "suggestion": "Include 'black and white' in every prompt"})
+
+    # A short set (e.g. one cut off by the early abort) always scores 0 so it
+    # can never be kept as the best attempt
+    too_few = prompt_count < PROMPTS_PRECHECK_MIN_COUNT
+    short_issue = {"issue": f"Only {prompt_count} prompts were generated", "severity": "critical", "suggestion": "Generate the full set of prompts in the required format"}
+
+    # Widespread color words already guarantee a fail; skip the LLM judge and
+    # hand back the exact offending words as feedback
+    if len(color_hits) >= COLOR_PRECHECK_FAIL_COUNT:
+        return {
+            "passed": False,
+            "score": 0 if too_few else PRECHECK_FAIL_SCORE,
+            "issues": bw_issues + ([short_issue] if too_few else []),
+            "diversity_assessment": {"subjects_variety": "unknown", "styles_variety": "unknown", "themes_variety": "unknown"},
+            "summary": "Skipped LLM judge: color words in black and white prompts",
+            "metrics": {"prompt_count": prompt_count, "main_theme": main_theme or None, "pre_check_issues": format_issues[:10]},
+        }
+
+    # Too few prompts already guarantees a fail; skip the LLM judge
+    if too_few:
+        return {
+            "passed": False,
+            "score": 0,
+            "issues": [short_issue] + bw_issues,
+            "diversity_assessment": {"subjects_variety": "unknown", "styles_variety": "unknown", "themes_variety": "unknown"},
+            "summary": "Skipped LLM judge: too few prompts",
+            "metrics": {"prompt_count": prompt_count, "main_theme": main_theme or None, "pre_check_issues": format_issues[:10]},
+        }
 
     # Prepare sample (show 10 prompts for evaluation)
     if len(prompts) > 10:
@@ -464,17 +722,13 @@ def evaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
     else:
         prompts_sample = "\n".join([f"{i+1}. {p}" for i, p in enumerate(prompts)])
 
-    prompt_template = ChatPromptTemplate.from_template(PROMPTS_EVALUATOR_PROMPT)
-    chain = prompt_template | llm | StrOutputParser()
-
-    try:
-        result = chain.invoke({
-            "main_theme_section": main_theme_section,
-            "prompt_count": prompt_count,
-            "prompts_sample": prompts_sample
-        })
+    inputs = {
+        "main_theme_section": main_theme_section,
+        "prompt_count": prompt_count,
+        "prompts_sample": prompts_sample
+    }
 
-        evaluation = parse_json_response(result)
+    def finalize(evaluation: dict) -> dict:
         # Inject color-word issues from pre-check so they trigger refinement
         color_issues = [f for f in format_issues if "color word" in f]
         if color_issues:
@@ -501,7 +755,7 @@ def evaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
 
         return evaluation
 
-    except Exception as e:
+    def on_error(e: Exception) -> dict:
         return {
             "passed": False,
             "score": 0,
@@ -511,6 +765,28 @@ def evaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
             "metrics": {"prompt_count": prompt_count}
         }
 
+    return PROMPTS_EVALUATOR_PROMPT, inputs, finalize, on_error
+
+
+def evaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
+    """
+    Evaluate MidJourney prompts with detailed criteria.
+    When theme_context is provided with a main_theme, evaluates that every prompt
+    stays on the main theme (primary subject). Sets with fewer than
+    PROMPTS_PRECHECK_MIN_COUNT prompts fail the pre-check with score 0 (never kept
+    as best); widespread color words fail it with PRECHECK_FAIL_SCORE.
+
+    Returns:
+        dict with: passed, score, issues, diversity_assessment, main_theme_consistency_score,
+                   prompts_off_theme, summary
+    """
+    return _run_evaluation(_prompts_job(prompts, theme_context))
+
+
+async def aevaluate_prompts(prompts: list, theme_context: dict = None) -> dict:
+    """Async variant of :func:`evaluate_prompts`."""
+    return await _arun_evaluation(_prompts_job(prompts, theme_context))
+
 
 # =============================================================================
 # COVER PROMPTS EVALUATOR
@@ -563,16 +839,21 @@ COVER_PROMPTS_EVALUATOR_PROMPT = """You are a strict quality evaluator for MidJo
 Return ONLY valid JSON, no other text."""
 
 
-def evaluate_cover_prompts(prompts: list, theme_context: dict = None) -> dict:
-    """
-    Evaluate MidJourney cover background prompts (full color, no text).
-    Criteria: book cover background, no inside-page wording, theme consistency, --ar 2:1.
+# Cover pre-check signals, collected in one case-insensitive scan per prompt
+COVER_CHECKS_RE = re.compile(
+    r"(?P<forbidden>coloring book page|clean and simple line art|black and white|--no color)"
+    r"|(?P<cover>book cover|cover art|cover design|cover background)"
+    r"|(?P<no_text>no text|no letters|no words|no typography)"
+    r"|(?P<ar>--ar\s*2:1)",
+    re.I,
+)
 
-    Returns:
-        dict with: passed, score, issues, summary
-    """
-    llm = get_evaluator_llm()
 
+def _cover_prompts_job(prompts: list, theme_context: dict = None) -> tuple | dict:
+    """
+    Run the cover prompt pre-checks and build the LLM job for them.
+    Returns the verdict directly when the pre-checks already fail the set.
+    """
     main_theme = ""
     if theme_context:
         main_theme = theme_context.get("main_theme") or ""
@@ -588,28 +869,36 @@ def evaluate_cover_prompts(prompts: list, theme_context: dict = None) -> dict:
     # Pre-check: forbidden inside-page phrasing; required --ar 2:1; prefer "no text"
     format_issues = []
     for i, p in enumerate(prompts):
-        p_lower = p.lower()
-        if "--ar 2:1" not in p_lower and "--ar 2:1" not in p.replace(" ", ""):
+        found = {m.lastgroup for m in COVER_CHECKS_RE.finditer(p)}
+        if "ar" not in found:
             format_issues.append(f"Prompt {i+1} should end with --ar 2:1 for book cover")
-        if "coloring book page" in p_lower or "clean and simple line art" in p_lower or "black and white" in p_lower or "--no color" in p_lower:
+        if "forbidden" in found:
             format_issues.append(f"Prompt {i+1} contains inside-page wording (cover must be full color, no B&W)")
-        if "book cover" not in p_lower and "cover art" not in p_lower and "cover design" not in p_lower and "cover background" not in p_lower:
+        if "cover" not in found:
             format_issues.append(f"Prompt {i+1} should mention book cover/cover art/cover design")
-        if "no text" not in p_lower and "no letters" not in p_lower and "no words" not in p_lower and "no typography" not in p_lower:
+        if "no_text" not in found:
             format_issues.append(f"Prompt {i+1} should include 'no text' or 'no words' so the image is title-free")
 
+    # Pervasive format breakage already guarantees a fail; skip the LLM judge
+    if len(format_issues) >= max(3, prompt_count):
+        return {
+            "passed": False,
+            "score": PRECHECK_FAIL_SCORE,
+            "issues": [{"issue": "; ".join(format_issues[:5]), "severity": "critical", "suggestion": "Fix format before semantic review"}],
+            "cover_specific_score": 0,
+            "summary": "Skipped LLM judge: format broken",
+            "metrics": {"prompt_count": prompt_count, "pre_check_issues": format_issues[:10]},
+        }
+
     prompts_sample = "\n".join([f"{i+1}. {p}" for i, p in enumerate(prompts)])
 
-    prompt_template = ChatPromptTemplate.from_template(COVER_PROMPTS_EVALUATOR_PROMPT)
-    chain = prompt_template | llm | StrOutputParser()
+    inputs = {
+        "theme_section": theme_section,
+        "prompt_count": prompt_count,
+        "prompts_sample": prompts_sample,
+    }
 
-    try:
-        result = chain.invoke({
-            "theme_section": theme_section,
-            "prompt_count": prompt_count,
-            "prompts_sample": prompts_sample,
-        })
-        evaluation = parse_json_response(result)
+    def finalize(evaluation: dict) -> dict:
         if format_issues:
             existing = evaluation.get("issues", [])
             evaluation["issues"] = existing + [
@@ -619,7 +908,8 @@ def evaluate_cover_prompts(prompts: list, theme_context: dict = None) -> dict:
             evaluation["score"] = min(evaluation.get("score", 100), 75)
         evaluation["metrics"] = {"prompt_count": prompt_count, "pre_check_issues": format_issues[:10]}
         return evaluation
-    except Exception as e:
+
+    def on_error(e: Exception) -> dict:
         return {
             "passed": False,
             "score": 0,
@@ -628,6 +918,24 @@ def evaluate_cover_prompts(prompts: list, theme_context: dict = None) -> dict:
             "metrics": {"prompt_count": prompt_count},
         }
 
+    return COVER_PROMPTS_EVALUATOR_PROMPT, inputs, finalize, on_error
+
+
+def evaluate_cover_prompts(prompts: list, theme_context: dict = None) -> dict:
+    """
+    Evaluate MidJourney cover background prompts (full color, no text).
+    Criteria: book cover background, no inside-page wording, theme consistency, --ar 2:1.
+
+    Returns:
+        dict with: passed, score, issues, summary
+    """
+    return _run_evaluation(_cover_prompts_job(prompts, theme_context))
+
+
+async def aevaluate_cover_prompts(prompts: list, theme_context: dict = None) -> dict:
+    """Async variant of :func:`evaluate_cover_prompts`."""
+    return await _arun_evaluation(_cover_prompts_job(prompts, theme_context))
+
 
 # =============================================================================
 # SEO KEYWORDS EVALUATOR
@@ -704,15 +1012,46 @@ KEYWORDS_EVALUATOR_PROMPT = """You are an SEO strategist evaluating coloring boo
 Return ONLY valid JSON, no other text."""
 
 
-def evaluate_keywords(keywords: list, theme_hint: str = "") -> dict:
+# Filler words ignored when comparing keywords ("coloring for adults" ~ "adult coloring")
+_KEYWORD_STOPWORDS = frozenset({"a", "an", "and", "for", "of", "the", "to", "with"})
+NEAR_DUPLICATE_JACCARD = 0.66
+
+
+def _keyword_tokens(keyword: str) -> frozenset:
+    """Lowercased token set with stopwords dropped and a plural 's' trimmed."""
+    tokens = set()
+    for token in keyword.lower().split():
+        if token in _KEYWORD_STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return frozenset(tokens)
+
+
+def find_near_duplicate_keywords(keywords: list) -> list:
     """
-    Evaluate SEO keywords with detailed criteria.
-    
-    Returns:
-        dict with: passed, score, issues, keyword_analysis, summary
+    Pairs of keywords whose token sets overlap by at least NEAR_DUPLICATE_JACCARD.
+    Exact duplicates are reported separately by the keyword pre-check.
+    """
+    token_sets = [_keyword_tokens(kw) for kw in keywords]
+    pairs = []
+    for i in range(len(token_sets)):
+        for j in range(i + 1, len(token_sets)):
+            a, b = token_sets[i], token_sets[j]
+            union = a | b
+            if a == b and keywords[i].lower().strip() == keywords[j].lower().strip():
+                continue
+            if union and len(a & b) / len(union) >= NEAR_DUPLICATE_JACCARD:
+                pairs.append((keywords[i], keywords[j]))
+    return pairs
+
+
+def _keywords_job(keywords: list, theme_hint: str = "") -> tuple | dict:
+    """
+    Run the keyword pre-checks and build the LLM job for them.
+    Returns the verdict directly when the pre-checks already fail the list.
     """
-    llm = get_evaluator_llm()
-    
     keyword_count = len(keywords)
     
     # Pre-check for duplicates
@@ -724,31 +1063,60 @@ def evaluate_keywords(keywords: list, theme_hint: str = "") -> dict:
             duplicates.append(kw)
         seen.add(kw_lower)
     
-    # Categorize by length
-    short_tail = [kw for kw in keywords if len(kw.split()) <= 2]
-    long_tail = [kw for kw in keywords if len(kw.split()) > 2]
+    # Categorize by length in one pass
+    short_tail, long_tail = [], []
+    for kw in keywords:
+        (short_tail if len(kw.split()) <= 2 else long_tail).append(kw)
     
-    prompt = ChatPromptTemplate.from_template(KEYWORDS_EVALUATOR_PROMPT)
-    chain = prompt | llm | StrOutputParser()
+    # Wrong count or heavy duplication already guarantees a fail; skip the LLM judge
+    if keyword_count != KEYWORDS_REQUIRED_COUNT or len(duplicates) > 3:
+        problems = []
+        if keyword_count != KEYWORDS_REQUIRED_COUNT:
+            problems.append(f"Expected exactly {KEYWORDS_REQUIRED_COUNT} keywords, got {keyword_count}")
+        if len(duplicates) > 3:
+            problems.append(f"{len(duplicates)} duplicate keywords: {', '.join(duplicates[:5])}")
+        return {
+            "passed": False,
+            "score": PRECHECK_FAIL_SCORE,
+            "issues": [{"issue": "; ".join(problems), "severity": "critical", "suggestion": "Fix count and duplicates before semantic review"}],
+            "keyword_analysis": {"short_tail_count": len(short_tail), "long_tail_count": len(long_tail)},
+            "summary": "Skipped LLM judge: keyword list broken",
+            "metrics": {
+                "keyword_count": keyword_count,
+                "short_tail_count": len(short_tail),
+                "long_tail_count": len(long_tail),
+                "duplicates": duplicates
+            }
+        }
     
-    try:
-        result = chain.invoke({
-            "keyword_count": keyword_count,
-            "keywords": ", ".join(keywords),
-            "theme_hint": theme_hint or "coloring book"
-        })
-        
-        evaluation = parse_json_response(result)
+    inputs = {
+        "keyword_count": keyword_count,
+        "keywords": ", ".join(keywords),
+        "theme_hint": theme_hint or "coloring book"
+    }
+    
+    near_duplicates = find_near_duplicate_keywords(keywords)
+    
+    def finalize(evaluation: dict) -> dict:
+        if near_duplicates:
+            pairs = "; ".join(f"'{a}' / '{b}'" for a, b in near_duplicates[:5])
+            evaluation["issues"] = evaluation.get("issues", []) + [
+                {"issue": f"Near-duplicate keywords: {pairs}", "severity": "minor", "suggestion": "Replace one keyword of each pair with a distinct search angle"}
+            ]
+            evaluation["score"] = max(0, evaluation.get("score", 0) - min(6, 2 * len(near_duplicates)))
+            if evaluation["score"] < PASS_THRESHOLD:
+                evaluation["passed"] = False
         evaluation["metrics"] = {
             "keyword_count": keyword_count,
             "short_tail_count": len(short_tail),
             "long_tail_count": len(long_tail),
-            "duplicates": duplicates
+            "duplicates": duplicates,
+            "near_duplicates": near_duplicates
         }
         
         return evaluation
-        
-    except Exception as e:
+    
+    def on_error(e: Exception) -> dict:
         return {
             "passed": False,
             "score": 0,
@@ -757,6 +1125,23 @@ def evaluate_keywords(keywords: list, theme_hint: str = "") -> dict:
             "summary": f"Evaluation failed: {e}",
             "metrics": {"keyword_count": keyword_count}
         }
+    
+    return KEYWORDS_EVALUATOR_PROMPT, inputs, finalize, on_error
+
+
+def evaluate_keywords(keywords: list, theme_hint: str = "") -> dict:
+    """
+    Evaluate SEO keywords with detailed criteria.
+    
+    Returns:
+        dict with: passed, score, issues, keyword_analysis, summary
+    """
+    return _run_evaluation(_keywords_job(keywords, theme_hint))
+
+
+async def aevaluate_keywords(keywords: list, theme_hint: str = "") -> dict:
+    """Async variant of :func:`evaluate_keywords`."""
+    return await _arun_evaluation(_keywords_job(keywords, theme_hint))
 
 
 # =============================================================================
@@ -826,35 +1211,18 @@ THEME_CREATIVITY_EVALUATOR_PROMPT = """You are an expert creative director evalu
 Return ONLY valid JSON, no other text."""
 
 
-def evaluate_theme_creativity(theme_data: dict) -> dict:
-    """
-    Evaluate an expanded theme for creativity, uniqueness, and market fit.
-    
-    Args:
-        theme_data: Dictionary with theme, artistic_style, unique_angle, 
-                   target_audience, market_research, etc.
+def _theme_creativity_job(theme_data: dict) -> tuple:
+    """Build the LLM job for the theme creativity evaluator."""
+    # Format theme data for evaluation (compact: indentation only costs prompt tokens)
+    theme_str = _compact_json(theme_data)
     
-    Returns:
-        dict with: passed, score, creativity_breakdown, issues, strengths, summary
-    """
-    llm = get_evaluator_llm()
-    
-    # Format theme data for evaluation
-    theme_str = json.dumps(theme_data, indent=2)
-    
-    prompt = ChatPromptTemplate.from_template(THEME_CREATIVITY_EVALUATOR_PROMPT)
-    chain = prompt | llm | StrOutputParser()
-    
-    try:
-        result = chain.invoke({"theme_data": theme_str})
-        evaluation = parse_json_response(result)
-        
+    def finalize(evaluation: dict) -> dict:
         # Add the original theme data to the evaluation
         evaluation["evaluated_theme"] = theme_data
         
         return evaluation
-        
-    except Exception as e:
+    
+    def on_error(e: Exception) -> dict:
         return {
             "passed": False,
             "score": 0,
@@ -870,46 +1238,345 @@ def evaluate_theme_creativity(theme_data: dict) -> dict:
             "summary": f"Evaluation failed: {e}",
             "evaluated_theme": theme_data
         }
+    
+    return THEME_CREATIVITY_EVALUATOR_PROMPT, {"theme_data": theme_str}, finalize, on_error
+
+
+def evaluate_theme_creativity(theme_data: dict) -> dict:
+    """
+    Evaluate an expanded theme for creativity, uniqueness, and market fit.
+    
+    Args:
+        theme_data: Dictionary with theme, artistic_style, unique_angle, 
+                   target_audience, market_research, etc.
+    
+    Returns:
+        dict with: passed, score, creativity_breakdown, issues, strengths, summary
+    """
+    return _run_evaluation(_theme_creativity_job(theme_data))
+
+
+async def aevaluate_theme_creativity(theme_data: dict) -> dict:
+    """Async variant of :func:`evaluate_theme_creativity`."""
+    return await _arun_evaluation(_theme_creativity_job(theme_data))
+
+
+# =============================================================================
+# BATCH EVALUATION
+# =============================================================================
+
+# Component name -> async evaluator, used by evaluate_batch_async
+ASYNC_EVALUATORS = {
+    "theme": aevaluate_theme_creativity,
+    "title_description": aevaluate_title_description,
+    "prompts": aevaluate_prompts,
+    "cover_prompts": aevaluate_cover_prompts,
+    "keywords": aevaluate_keywords,
+}
+
+
+async def evaluate_batch_async(components: dict) -> dict:
+    """
+    Evaluate several independent components concurrently.
+    
+    Args:
+        components: Mapping of component name (a key of ASYNC_EVALUATORS) to the
+                    keyword arguments for its evaluator, e.g.
+                    {"prompts": {"prompts": [...], "theme_context": {...}},
+                     "keywords": {"keywords": [...], "theme_hint": "..."}}
+    
+    Returns:
+        dict mapping each component name to its evaluation dict
+    """
+    names = list(components)
+    results = await asyncio.gather(
+        *[ASYNC_EVALUATORS[name](**components[name]) for name in names]
+    )
+    return dict(zip(names, results))
+
+
+def evaluate_batch(components: dict) -> dict:
+    """Synchronous wrapper around :func:`evaluate_batch_async`."""
+    return run_sync(evaluate_batch_async(components))
+
+
+# =============================================================================
+# BULK EVALUATION (OpenAI Batch API - for offline, queue-tolerant re-scoring)
+# =============================================================================
+
+# Component name -> job builder, used by evaluate_bulk
+EVALUATOR_JOBS = {
+    "theme": _theme_creativity_job,
+    "title_description": _title_description_job,
+    "prompts": _prompts_job,
+    "cover_prompts": _cover_prompts_job,
+    "keywords": _keywords_job,
+}
+
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _batch_request_line(custom_id: str, template: str, inputs: dict) -> dict:
+    """Build one Batch API request line for an evaluator job."""
+    from config import DESIGN_EVALUATOR_MODEL, DESIGN_EVALUATOR_MODEL_TEMPERATURE, DESIGN_EVALUATOR_MAX_TOKENS
+    content = _evaluator_prompt(template).format_messages(**inputs)[0].content
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": DESIGN_EVALUATOR_MODEL,
+            "temperature": DESIGN_EVALUATOR_MODEL_TEMPERATURE,
+            "max_tokens": DESIGN_EVALUATOR_MAX_TOKENS,
+            "response_format": {"type": "json_object"},
+            "messages": [{"role": "user", "content": content}],
+        },
+    }
+
+
+def evaluate_bulk(jobs: list[dict], poll_interval: float = 30.0, timeout: float = 24 * 3600) -> list[dict]:
+    """
+    Evaluate many components through the OpenAI Batch API.
+    
+    Batch requests run at roughly half the price and outside the per-minute
+    rate limit, but complete within the 24h window rather than interactively.
+    Use this for background work such as re-scoring historical themes.
+    Cached verdicts are reused and never re-sent.
+    
+    Args:
+        jobs: List of {"component": <key of EVALUATOR_JOBS>, "args": {...evaluator kwargs}}
+        poll_interval: Seconds between batch status checks.
+        timeout: Cancel the batch and stop waiting after this many seconds.
+    
+    Returns:
+        List of evaluation dicts in the same order as jobs. Jobs whose request
+        failed get the evaluator's usual failure dict.
+    """
+    from openai import OpenAI
+    
+    if not jobs:
+        return []
+    
+    built = [EVALUATOR_JOBS[job["component"]](**job.get("args", {})) for job in jobs]
+    results = list(built)
+    # Jobs already decided by their pre-checks or cached verdicts never reach the batch
+    pending = []
+    for i, job in enumerate(built):
+        if isinstance(job, dict):
+            continue
+        template, inputs, finalize, _ = job
+        cached = _evaluation_cache_get(_evaluation_cache_key(template, inputs))
+        if cached is not None:
+            results[i] = finalize(cached)
+        else:
+            pending.append((i, job))
+    if not pending:
+        return results
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", encoding="utf-8", delete=False) as f:
+        for i, (template, inputs, _, _) in pending:
+            f.write(json.dumps(_batch_request_line(f"job-{i}", template, inputs)) + "\n")
+        batch_input_path = f.name
+    try:
+        with open(batch_input_path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+    finally:
+        os.remove(batch_input_path)
+    
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    deadline = time.monotonic() + timeout
+    while batch.status not in BATCH_FINAL_STATUSES:
+        if time.monotonic() > deadline:
+            logger.warning("Evaluation batch %s timed out after %ss (status: %s), cancelling", batch.id, timeout, batch.status)
+            try:
+                batch = client.batches.cancel(batch.id)
+            except Exception as e:
+                logger.warning("Could not cancel evaluation batch %s: %s", batch.id, e)
+            break
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    
+    contents = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if choices:
+                contents[record["custom_id"]] = choices[0]["message"]["content"]
+    
+    for i, (template, inputs, finalize, on_error) in pending:
+        content = contents.get(f"job-{i}")
+        if content is None:
+            results[i] = on_error(RuntimeError(f"Batch {batch.id} returned no result (status: {batch.status})"))
+            continue
+        try:
+            evaluation = _json_loads(content)
+            _evaluation_cache_put(_evaluation_cache_key(template, inputs), evaluation)
+            results[i] = finalize(evaluation)
+        except Exception as e:
+            results[i] = on_error(e)
+    return results
+
+
+# =============================================================================
+# FUSED EVALUATION (one judge call for several components)
+# =============================================================================
+
+FUSED_EVALUATION_HEADER = """You are judging several parts of ONE coloring book design package.
+Each part below has its own evaluation instructions and response format.
+Judge every part independently and strictly by its own instructions.
+
+Return ONE JSON object whose keys are the part names ({names}) and whose
+values are the JSON objects each part's instructions ask for."""
+
+# Cache namespace of fused verdicts, kept apart from single-part verdicts
+FUSED_EVALUATION_NAMESPACE = "evaluate-fused"
+
+
+async def aevaluate_bundle(components: dict) -> dict:
+    """
+    Judge several components with a single LLM call.
+
+    Takes the same components mapping as :func:`evaluate_batch_async`. Pre-check
+    verdicts and cached verdicts never reach the judge. The remaining
+    instructions are sent together, sharing one round-trip; any part missing
+    from the response, or all of them when the call fails, falls back to its
+    own evaluator call. Fused verdicts are cached in their own namespace, so
+    standalone evaluators never reuse them.
+
+    Returns:
+        dict mapping each component name to its evaluation dict
+    """
+    results = {}
+    pending = {}
+    for name, args in components.items():
+        job = EVALUATOR_JOBS[name](**args)
+        if isinstance(job, dict):
+            results[name] = job
+            continue
+        template, inputs, finalize, _ = job
+        # A standalone verdict also answers a fused request; the reverse never happens
+        cached = _evaluation_cache_get(_evaluation_cache_key(template, inputs))
+        if cached is None:
+            cached = _evaluation_cache_get(_evaluation_cache_key(template, inputs, FUSED_EVALUATION_NAMESPACE))
+        if cached is not None:
+            results[name] = finalize(cached)
+        else:
+            pending[name] = job
+
+    if len(pending) > 1:
+        from config import DESIGN_EVALUATOR_MAX_TOKENS
+        sections = [FUSED_EVALUATION_HEADER.format(names=", ".join(pending))]
+        for name, (template, inputs, _, _) in pending.items():
+            content = _evaluator_prompt(template).format_messages(**inputs)[0].content
+            sections.append(f"=== PART: {name} ===\n{content}")
+        llm = get_evaluator_llm().bind(max_tokens=DESIGN_EVALUATOR_MAX_TOKENS * len(pending))
+        try:
+            response = await llm.ainvoke("\n\n".join(sections))
+            verdicts = _json_loads(response.content)
+        except Exception:
+            verdicts = {}
+        for name in list(pending):
+            verdict = verdicts.get(name) if isinstance(verdicts, dict) else None
+            if isinstance(verdict, dict) and "score" in verdict:
+                template, inputs, finalize, _ = pending.pop(name)
+                _evaluation_cache_put(_evaluation_cache_key(template, inputs, FUSED_EVALUATION_NAMESPACE), verdict)
+                results[name] = finalize(verdict)
+
+    names = list(pending)
+    fallback = await asyncio.gather(*[_arun_evaluation(pending[name]) for name in names])
+    results.update(zip(names, fallback))
+    return {name: results[name] for name in components}
+
+
+def evaluate_bundle(components: dict) -> dict:
+    """Synchronous wrapper around :func:`aevaluate_bundle`."""
+    return run_sync(aevaluate_bundle(components))
 
 
 # =============================================================================
 # HUMAN-LIKE WRITING ASSESSMENT HELPERS
 # =============================================================================
 
-def check_cliches(text: str) -> list:
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+@dataclass(frozen=True, slots=True)
+class TextCtx:
+    """A text with its lowercase form and sentences, computed once for all checks."""
+    text: str
+    lower: str
+    sentences: tuple
+
+
+def make_text_ctx(text: str) -> TextCtx:
+    """Build a TextCtx for the writing-assessment helpers."""
+    sentences = tuple(s for s in (part.strip() for part in _SENTENCE_SPLIT_RE.split(text)) if s)
+    return TextCtx(text=text, lower=text.lower(), sentences=sentences)
+
+
+def _build_cliche_automaton():
+    """Build an Aho-Corasick automaton over MARKETING_CLICHES (None if unavailable)."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, cliche in enumerate(MARKETING_CLICHES):
+        automaton.add_word(cliche.lower(), index)
+    automaton.make_automaton()
+    return automaton
+
+
+_CLICHE_AUTOMATON = _build_cliche_automaton()
+
+
+def check_cliches(ctx: TextCtx) -> list:
     """Check for marketing clichés in text."""
+    if _CLICHE_AUTOMATON is not None:
+        # Single pass over the text; report in MARKETING_CLICHES order
+        indices = {index for _, index in _CLICHE_AUTOMATON.iter(ctx.lower)}
+        return [MARKETING_CLICHES[index] for index in sorted(indices)]
     found = []
-    text_lower = text.lower()
     for cliche in MARKETING_CLICHES:
-        if cliche.lower() in text_lower:
+        if cliche.lower() in ctx.lower:
             found.append(cliche)
     return found
 
 
-def check_sentence_variety(text: str) -> dict:
+def check_sentence_variety(ctx: TextCtx) -> dict:
     """Analyze sentence variety in a text."""
-    import re
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    # Single pass: bucket lengths and collect starters while splitting words once
+    sentence_count = len(ctx.sentences)
+    total_words = 0
+    short = medium = long = 0
+    starters = set()
+    for sentence in ctx.sentences:
+        words = sentence.split()
+        length = len(words)
+        total_words += length
+        if length < 10:
+            short += 1
+        elif length < 20:
+            medium += 1
+        else:
+            long += 1
+        starters.add(words[0].lower())
     
-    if not sentences:
+    if not sentence_count:
         return {"score": 0, "assessment": "No sentences found"}
     
-    lengths = [len(s.split()) for s in sentences]
-    avg_length = sum(lengths) / len(lengths)
-    
-    # Check for variety
-    short = sum(1 for l in lengths if l < 10)
-    medium = sum(1 for l in lengths if 10 <= l < 20)
-    long = sum(1 for l in lengths if l >= 20)
-    
-    # Check for sentence starters
-    starters = [s.split()[0].lower() if s.split() else "" for s in sentences]
-    unique_starters = len(set(starters))
-    starter_variety = unique_starters / len(starters) if starters else 0
+    avg_length = total_words / sentence_count
+    starter_variety = len(starters) / sentence_count
     
     # Calculate variety score
-    length_variety = min(short, medium, long) / max(1, len(sentences) / 3)
+    length_variety = min(short, medium, long) / max(1, sentence_count / 3)
     overall_variety = (length_variety * 0.5 + starter_variety * 0.5) * 10
     
     return {
@@ -923,34 +1590,33 @@ def check_sentence_variety(text: str) -> dict:
     }
 
 
-def check_authenticity(text: str) -> dict:
+# One group per AI red flag; a flag counts once however often it appears
+_AI_PATTERNS_RE = re.compile(
+    r"(whether you)|(this book offers)|(features include)"
+    r"|(designed to\s+(?:help|provide|offer))|(explore a world)",
+    re.I,
+)
+_FIRST_PERSON_RE = re.compile(r"\bi\b", re.I)
+_CONTRACTIONS_RE = re.compile(r"you'll|you're|we've|isn't", re.I)
+_CASUAL_RE = re.compile(r"grab|snag|pick up", re.I)
+
+
+def check_authenticity(ctx: TextCtx) -> dict:
     """Check if text sounds authentic (human-written)."""
-    ai_indicators = 0
-    human_indicators = 0
-    
-    # Check for AI patterns
-    text_lower = text.lower()
-    
+    text = ctx.text
     # AI red flags
-    if text_lower.count("whether you") > 0:
-        ai_indicators += 1
-    if text_lower.count("this book offers") > 0:
-        ai_indicators += 1
-    if text_lower.count("features include") > 0:
-        ai_indicators += 1
-    if re.search(r'designed to\s+(help|provide|offer)', text_lower):
-        ai_indicators += 1
-    if text_lower.count("explore a world") > 0:
-        ai_indicators += 1
+    matches = _AI_PATTERNS_RE.findall(text)
+    ai_indicators = sum(1 for group in zip(*matches) if any(group))
     
     # Human-sounding indicators
-    if re.search(r'\bi\b', text_lower):  # First person
+    human_indicators = 0
+    if _FIRST_PERSON_RE.search(text):  # First person
         human_indicators += 1
     if "!" in text:  # Enthusiasm
         human_indicators += 1
-    if re.search(r'you\'ll|you\'re|we\'ve|isn\'t', text_lower):  # Contractions
+    if _CONTRACTIONS_RE.search(text):  # Contractions
         human_indicators += 2
-    if re.search(r'grab|snag|pick up', text_lower):  # Casual language
+    if _CASUAL_RE.search(text):  # Casual language
         human_indicators += 1
     
     score = max(0, min(10, 5 + human_indicators * 1.5 - ai_indicators * 2))
@@ -967,6 +1633,10 @@ def check_authenticity(text: str) -> dict:
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Issue severity rank used to prioritize feedback (unknown severities sort last)
+SEVERITY_ORDER = {"critical": 0, "major": 1, "minor": 2}
+
+
 def format_feedback(evaluation: dict, component: str) -> str:
     """
     Format evaluation results as detailed, actionable feedback for the executor.
@@ -981,7 +1651,13 @@ def format_feedback(evaluation: dict, component: str) -> str:
             return f"✅ {component} PASSED (Score: {score}/100)\n\nStrengths to maintain:\n" + "\n".join(f"  + {s}" for s in strengths)
         return f"✅ {component} PASSED with score {score}/100."
     
-    feedback_parts = [f"❌ {component} needs improvement (Score: {score}/100)\n"]
+    buf = StringIO()
+    write = buf.write
+    write(f"❌ {component} needs improvement (Score: {score}/100)\n")
+    
+    def add(line: str) -> None:
+        write("\n")
+        write(line)
     
     # Get issues based on component type
     if component == "Title & Description":
@@ -992,10 +1668,10 @@ def format_feedback(evaluation: dict, component: str) -> str:
         if creativity:
             low_scores = [(k, v) for k, v in creativity.items() if v < 6]
             if low_scores:
-                feedback_parts.append("📊 Creativity Scores that need work:")
+                add("📊 Creativity Scores that need work:")
                 for key, value in low_scores:
-                    feedback_parts.append(f"  • {key.replace('_', ' ').title()}: {value}/10")
-                feedback_parts.append("")
+                    add(f"  • {key.replace('_', ' ').title()}: {value}/10")
+                add("")
                 
     elif component == "Theme":
         issues = evaluation.get("issues", [])
@@ -1007,11 +1683,11 @@ def format_feedback(evaluation: dict, component: str) -> str:
                 low_scores.append((key, data))
         
         if low_scores:
-            feedback_parts.append("📊 Areas needing improvement:")
+            add("📊 Areas needing improvement:")
             for key, data in low_scores:
-                feedback_parts.append(f"  • {key.replace('_', ' ').title()}: {data.get('score', 0)} pts")
-                feedback_parts.append(f"    → {data.get('assessment', 'Needs work')}")
-            feedback_parts.append("")
+                add(f"  • {key.replace('_', ' ').title()}: {data.get('score', 0)} pts")
+                add(f"    → {data.get('assessment', 'Needs work')}")
+            add("")
             
     elif component == "MidJourney Prompts":
         issues = evaluation.get("issues", [])
@@ -1020,29 +1696,29 @@ def format_feedback(evaluation: dict, component: str) -> str:
         mt_score = evaluation.get("main_theme_consistency_score")
         prompts_off = evaluation.get("prompts_off_theme") or []
         if mt_score is not None and (mt_score < 15 or prompts_off):
-            feedback_parts.append("🎯 Main theme consistency (CRITICAL):")
-            feedback_parts.append(f"  • Score: {mt_score}/25 — prompts must center on the main theme.")
+            add("🎯 Main theme consistency (CRITICAL):")
+            add(f"  • Score: {mt_score}/25 — prompts must center on the main theme.")
             if prompts_off:
-                feedback_parts.append(f"  • Prompts off-theme (revise or replace): {prompts_off[:15]}")
+                add(f"  • Prompts off-theme (revise or replace): {prompts_off[:15]}")
                 if len(prompts_off) > 15:
-                    feedback_parts.append(f"    ... and {len(prompts_off) - 15} more.")
-            feedback_parts.append("")
+                    add(f"    ... and {len(prompts_off) - 15} more.")
+            add("")
         
         # Add creativity scores
         creativity = evaluation.get("creativity_scores", {})
         if creativity:
             low_scores = [(k, v) for k, v in creativity.items() if v < 6]
             if low_scores:
-                feedback_parts.append("📊 Creative areas needing work:")
+                add("📊 Creative areas needing work:")
                 for key, value in low_scores:
-                    feedback_parts.append(f"  • {key.replace('_', ' ').title()}: {value}/10")
-                feedback_parts.append("")
+                    add(f"  • {key.replace('_', ' ').title()}: {value}/10")
+                add("")
         
         # Highlight standout prompts if any
         standouts = evaluation.get("standout_prompts", [])
         if standouts:
-            feedback_parts.append(f"✓ Good prompts to use as reference: {', '.join(str(s) for s in standouts[:3])}")
-            feedback_parts.append("")
+            add(f"✓ Good prompts to use as reference: {', '.join(str(s) for s in standouts[:3])}")
+            add("")
             
     elif component == "SEO Keywords":
         issues = evaluation.get("issues", [])
@@ -1052,29 +1728,33 @@ def format_feedback(evaluation: dict, component: str) -> str:
         if niche:
             low_scores = [(k, v) for k, v in niche.items() if v < niche.get(k.replace("_score", "_max"), 10) * 0.6]
             if low_scores:
-                feedback_parts.append("📊 Niche opportunity scores:")
+                add("📊 Niche opportunity scores:")
                 for key, value in niche.items():
-                    feedback_parts.append(f"  • {key.replace('_', ' ').title()}: {value}")
-                feedback_parts.append("")
+                    add(f"  • {key.replace('_', ' ').title()}: {value}")
+                add("")
         
         # Show keyword analysis
         analysis = evaluation.get("keyword_analysis", {})
         if analysis:
             if analysis.get("niche_opportunity"):
-                feedback_parts.append(f"✓ Good niche keywords: {', '.join(analysis['niche_opportunity'][:3])}")
+                add(f"✓ Good niche keywords: {', '.join(analysis['niche_opportunity'][:3])}")
             if analysis.get("high_competition"):
-                feedback_parts.append(f"⚠ High competition (hard to rank): {', '.join(analysis['high_competition'][:3])}")
-            feedback_parts.append("")
+                add(f"⚠ High competition (hard to rank): {', '.join(analysis['high_competition'][:3])}")
+            add("")
     else:
         issues = evaluation.get("issues", [])
     
-    # Sort issues by severity (critical first)
-    severity_order = {"critical": 0, "major": 1, "minor": 2}
-    sorted_issues = sorted(issues, key=lambda x: severity_order.get(x.get("severity", "minor"), 2))
+    # Sort issues by severity (critical first); rank once, index keeps ties in order
+    ranked = [
+        (SEVERITY_ORDER.get(issue.get("severity", "minor"), 2), idx, issue)
+        for idx, issue in enumerate(issues)
+    ]
+    ranked.sort()
+    sorted_issues = [issue for _, _, issue in ranked]
     
     # Add prioritized issues with examples
     if sorted_issues:
-        feedback_parts.append("🔧 Issues to fix (in priority order):\n")
+        add("🔧 Issues to fix (in priority order):\n")
         
         for i, issue in enumerate(sorted_issues[:5], 1):  # Limit to top 5 issues
             severity = issue.get("severity", "unknown").upper()
@@ -1084,28 +1764,28 @@ def format_feedback(evaluation: dict, component: str) -> str:
             # Add severity emoji
             emoji = "🔴" if severity == "CRITICAL" else "🟡" if severity == "MAJOR" else "🟢"
             
-            feedback_parts.append(f"{i}. {emoji} [{severity}] {issue_text}")
-            feedback_parts.append(f"   → How to fix: {suggestion}")
+            add(f"{i}. {emoji} [{severity}] {issue_text}")
+            add(f"   → How to fix: {suggestion}")
             
             # Add affected items if available
             affected = issue.get("affected_prompts") or issue.get("affected_keywords")
             if affected:
-                feedback_parts.append(f"   → Affected: {affected[:5]}")
+                add(f"   → Affected: {affected[:5]}")
             
-            feedback_parts.append("")
+            add("")
     
     # Add positive reinforcement - strengths to maintain
     strengths = evaluation.get("strengths", [])
     if strengths:
-        feedback_parts.append("✅ Strengths to maintain:")
+        add("✅ Strengths to maintain:")
         for strength in strengths[:3]:
-            feedback_parts.append(f"  + {strength}")
+            add(f"  + {strength}")
     
     # Add metrics summary if available
     metrics = evaluation.get("metrics", {})
     if metrics:
-        feedback_parts.append("\n📈 Quick stats:")
+        add("\n📈 Quick stats:")
         for key, value in list(metrics.items())[:4]:
-            feedback_parts.append(f"  • {key.replace('_', ' ').title()}: {value}")
+            add(f"  • {key.replace('_', ' ').title()}: {value}")
     
-    return "\n".join(feedback_parts)
+    return buf.getvalue()
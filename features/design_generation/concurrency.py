@@ -0,0 +1,22 @@
+"""Helpers for running async design-generation work from synchronous callers."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run when no event loop is running in this thread (Streamlit
+    script thread, CLI, LangGraph sync tool nodes). When called from inside a
+    running loop, the coroutine is run on a fresh loop in a worker thread so
+    the caller's loop is not re-entered.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
@@ -7,3 +7,33 @@ MAX_CONCEPT_VARIATIONS = 10
 
 # Cover prompts (background-only, no title text)
 COVER_PROMPTS_COUNT = 15
+
+# Theme expansion: independent first-round attempts run concurrently
+THEME_SPECULATIVE_ATTEMPTS = 3
+
+# Post-theme generators (prompts, cover prompts, keywords) run concurrently, capped for rate limits
+POST_THEME_CONCURRENCY = 4
+
+# Multi-book batches: books whose refine loops run at the same time (each runs up to
+# POST_THEME_CONCURRENCY loops of its own)
+BOOK_BATCH_CONCURRENCY = 3
+
+# Interior prompts stream: abort a non-final attempt early when too many of the
+# first completed prompts break the black-and-white rules
+PROMPTS_EARLY_CHECK_COUNT = 10
+PROMPTS_EARLY_ABORT_VIOLATIONS = 4
+
+# Interior prompts are generated as parallel batches, merged, de-duplicated and capped
+INTERIOR_PROMPTS_TOTAL = 50
+INTERIOR_PROMPTS_BATCH_SIZE = 10
+INTERIOR_PROMPTS_MAX = 55
+
+# Refine loops: generate the next attempt while the current one is being evaluated
+# (reused when the feedback did not change, discarded otherwise)
+REFINE_SPECULATIVE_NEXT = True
+
+# Refine loops: stop once the best score has not improved by REFINE_MIN_GAIN points
+# for REFINE_EARLY_STOP_PATIENCE consecutive attempts (never before REFINE_MIN_ATTEMPTS)
+REFINE_MIN_GAIN = 3
+REFINE_EARLY_STOP_PATIENCE = 2
+REFINE_MIN_ATTEMPTS = 2
@@ -0,0 +1,118 @@
+"""
+On-disk memoization of design-generation LLM responses.
+
+Opt-in via CB_LLM_CACHE=1 (see config.py). Entries are keyed on a blake2b hash
+of the call's identifying parts (template, model, inputs) and expire after
+LLM_CACHE_TTL_SECONDS. Uses diskcache when installed, otherwise one JSON file
+per entry under LLM_CACHE_DIR. Only successful results are stored.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Awaitable, Callable
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+import config
+
+_disk_cache = None
+
+
+def llm_cache_key(*parts: Any) -> str:
+    """Stable hash of the parts that identify an LLM call."""
+    material = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _get_disk_cache():
+    """Lazily open the diskcache store."""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = diskcache.Cache(str(config.LLM_CACHE_DIR))
+    return _disk_cache
+
+
+def _entry_path(key: str):
+    return config.LLM_CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def cache_get(key: str) -> Any:
+    """Return the cached value for key, or None when missing or expired."""
+    if DISKCACHE_AVAILABLE:
+        return _get_disk_cache().get(key)
+    path = _entry_path(key)
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("expires", 0) < time.time():
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    return entry.get("value")
+
+
+def cache_set(key: str, value: Any) -> None:
+    """Store a JSON-serializable value under key; write failures are ignored."""
+    ttl = config.LLM_CACHE_TTL_SECONDS
+    if DISKCACHE_AVAILABLE:
+        _get_disk_cache().set(key, value, expire=ttl)
+        return
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"expires": time.time() + ttl, "value": value}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def lookup(key_parts: tuple) -> Any:
+    """Cached value for key_parts, or None when missing or when the cache is off."""
+    if not config.LLM_CACHE_ENABLED:
+        return None
+    return cache_get(llm_cache_key(*key_parts))
+
+
+def store(key_parts: tuple, value: Any) -> None:
+    """Cache value under key_parts (no-op when the cache is off)."""
+    if config.LLM_CACHE_ENABLED:
+        cache_set(llm_cache_key(*key_parts), value)
+
+
+def cached_call(key_parts: tuple, compute: Callable[[], Any]) -> Any:
+    """
+    Return the cached result for key_parts, or run compute() and cache it.
+
+    When CB_LLM_CACHE is off this is just compute(). Exceptions from compute
+    propagate and nothing is stored.
+    """
+    hit = lookup(key_parts)
+    if hit is not None:
+        return hit
+    value = compute()
+    store(key_parts, value)
+    return value
+
+
+async def acached_call(key_parts: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Async variant of :func:`cached_call`."""
+    hit = lookup(key_parts)
+    if hit is not None:
+        return hit
+    value = await compute()
+    store(key_parts, value)
+    return value
@@ -0,0 +1,38 @@
+"""Logging configuration for design generation progress messages."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Configure and return the package-level logger.
+
+    Records go through a QueueHandler; a background QueueListener writes them
+    to stdout, so concurrent refine loops never block on the stdout lock.
+    """
+    logger = logging.getLogger("features.design_generation")
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(level)
+    logger.propagate = False
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
+    return logger
+
+
+logger = setup_logging()
@@ -0,0 +1,54 @@
+"""
+Pydantic models for design generation LLM output.
+
+Used with ``with_structured_output`` so the provider returns validated fields
+instead of free-form JSON text.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class ThemeExpansion(BaseModel):
+    """Expanded creative theme with its artistic style."""
+
+    original_input: str = Field(default="", description="The user's theme idea, unchanged")
+    expanded_theme: str = Field(description="A detailed, evocative description of the theme concept")
+    artistic_style: str = Field(description="The chosen artistic style (be specific)")
+    style_description: str = Field(default="", description="Detailed description of what this style looks like")
+    signature_artist: str = Field(description="The most famous coloring book artist in this style")
+    why_this_style: str = Field(default="", description="Why this style is perfect for this theme")
+    unique_angle: str = Field(default="", description="What makes this concept unique and special")
+    target_audience: str = Field(default="", description="Who will love this book and why")
+    difficulty_level: str = Field(default="", description="beginner, intermediate or advanced")
+    visual_elements: list[str] = Field(default_factory=list, description="Specific visual elements to include")
+    style_keywords: list[str] = Field(default_factory=list, description="Keywords that define the style")
+    mood: list[str] = Field(default_factory=list, description="Mood descriptors")
+    page_ideas: list[str] = Field(default_factory=list, description="Ideas for individual pages")
+
+
+class TitleDescription(BaseModel):
+    """Book title and Amazon description."""
+
+    title: str = Field(description="Book title, max 60 characters")
+    description: str = Field(description="Book description ending with the required section")
+
+
+class CoverPromptsList(BaseModel):
+    """MidJourney prompts for cover backgrounds."""
+
+    prompts: list[str] = Field(description="Cover background prompts, one per entry")
+
+
+class KeywordsList(BaseModel):
+    """Amazon SEO keywords."""
+
+    keywords: list[str] = Field(description="Exactly 10 SEO keywords")
+
+
+class DesignBundle(BaseModel):
+    """Title, description, interior prompts and keywords from one combined call."""
+
+    title: str = Field(description="Book title, max 60 characters")
+    description: str = Field(description="Book description ending with the required section")
+    midjourney_prompts: list[str] = Field(description="Interior page MidJourney prompts")
+    keywords: list[str] = Field(description="Exactly 10 SEO keywords")
@@ -2,37 +2,127 @@
 
 import os
 import json
+import re
+import asyncio
 import uuid
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Iterator
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
+from langchain_core.exceptions import OutputParserException
+from langchain_core.utils.json import parse_partial_json
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from features.design_generation.agents.evaluator import (
-    evaluate_title_description,
-    evaluate_prompts,
-    evaluate_cover_prompts,
-    evaluate_keywords,
-    evaluate_theme_creativity,
+    aevaluate_title_description,
+    aevaluate_prompts,
+    aevaluate_cover_prompts,
+    aevaluate_keywords,
+    aevaluate_theme_creativity,
+    evaluate_bundle,
     format_feedback,
+    prompt_breaks_bw_rules,
+    prompts_abort_verdict,
     BANNED_AI_WORDS,
     REQUIRED_SECTION,
     MAX_ATTEMPTS,
     PASS_THRESHOLD
 )
 from features.design_generation.tools.search_tools import web_search
+from features.design_generation.models import (
+    ThemeExpansion,
+    TitleDescription,
+    CoverPromptsList,
+    KeywordsList,
+    DesignBundle,
+)
+from features.design_generation.concurrency import run_sync
+from features.design_generation.logging_config import logger
+from features.design_generation import llm_cache
 from features.design_generation.constants import (
     MIN_CONCEPT_VARIATIONS,
     MAX_CONCEPT_VARIATIONS,
     COVER_PROMPTS_COUNT,
+    THEME_SPECULATIVE_ATTEMPTS,
+    POST_THEME_CONCURRENCY,
+    BOOK_BATCH_CONCURRENCY,
+    PROMPTS_EARLY_CHECK_COUNT,
+    PROMPTS_EARLY_ABORT_VIOLATIONS,
+    INTERIOR_PROMPTS_TOTAL,
+    INTERIOR_PROMPTS_BATCH_SIZE,
+    INTERIOR_PROMPTS_MAX,
+    REFINE_SPECULATIVE_NEXT,
+    REFINE_MIN_GAIN,
+    REFINE_EARLY_STOP_PATIENCE,
+    REFINE_MIN_ATTEMPTS,
 )
 
 load_dotenv()
 
 
+# Banned-word list as passed to the generator prompts
+_BANNED_AI_WORDS_JOINED = ", ".join(BANNED_AI_WORDS[:20])
+
+# Optional ```json ... ``` fence around a model response
+_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
+
+def _strip_fences(text: str) -> str:
+    """Remove a surrounding markdown code fence from an LLM response."""
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+# orjson when available, else one shared stdlib decoder instead of a json.loads call per parse
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.JSONDecoder().decode
+
+
+def _parse_json(text: str):
+    """
+    Parse a (possibly fenced) JSON response, with orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    json.JSONDecodeError either way.
+    """
+    return _json_loads(_strip_fences(text))
+
+
+def _parse_json_tolerant(text: str):
+    """
+    Like _parse_json, but repairs near-misses instead of failing: prose before
+    the object, raw newlines inside strings, and strings or brackets left open
+    by a cut-off response.
+
+    Raises json.JSONDecodeError when nothing parseable remains.
+    """
+    try:
+        return _parse_json(text)
+    except json.JSONDecodeError:
+        body = _strip_fences(text)
+        start = body.find("{")
+        return parse_partial_json(body[start:] if start != -1 else body)
+
+
+@lru_cache(maxsize=1)
 def get_llm():
-    """Get the language model instance."""
+    """
+    Get the language model instance.
+
+    Cached so every generator, retry and concurrent call shares one client and
+    its keep-alive connection pool.
+    """
     from config import CONTENT_MODEL, CONTENT_MODEL_TEMPERATURE
     return ChatOpenAI(
         model=CONTENT_MODEL,
@@ -41,27 +131,35 @@ def get_llm():
     )
 
 
-# =============================================================================
-# CONCEPT VARIATIONS (preliminary research - not exposed to executor)
-# =============================================================================
+def _llm_key(template: str, inputs: dict, variant: int = 0) -> tuple:
+    """Parts identifying a generator call for the on-disk LLM cache."""
+    from config import CONTENT_MODEL, CONTENT_MODEL_TEMPERATURE
+    return (template, CONTENT_MODEL, CONTENT_MODEL_TEMPERATURE, inputs, variant)
 
-def generate_concept_variations(user_idea: str, num_variations: int = 5) -> list[dict]:
-    """
-    Generate N creative variations of the user's idea with different themes and art styles.
-    Called directly from UI for preliminary concept research. Not exposed to executor agent.
 
-    Args:
-        user_idea: The user's initial idea (e.g., "dog", "forest animals").
-        num_variations: Number of variations to generate (5-10, default 5).
+@lru_cache(maxsize=None)
+def _generator_chain(template: str, parser_cls: type = StrOutputParser):
+    """Build the prompt | llm | parser chain for a generator template once and reuse it."""
+    return ChatPromptTemplate.from_template(template) | get_llm() | parser_cls()
 
-    Returns:
-        List of N dicts, each with id, theme_concept, art_style, style_description,
-        unique_angle, and mixable_components (theme, style).
+
+@lru_cache(maxsize=None)
+def _structured_chain(template: str, schema: type):
+    """
+    Build (once) a chain whose LLM returns an instance of `schema` via function calling.
+
+    Invalid output raises OutputParserException or pydantic's ValidationError,
+    both ValueError subclasses.
     """
-    num_variations = max(MIN_CONCEPT_VARIATIONS, min(MAX_CONCEPT_VARIATIONS, num_variations))
+    llm = get_llm().with_structured_output(schema, method="function_calling")
+    return ChatPromptTemplate.from_template(template) | llm
+
+
+# =============================================================================
+# CONCEPT VARIATIONS (preliminary research - not exposed to executor)
+# =============================================================================
 
-    llm = get_llm()
-    prompt = ChatPromptTemplate.from_template("""
+CONCEPT_VARIATIONS_PROMPT = """
 You are a creative director for a coloring book publishing company. Generate {num_variations} DISTINCT and CREATIVE variations of this idea for coloring books.
 
 ## USER'S IDEA:
@@ -86,87 +184,259 @@ Create exactly {num_variations} variations. Each variation must be UNIQUE and DI
   ... ({num_variations} total)
 ]
 
-Return ONLY the JSON array, no other text.""")
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({"user_idea": user_idea, "num_variations": num_variations})
-    try:
-        result = result.strip()
-        if result.startswith("```json"):
-            result = result[7:]
-        if result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        variations = json.loads(result.strip())
-        if not isinstance(variations, list):
-            variations = [variations] if isinstance(variations, dict) else []
-        # Ensure exactly num_variations, add ids and mixable_components
-        out = []
-        for i, v in enumerate(variations[:num_variations]):
-            if isinstance(v, dict):
-                theme = v.get("theme_concept", v.get("theme", ""))
-                style = v.get("art_style", v.get("style", ""))
-                out.append({
-                    "id": str(uuid.uuid4()),
-                    "theme_concept": theme,
-                    "art_style": style,
-                    "style_description": v.get("style_description", ""),
-                    "unique_angle": v.get("unique_angle", ""),
-                    "mixable_components": {
-                        "theme": theme,
-                        "style": style,
-                    },
-                })
-        return out[:num_variations]
-    except json.JSONDecodeError:
+Return ONLY the JSON array, no other text."""
+
+
+_CONCEPT_VARIATIONS_TEMPLATE = ChatPromptTemplate.from_template(CONCEPT_VARIATIONS_PROMPT)
+
+
+@lru_cache(maxsize=1)
+def _concept_variations_chain():
+    """Prompt | LLM | JSON parser chain, built once; streams partially parsed arrays."""
+    return _CONCEPT_VARIATIONS_TEMPLATE | get_llm() | JsonOutputParser()
+
+
+def _to_concept_variation(v) -> dict | None:
+    """Normalize one raw variation from the LLM; None for non-dict entries."""
+    if not isinstance(v, dict):
+        return None
+    theme = v.get("theme_concept", v.get("theme", ""))
+    style = v.get("art_style", v.get("style", ""))
+    return {
+        "id": str(uuid.uuid4()),
+        "theme_concept": theme,
+        "art_style": style,
+        "style_description": v.get("style_description", ""),
+        "unique_angle": v.get("unique_angle", ""),
+        "mixable_components": {
+            "theme": theme,
+            "style": style,
+        },
+    }
+
+
+def _ready_variations(partial, emitted: int, done: bool) -> list:
+    """
+    Array elements of a partial JSON parse that are complete and not yet emitted.
+    While streaming, the last element may still be growing, so it is held back
+    until the next one starts or the stream ends.
+    """
+    if isinstance(partial, dict):
+        partial = [partial] if done else []
+    if not isinstance(partial, list):
         return []
+    ready = len(partial) if done else len(partial) - 1
+    return partial[emitted:max(emitted, ready)]
+
+
+# Complete variation lists keyed by (normalized idea, count), so re-submitting the
+# same idea in the UI replays the earlier result instead of another LLM call
+CONCEPT_VARIATIONS_CACHE_SIZE = 128
+CONCEPT_VARIATIONS_TTL_SECONDS = 3600
+_concept_variations_cache: OrderedDict = OrderedDict()
+_concept_variations_lock = threading.Lock()
+
+
+def _concept_variations_key(user_idea: str, num_variations: int) -> tuple:
+    return " ".join(user_idea.lower().split()), num_variations
+
+
+def _concept_variations_cache_get(key: tuple) -> list | None:
+    with _concept_variations_lock:
+        entry = _concept_variations_cache.get(key)
+        if entry is None:
+            return None
+        expires, variations = entry
+        if expires < time.monotonic():
+            del _concept_variations_cache[key]
+            return None
+        _concept_variations_cache.move_to_end(key)
+        return copy.deepcopy(variations)
+
+
+def _concept_variations_cache_put(key: tuple, variations: list) -> None:
+    # Short lists (cut-off or unparseable responses) are not cached
+    if len(variations) < key[1]:
+        return
+    with _concept_variations_lock:
+        _concept_variations_cache[key] = (time.monotonic() + CONCEPT_VARIATIONS_TTL_SECONDS, copy.deepcopy(variations))
+        _concept_variations_cache.move_to_end(key)
+        while len(_concept_variations_cache) > CONCEPT_VARIATIONS_CACHE_SIZE:
+            _concept_variations_cache.popitem(last=False)
+
+
+def clear_concept_variations_cache() -> None:
+    """Drop all cached concept variations."""
+    with _concept_variations_lock:
+        _concept_variations_cache.clear()
+
+
+class _VariationStream:
+    """
+    Shared state of one concept-variations stream, fed by both the async and the
+    sync streaming loop: clamps the count, turns the parser's partial lists into
+    finished variations, and caches the completed list.
+    """
+
+    def __init__(self, user_idea: str, num_variations: int):
+        self.num_variations = max(MIN_CONCEPT_VARIATIONS, min(MAX_CONCEPT_VARIATIONS, num_variations))
+        self.inputs = {"user_idea": user_idea, "num_variations": self.num_variations}
+        self.key = _concept_variations_key(user_idea, self.num_variations)
+        self.emitted = 0
+        self.full = False
+        self.produced = []
+
+    def cached(self) -> list | None:
+        """The cached list for this (idea, count), or None."""
+        return _concept_variations_cache_get(self.key)
+
+    def feed(self, partial, done: bool = False) -> list[dict]:
+        """Variations completed by this partial parse; sets `full` once the count is reached."""
+        concepts = []
+        for v in _ready_variations(partial, self.emitted, done):
+            if self.emitted >= self.num_variations:
+                self.full = True
+                break
+            self.emitted += 1
+            concept = _to_concept_variation(v)
+            if concept:
+                concepts.append(concept)
+        self.produced.extend(concepts)
+        return concepts
+
+    def finish(self, partial) -> list[dict]:
+        """Variations left in the final parse (None after a parse error); caches the full list."""
+        concepts = [] if self.full or partial is None else self.feed(partial, done=True)
+        _concept_variations_cache_put(self.key, self.produced)
+        return concepts
+
+
+async def iter_concept_variations(user_idea: str, num_variations: int = 5) -> AsyncIterator[dict]:
+    """
+    Stream concept variations as each array element finishes arriving.
+    Same arguments and item shape as generate_concept_variations.
+    A repeat of a recently completed (idea, count) replays the cached list.
+    """
+    stream = _VariationStream(user_idea, num_variations)
+    cached = stream.cached()
+    if cached is not None:
+        for concept in cached:
+            yield concept
+        return
+    partial = None
+    try:
+        async for partial in _concept_variations_chain().astream(stream.inputs):
+            for concept in stream.feed(partial):
+                yield concept
+            if stream.full:
+                break
+    except OutputParserException:
+        partial = None
+    for concept in stream.finish(partial):
+        yield concept
+
+
+def stream_concept_variations(user_idea: str, num_variations: int = 5) -> Iterator[dict]:
+    """Synchronous counterpart of iter_concept_variations for the Streamlit script thread."""
+    stream = _VariationStream(user_idea, num_variations)
+    cached = stream.cached()
+    if cached is not None:
+        yield from cached
+        return
+    partial = None
+    try:
+        for partial in _concept_variations_chain().stream(stream.inputs):
+            yield from stream.feed(partial)
+            if stream.full:
+                break
+    except OutputParserException:
+        partial = None
+    yield from stream.finish(partial)
+
+
+def generate_concept_variations(user_idea: str, num_variations: int = 5) -> list[dict]:
+    """
+    Generate N creative variations of the user's idea with different themes and art styles.
+    Called directly from UI for preliminary concept research. Not exposed to executor agent.
+    Blocking wrapper around iter_concept_variations.
+
+    Args:
+        user_idea: The user's initial idea (e.g., "dog", "forest animals").
+        num_variations: Number of variations to generate (5-10, default 5).
+
+    Returns:
+        List of N dicts, each with id, theme_concept, art_style, style_description,
+        unique_angle, and mixable_components (theme, style).
+    """
+    async def _collect() -> list[dict]:
+        return [v async for v in iter_concept_variations(user_idea, num_variations)]
+
+    return run_sync(_collect())
 
 
 # =============================================================================
 # THEME EXPANSION FUNCTIONS
 # =============================================================================
 
-def _search_artistic_style(theme: str) -> dict:
-    """Search for the best artistic style and associated author for the theme."""
-    print("   🎨 Searching for best artistic style...")
+async def _search_artistic_style_async(theme: str) -> dict:
+    """Run the style and artist searches for the theme concurrently."""
+    style_query = f"best artistic style for {theme} coloring book illustration"
+    artist_query = f"famous coloring book artist {theme} style Johanna Basford Kerby Rosanes"
+    # web_search is a sync tool; ainvoke runs each call in an executor thread
+    style_search, artist_search = await asyncio.gather(
+        web_search.ainvoke({"query": style_query, "max_results": 3}),
+        web_search.ainvoke({"query": artist_query, "max_results": 3}),
+        return_exceptions=True,
+    )
     
     style_results = {}
-    
-    # Search for artistic styles that match the theme
-    try:
-        style_query = f"best artistic style for {theme} coloring book illustration"
-        style_search = web_search.invoke({"query": style_query, "max_results": 3})
-        style_results["style_research"] = style_search if style_search else ""
-    except Exception as e:
-        style_results["style_research"] = f"Search failed: {e}"
-    
-    # Search for famous coloring book artists in this style
-    try:
-        artist_query = f"famous coloring book artist {theme} style Johanna Basford Kerby Rosanes"
-        artist_search = web_search.invoke({"query": artist_query, "max_results": 3})
-        style_results["artist_research"] = artist_search if artist_search else ""
-    except Exception as e:
-        style_results["artist_research"] = f"Search failed: {e}"
-    
+    for key, found in (("style_research", style_search), ("artist_research", artist_search)):
+        if isinstance(found, Exception):
+            style_results[key] = f"Search failed: {found}"
+        else:
+            style_results[key] = found if found else ""
     return style_results
 
 
-def _expand_theme_internal(user_input: str, style_research: dict, feedback: str = "") -> dict:
-    """Internal function to expand user input into a detailed creative theme with artistic style."""
-    llm = get_llm()
-    
-    feedback_section = ""
-    if feedback:
-        feedback_section = f"""
+# Style research keyed by normalized theme; reused across retries and tool calls in one process
+STYLE_RESEARCH_CACHE_SIZE = 256
+_style_research_cache: OrderedDict = OrderedDict()
+_style_research_lock = threading.Lock()
 
-IMPORTANT - Previous theme expansion had issues. Address these:
-{feedback}
-"""
-    
-    style_context = style_research.get("style_research", "")
-    artist_context = style_research.get("artist_research", "")
-    
-    prompt = ChatPromptTemplate.from_template("""
+
+def _style_research_key(theme: str) -> str:
+    """Normalize a theme so case and whitespace variants share a cache entry."""
+    return " ".join(theme.lower().split())
+
+
+def _search_artistic_style(theme: str) -> dict:
+    """Search for the best artistic style and associated author for the theme."""
+    key = _style_research_key(theme)
+    with _style_research_lock:
+        cached = _style_research_cache.get(key)
+        if cached is not None:
+            _style_research_cache.move_to_end(key)
+            logger.info("   🎨 Reusing artistic style research...")
+            return dict(cached)
+    logger.info("   🎨 Searching for best artistic style...")
+    style_results = run_sync(_search_artistic_style_async(theme))
+    # Failed searches are not cached so the next attempt retries them
+    if not any(str(v).startswith("Search failed:") for v in style_results.values()):
+        with _style_research_lock:
+            _style_research_cache[key] = dict(style_results)
+            _style_research_cache.move_to_end(key)
+            while len(_style_research_cache) > STYLE_RESEARCH_CACHE_SIZE:
+                _style_research_cache.popitem(last=False)
+    return style_results
+
+
+def clear_style_research_cache() -> None:
+    """Drop all cached style research."""
+    with _style_research_lock:
+        _style_research_cache.clear()
+
+
+THEME_EXPANSION_PROMPT = """
 You are a creative director for a coloring book publishing company. Your job is to craft a UNIQUE theme and select the PERFECT artistic style.
 
 ## USER'S THEME IDEA:
@@ -208,7 +478,6 @@ Create a unique creative concept by pairing the theme with the ideal artistic st
     "artistic_style": "The chosen artistic style (be specific)",
     "style_description": "Detailed description of what this style looks like",
     "signature_artist": "The most famous coloring book artist in this style",
-    "artist_books": "Famous coloring books by this artist",
     "why_this_style": "Why this style is perfect for this theme",
     "unique_angle": "What makes this concept unique and special",
     "target_audience": "Who will love this book and why",
@@ -219,33 +488,116 @@ Create a unique creative concept by pairing the theme with the ideal artistic st
     "page_ideas": ["idea 1", "idea 2", "idea 3", "idea 4", "idea 5"]
 }}
 
-Return ONLY valid JSON, no other text.""")
-    
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({
+Return ONLY valid JSON, no other text."""
+
+
+def _theme_expansion_inputs(user_input: str, style_research: dict, feedback: str = "") -> dict:
+    """Prompt inputs for the theme expansion chain."""
+    feedback_section = ""
+    if feedback:
+        feedback_section = f"""
+
+IMPORTANT - Previous theme expansion had issues. Address these:
+{feedback}
+"""
+    return {
         "user_input": user_input,
-        "style_context": style_context,
-        "artist_context": artist_context,
+        "style_context": style_research.get("style_research", ""),
+        "artist_context": style_research.get("artist_research", ""),
         "feedback_section": feedback_section
-    })
-    
+    }
+
+
+def _theme_expansion_failure(user_input: str) -> dict:
+    """Placeholder theme returned when the model gives no usable expansion."""
+    return {
+        "original_input": user_input,
+        "expanded_theme": "",
+        "artistic_style": "",
+        "signature_artist": "",
+        "error": "Failed to parse theme expansion"
+    }
+
+
+def _expand_theme_internal(user_input: str, style_research: dict, feedback: str = "") -> dict:
+    """Internal function to expand user input into a detailed creative theme with artistic style."""
+    chain = _structured_chain(THEME_EXPANSION_PROMPT, ThemeExpansion)
+    inputs = _theme_expansion_inputs(user_input, style_research, feedback)
     try:
-        result = result.strip()
-        if result.startswith("```json"):
-            result = result[7:]
-        if result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        return json.loads(result.strip())
-    except json.JSONDecodeError:
-        return {
-            "original_input": user_input,
-            "expanded_theme": "",
-            "artistic_style": "",
-            "signature_artist": "",
-            "error": "Failed to parse theme expansion"
-        }
+        return llm_cache.cached_call(
+            _llm_key(THEME_EXPANSION_PROMPT, inputs),
+            lambda: chain.invoke(inputs).model_dump(),
+        )
+    except ValueError:
+        return _theme_expansion_failure(user_input)
+
+
+async def _expand_theme_internal_async(user_input: str, style_research: dict, feedback: str = "", variant: int = 0) -> dict:
+    """
+    Async variant of _expand_theme_internal. `variant` separates the cache entries
+    of concurrent attempts with identical inputs so replays keep their diversity.
+    """
+    chain = _structured_chain(THEME_EXPANSION_PROMPT, ThemeExpansion)
+    inputs = _theme_expansion_inputs(user_input, style_research, feedback)
+
+    async def expand() -> dict:
+        return (await chain.ainvoke(inputs)).model_dump()
+
+    try:
+        return await llm_cache.acached_call(_llm_key(THEME_EXPANSION_PROMPT, inputs, variant), expand)
+    except ValueError:
+        return _theme_expansion_failure(user_input)
+
+
+async def _expand_and_evaluate_async(user_input: str, style_research: dict, feedback: str = "", variant: int = 0) -> tuple[dict, dict]:
+    """Expand one theme attempt and judge it; returns (theme_data, evaluation)."""
+    theme_data = await _expand_theme_internal_async(user_input, style_research, feedback, variant)
+    theme_data["style_research"] = style_research
+    # Ensure main_theme (primary subject) is set for prompt generation and evaluation
+    if not theme_data.get("main_theme"):
+        theme_data["main_theme"] = (theme_data.get("original_input") or "").split(" in ")[0].strip() or (theme_data.get("expanded_theme") or "").split(" in ")[0].strip()
+    evaluation = await aevaluate_theme_creativity(theme_data)
+    return theme_data, evaluation
+
+
+async def _speculative_theme_attempts(user_input: str, style_research: dict, count: int) -> list:
+    """
+    Run `count` independent first-round theme attempts concurrently.
+
+    Results are returned in completion order. As soon as one attempt passes, the
+    attempts still generating or being judged are cancelled.
+    """
+    tasks = [
+        asyncio.create_task(_expand_and_evaluate_async(user_input, style_research, "", variant=i))
+        for i in range(count)
+    ]
+    results = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            theme_data, evaluation = await next_done
+            results.append((theme_data, evaluation))
+            if evaluation.get("passed", False) or evaluation.get("score", 0) >= PASS_THRESHOLD:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+
+def _theme_feedback(best_attempt: dict, best_score: int) -> str:
+    """Feedback for the next theme attempt, built on the best attempt so far."""
+    # Include the best theme for reference
+    best_theme = best_attempt["content"]
+    return "\n".join([
+        format_feedback(best_attempt["evaluation"], "Theme"),
+        "",
+        f"📋 BEST THEME SO FAR (score {best_score}/100) - IMPROVE THIS:",
+        f"Theme: {best_theme.get('expanded_theme', '')[:100]}...",
+        f"Artistic Style: {best_theme.get('artistic_style', '')}",
+        f"Signature Artist: {best_theme.get('signature_artist', '')}",
+        f"Unique Angle: {best_theme.get('unique_angle', '')[:100]}...",
+    ])
 
 
 @tool
@@ -264,34 +616,42 @@ def expand_and_research_theme(user_input: str) -> dict:
     Returns:
         Dictionary with expanded_theme, artistic_style, signature_artist, and unique_angle.
     """
-    print("\n🎨 Step 0: Theme & Artistic Style Development")
+    logger.info("\n🎨 Step 0: Theme & Artistic Style Development")
     
     # Phase 1: Search for best artistic style and artist
-    print("   🔍 Researching artistic styles and artists...")
+    logger.info("   🔍 Researching artistic styles and artists...")
     style_research = _search_artistic_style(user_input)
     
-    # Phase 2: Theme Expansion with Evaluation Loop
+    # Phase 2: Independent first-round attempts run concurrently (no feedback yet),
+    # then at most one feedback-guided refinement of the best one
+    speculative = min(THEME_SPECULATIVE_ATTEMPTS, MAX_ATTEMPTS)
+    logger.info("   🎨 Theme Development - %d parallel attempts (first pass wins)", speculative)
+    results = run_sync(_speculative_theme_attempts(user_input, style_research, speculative))
+    
     attempts = []
-    feedback = ""
     best_attempt = None
     best_score = -1
+    for attempt_num, (theme_data, evaluation) in enumerate(results, 1):
+        score = evaluation.get("score", 0)
+        attempt_record = {
+            "attempt": attempt_num,
+            "content": theme_data,
+            "evaluation": evaluation,
+            "feedback": ""
+        }
+        attempts.append(attempt_record)
+        logger.info("      Attempt %d Creativity Score: %s/100", attempt_num, score)
+        if score > best_score:
+            best_score = score
+            best_attempt = attempt_record
     
-    for attempt_num in range(1, MAX_ATTEMPTS + 1):
-        print(f"   🎨 Theme Development - Attempt {attempt_num}/{MAX_ATTEMPTS}")
-        
-        # Generate expanded theme (with feedback from best attempt if available)
-        theme_data = _expand_theme_internal(user_input, style_research, feedback)
-        theme_data["style_research"] = style_research
-        # Ensure main_theme (primary subject) is set for prompt generation and evaluation
-        if not theme_data.get("main_theme"):
-            theme_data["main_theme"] = (theme_data.get("original_input") or "").split(" in ")[0].strip() or (theme_data.get("expanded_theme") or "").split(" in ")[0].strip()
-
-        # Evaluate creativity
-        evaluation = evaluate_theme_creativity(theme_data)
-        
+    passed = best_attempt["evaluation"].get("passed", False) or best_score >= PASS_THRESHOLD
+    if not passed and len(attempts) < MAX_ATTEMPTS:
+        attempt_num = len(attempts) + 1
+        logger.info("   🎨 Theme Development - Refinement attempt %d/%d", attempt_num, MAX_ATTEMPTS)
+        feedback = _theme_feedback(best_attempt, best_score)
+        theme_data, evaluation = run_sync(_expand_and_evaluate_async(user_input, style_research, feedback))
         score = evaluation.get("score", 0)
-        
-        # Record attempt
         attempt_record = {
             "attempt": attempt_num,
             "content": theme_data,
@@ -299,47 +659,25 @@ def expand_and_research_theme(user_input: str) -> dict:
             "feedback": feedback
         }
         attempts.append(attempt_record)
-        
-        # Track best attempt
         if score > best_score:
             best_score = score
             best_attempt = attempt_record
-            print(f"      Creativity Score: {score}/100 ⭐ NEW BEST")
+            logger.info("      Creativity Score: %s/100 ⭐ NEW BEST", score)
         else:
-            print(f"      Creativity Score: {score}/100 (best: {best_score})")
-        
-        passed = evaluation.get("passed", False) or score >= PASS_THRESHOLD
-        
-        if passed:
-            print(f"      ✅ PASSED")
-            return {
-                "final_theme": theme_data,
-                "style_research": style_research,
-                "attempts": attempts,
-                "passed": True,
-                "final_score": score,
-                "attempts_needed": attempt_num
-            }
-        
-        # Prepare feedback for next attempt - BUILD ON BEST ATTEMPT
-        feedback = format_feedback(best_attempt["evaluation"], "Theme")
-        # Include the best theme for reference
-        best_theme = best_attempt["content"]
-        feedback += f"\n\n📋 BEST THEME SO FAR (score {best_score}/100) - IMPROVE THIS:\n"
-        feedback += f"Theme: {best_theme.get('expanded_theme', '')[:100]}...\n"
-        feedback += f"Artistic Style: {best_theme.get('artistic_style', '')}\n"
-        feedback += f"Signature Artist: {best_theme.get('signature_artist', '')}\n"
-        feedback += f"Unique Angle: {best_theme.get('unique_angle', '')[:100]}..."
+            logger.info("      Creativity Score: %s/100 (best: %s)", score, best_score)
+        passed = best_attempt["evaluation"].get("passed", False) or best_score >= PASS_THRESHOLD
     
-    # Return BEST attempt if none passed
-    print(f"      ❌ Max attempts reached. Using best attempt (score: {best_score})")
+    if passed:
+        logger.info("      ✅ PASSED")
+    else:
+        logger.info("      ❌ Attempts exhausted. Using best attempt (score: %s)", best_score)
     return {
         "final_theme": best_attempt["content"],
         "style_research": style_research,
         "attempts": attempts,
-        "passed": False,
+        "passed": passed,
         "final_score": best_score,
-        "attempts_needed": MAX_ATTEMPTS
+        "attempts_needed": len(attempts)
     }
 
 
@@ -347,52 +685,40 @@ def expand_and_research_theme(user_input: str) -> dict:
 # INTERNAL GENERATION FUNCTIONS (not exposed as tools)
 # =============================================================================
 
-def _generate_title_description_internal(user_input: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> dict:
-    """Internal function to generate title and description influenced by theme."""
-    llm = get_llm()
-    
-    feedback_section = ""
-    if feedback:
-        feedback_section = f"""
-    
-    IMPORTANT - Previous attempt had issues. Fix these problems:
-    {feedback}
-    """
-    
-    # Build custom instructions section
-    custom_section = ""
-    if custom_instructions:
-        custom_section = f"""
+# Optional prompt sections default to empty; generators only fill the ones they need
+def _join_capped(items, limit: int = 10, max_chars: int = 200) -> str:
+    """Join theme-context list items for a prompt, capped in count and length to save tokens."""
+    joined = ", ".join(str(item) for item in (items or [])[:limit])
+    if len(joined) > max_chars:
+        joined = joined[:max_chars].rsplit(", ", 1)[0]
+    return joined
+
+
+_EMPTY_SECTIONS = {
+    "feedback_section": "",
+    "custom_section": "",
+    "theme_section": "",
+    "main_theme_section": "",
+    "style_section": "",
+    "batch_section": "",
+}
+
+_FEEDBACK_SECTION = """
+
+IMPORTANT - Previous attempt had issues. Fix these problems:
+{feedback}
+"""
+
+_CUSTOM_SECTION = """
 ## USER'S SPECIAL INSTRUCTIONS (MUST FOLLOW):
 {custom_instructions}
 
-Apply these instructions while generating the title and description!
+{apply_hint}
 """
-    
-    # Build theme context section
-    theme_section = ""
-    if theme_context:
-        theme_section = f"""
-## CREATIVE DIRECTION (from theme development):
-- **Theme**: {theme_context.get('expanded_theme', user_input)}
-- **Artistic Style**: {theme_context.get('artistic_style', 'Not specified')}
-- **Signature Artist Inspiration**: {theme_context.get('signature_artist', 'Not specified')}
-- **Unique Angle**: {theme_context.get('unique_angle', 'Not specified')}
-- **Target Audience**: {theme_context.get('target_audience', 'Adults')}
-- **Style Keywords**: {', '.join(theme_context.get('style_keywords', []))}
-- **Mood**: {', '.join(theme_context.get('mood', []))}
 
-USE THIS CREATIVE DIRECTION to craft the title and description!
-"""
-    
-    prompt = ChatPromptTemplate.from_template("""
-You are a professional coloring book designer and marketing expert. Create a title and description that captures the unique creative vision.
 
-## USER'S ORIGINAL REQUEST:
-{user_input}
-{theme_section}
-{custom_section}
-{feedback_section}
+TITLE_DESCRIPTION_PROMPT = """
+You are a professional coloring book designer and marketing expert. Create a title and description that captures the unique creative vision.
 
 ## RESPONSE FORMAT (JSON only):
 {{
@@ -428,52 +754,240 @@ Why You Will Love this Book:
 ## BANNED WORDS - DO NOT USE:
 {banned_words}
 
-Return ONLY the raw JSON object without any markdown formatting.""")
-    
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({
-        "user_input": user_input,
-        "theme_section": theme_section,
-        "custom_section": custom_section,
-        "feedback_section": feedback_section,
-        "banned_words": ", ".join(BANNED_AI_WORDS[:20])
-    })
-    
-    try:
-        # Clean up response
-        result = result.strip()
-        if result.startswith("```json"):
-            result = result[7:]
-        if result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        return json.loads(result.strip())
-    except json.JSONDecodeError:
-        return {"title": "", "description": "", "error": "Failed to parse response"}
+## USER'S ORIGINAL REQUEST:
+{user_input}
+{theme_section}
+{custom_section}
+{feedback_section}
 
+Return ONLY the raw JSON object without any markdown formatting."""
 
-def _generate_prompts_internal(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> list:
-    """Internal function to generate MidJourney prompts influenced by theme and artistic style."""
-    llm = get_llm()
-    
-    feedback_section = ""
+
+def _title_description_inputs(user_input: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """Template inputs for TITLE_DESCRIPTION_PROMPT."""
+    inputs = dict(_EMPTY_SECTIONS, user_input=user_input, banned_words=_BANNED_AI_WORDS_JOINED)
     if feedback:
-        feedback_section = f"""
-
-IMPORTANT - Previous attempt had issues. Fix these problems:
-{feedback}
-"""
+        inputs["feedback_section"] = _FEEDBACK_SECTION.format_map({"feedback": feedback})
     
     # Build custom instructions section
-    custom_section = ""
     if custom_instructions:
-        custom_section = f"""
-## USER'S SPECIAL INSTRUCTIONS (MUST FOLLOW):
-{custom_instructions}
+        inputs["custom_section"] = _CUSTOM_SECTION.format_map({
+            "custom_instructions": custom_instructions,
+            "apply_hint": "Apply these instructions while generating the title and description!",
+        })
+    
+    # Build theme context section
+    if theme_context:
+        inputs["theme_section"] = f"""
+## CREATIVE DIRECTION (from theme development):
+- **Theme**: {theme_context.get('expanded_theme', user_input)}
+- **Artistic Style**: {theme_context.get('artistic_style', 'Not specified')}
+- **Signature Artist Inspiration**: {theme_context.get('signature_artist', 'Not specified')}
+- **Unique Angle**: {theme_context.get('unique_angle', 'Not specified')}
+- **Target Audience**: {theme_context.get('target_audience', 'Adults')}
+- **Style Keywords**: {_join_capped(theme_context.get('style_keywords'))}
+- **Mood**: {_join_capped(theme_context.get('mood'))}
 
-Apply these instructions when creating the prompts!
+USE THIS CREATIVE DIRECTION to craft the title and description!
 """
+    return inputs
+
+
+def _generate_title_description_internal(user_input: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """Internal function to generate title and description influenced by theme."""
+    inputs = _title_description_inputs(user_input, feedback, theme_context, custom_instructions)
+    chain = _structured_chain(TITLE_DESCRIPTION_PROMPT, TitleDescription)
+    try:
+        return llm_cache.cached_call(
+            _llm_key(TITLE_DESCRIPTION_PROMPT, inputs),
+            lambda: chain.invoke(inputs).model_dump(),
+        )
+    except ValueError:
+        return {"title": "", "description": "", "error": "Failed to parse response"}
+
+
+async def _agenerate_title_description_internal(user_input: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "", variant: int = 0) -> dict:
+    """
+    Async variant of :func:`_generate_title_description_internal`. `variant` (the
+    refine attempt index) keeps retries with unchanged feedback from replaying a cached attempt.
+    """
+    inputs = _title_description_inputs(user_input, feedback, theme_context, custom_instructions)
+    chain = _structured_chain(TITLE_DESCRIPTION_PROMPT, TitleDescription)
+
+    async def generate() -> dict:
+        return (await chain.ainvoke(inputs)).model_dump()
+
+    try:
+        return await llm_cache.acached_call(_llm_key(TITLE_DESCRIPTION_PROMPT, inputs, variant), generate)
+    except ValueError:
+        return {"title": "", "description": "", "error": "Failed to parse response"}
+
+
+INTERIOR_PROMPTS_PROMPT = """
+You are an expert at creating MidJourney prompts for coloring book designs in a SPECIFIC artistic style.
+
+## PROMPT FORMAT:
+Create exactly {prompt_count} prompts. Each prompt MUST follow this EXACT format:
+
+"[subject], [style keywords], [details], [art style], coloring book page, clean and simple line art, black and white --no color --ar 1:1"
+
+## CRITICAL RULES:
+1. Exactly {prompt_count} prompts, each a different scene or composition; quality and theme consistency matter more than exact count.
+2. Keywords ONLY - NO sentences or phrases
+3. Each keyword is 1-3 words max
+4. MUST include "coloring book page" in every prompt
+5. MUST include "clean and simple line art" in every prompt
+6. MUST include "black and white" in every prompt
+7. MUST end with "--no color --ar 1:1"
+8. EVERY prompt must center on the MAIN THEME (primary subject) when specified below; do not drift into generic style-only prompts.
+9. EVERY prompt must include the ARTISTIC STYLE in the keywords (how it's drawn).
+10. NEVER include color-related keywords - these are black and white line art pages. Banned: red, blue, green, yellow, orange, purple, pink, vibrant, colorful, colourful, pastel, hue, multicolored, rainbow, golden, silver, crimson, azure, etc.
+
+## GOOD (exact main theme + style): Highland cow, Celtic knot border, floral wreath, coloring book page, clean and simple line art, black and white --no color --ar 1:1
+## BAD (generic subject when theme is specific): cow, Celtic knot border... — use "highland cow" when main theme is "Highland cows", not "cow"
+## BAD (style only, no main theme): Celtic knot, mandala, decorative border, coloring book page... — missing the main subject
+
+## BAD PROMPTS (DO NOT DO THIS):
+"A beautiful owl sitting majestically in an enchanted forest" - TOO WORDY, uses banned words, no style keywords
+"owl, vibrant feathers, red flowers, blue sky, coloring book page..." - CONTAINS COLOR WORDS (vibrant, red, blue) - forbidden for black and white line art
+
+## BOOK DESCRIPTION:
+{description}
+{main_theme_section}
+{style_section}
+{custom_section}
+{feedback_section}
+{batch_section}
+
+Return a JSON array with exactly {prompt_count} prompts. No markdown, just the array."""
+
+
+# Fallback focus per batch when the theme has no page ideas to split between batches
+_PROMPT_BATCH_ANGLES = [
+    "close-up portraits",
+    "full scenes with detailed backgrounds",
+    "decorative patterns, borders and frames",
+    "seasonal and festive moments",
+    "action, play and movement",
+    "quiet, cozy and resting moments",
+]
+
+
+def _prompt_batch_sections(theme_context: dict, num_batches: int) -> list:
+    """Per-batch focus sections so parallel batches cover different parts of the book."""
+    if num_batches == 1:
+        return [""]
+    page_ideas = (theme_context or {}).get("page_ideas") or []
+    sections = []
+    for k in range(num_batches):
+        batch_ideas = page_ideas[k::num_batches]
+        focus = ", ".join(batch_ideas) if batch_ideas else _PROMPT_BATCH_ANGLES[k % len(_PROMPT_BATCH_ANGLES)]
+        sections.append(f"""
+## THIS BATCH ({k + 1} of {num_batches}):
+Other batches cover the rest of the book. Focus these prompts on: {focus}
+""")
+    return sections
+
+
+def _dedupe_prompts(prompts: list) -> list:
+    """
+    Drop repeated prompts (case and whitespace insensitive), keeping first occurrences.
+    Logs when more than 5% were duplicates, a sign the temperature is too low.
+    """
+    seen, unique = set(), []
+    for p in prompts:
+        if not isinstance(p, str):
+            continue
+        key = " ".join(p.lower().split())
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(p)
+    dropped = len(prompts) - len(unique)
+    if prompts and dropped / len(prompts) > 0.05:
+        logger.info("      ♻️ Dropped %d/%d duplicate prompts", dropped, len(prompts))
+    return unique
+
+
+class _AbortedPrompts(list):
+    """Prompts completed before an early abort; `violations` holds the prompts that triggered it."""
+
+    def __init__(self, prompts: list, violations: list):
+        super().__init__(prompts)
+        self.violations = violations
+
+
+async def _agenerate_prompt_batches(batch_inputs: list, early_abort: bool = False, variant: int = 0) -> list:
+    """
+    Stream all prompt batches concurrently and merge them, dropping duplicates.
+
+    With early_abort, the first PROMPTS_EARLY_CHECK_COUNT completed prompts across
+    all batches are rule-checked; once PROMPTS_EARLY_ABORT_VIOLATIONS of them break
+    the black-and-white rules every batch stops and the completed prompts are
+    returned as an _AbortedPrompts carrying the offending prompts.
+    """
+    chain = _generator_chain(INTERIOR_PROMPTS_PROMPT, JsonOutputParser)
+    stop = asyncio.Event()
+    checked = 0
+    violations = []
+
+    async def run(inputs: dict) -> list:
+        nonlocal checked
+        key_parts = _llm_key(INTERIOR_PROMPTS_PROMPT, inputs, variant)
+        cached = llm_cache.lookup(key_parts)
+        if cached is not None:
+            return cached
+        prompts = []
+        seen = 0
+        async for partial in chain.astream(inputs):
+            if stop.is_set():
+                return prompts[:-1]
+            if not isinstance(partial, list):
+                continue
+            prompts = partial
+            if early_abort and checked < PROMPTS_EARLY_CHECK_COUNT:
+                # The last element may still be streaming; the ones before it are complete
+                for p in partial[seen:len(partial) - 1]:
+                    if checked >= PROMPTS_EARLY_CHECK_COUNT:
+                        break
+                    checked += 1
+                    if not isinstance(p, str) or prompt_breaks_bw_rules(p):
+                        violations.append(p)
+                seen = max(seen, len(partial) - 1)
+                if len(violations) >= PROMPTS_EARLY_ABORT_VIOLATIONS:
+                    logger.info("      ⏹️ Stopped early: %d/%d of the first prompts break the B&W rules", len(violations), checked)
+                    stop.set()
+                    return partial[:-1]
+        # Only complete batches are cached
+        llm_cache.store(key_parts, prompts)
+        return prompts
+
+    batches = await asyncio.gather(*(run(inputs) for inputs in batch_inputs))
+    prompts = _dedupe_prompts([p for batch in batches for p in batch])[:INTERIOR_PROMPTS_MAX]
+    if stop.is_set():
+        return _AbortedPrompts(prompts, violations)
+    return prompts
+
+
+async def _aevaluate_generated_prompts(prompts: list, theme_context: dict = None) -> dict:
+    """Judge generated prompts; an early-aborted set gets its abort verdict without the LLM judge."""
+    if isinstance(prompts, _AbortedPrompts):
+        return prompts_abort_verdict(prompts, prompts.violations)
+    # theme_context lets the evaluator check main-theme consistency
+    return await aevaluate_prompts(prompts, theme_context=theme_context)
+
+
+def _prompt_batch_inputs(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> list:
+    """Template inputs for INTERIOR_PROMPTS_PROMPT, one dict per batch."""
+    inputs = dict(_EMPTY_SECTIONS, description=description)
+    if feedback:
+        inputs["feedback_section"] = _FEEDBACK_SECTION.format_map({"feedback": feedback})
+    
+    # Build custom instructions section
+    if custom_instructions:
+        inputs["custom_section"] = _CUSTOM_SECTION.format_map({
+            "custom_instructions": custom_instructions,
+            "apply_hint": "Apply these instructions when creating the prompts!",
+        })
     
     # Derive main theme (primary subject) for anchor—e.g. "Highland cows", "Easter", "dogs"
     main_theme = ""
@@ -484,9 +998,8 @@ Apply these instructions when creating the prompts!
         if not main_theme and theme_context.get("expanded_theme"):
             main_theme = (theme_context["expanded_theme"] or "").split(" in ")[0].strip()
 
-    main_theme_section = ""
     if main_theme:
-        main_theme_section = f"""
+        inputs["main_theme_section"] = f"""
 ## MAIN THEME (PRIMARY — MUST APPLY TO EVERY PROMPT):
 **{main_theme}**
 
@@ -498,112 +1011,102 @@ Apply these instructions when creating the prompts!
 """
 
     # Build artistic style guidance (secondary: how it looks)
-    style_section = ""
     if theme_context:
         artistic_style = theme_context.get('artistic_style', '')
         signature_artist = theme_context.get('signature_artist', '')
         style_keywords = theme_context.get('style_keywords', [])
         visual_elements = theme_context.get('visual_elements', [])
-        page_ideas = theme_context.get('page_ideas', [])
         
-        style_section = f"""
+        inputs["style_section"] = f"""
 ## ARTISTIC STYLE DIRECTION (how to draw — secondary to main theme):
 - **Style**: {artistic_style}
 - **Artist Inspiration**: {signature_artist}
-- **Style Keywords to Include**: {', '.join(style_keywords)}
-- **Visual Elements**: {', '.join(visual_elements)}
-- **Page Ideas**: {', '.join(page_ideas)}
+- **Style Keywords to Include**: {_join_capped(style_keywords)}
+- **Visual Elements**: {_join_capped(visual_elements)}
+- **Page Ideas**: assigned per batch below
 
 EVERY prompt should reflect this artistic style in the keywords, but the SUBJECT must always tie back to the MAIN THEME above.
 """
     
-    prompt = ChatPromptTemplate.from_template("""
-You are an expert at creating MidJourney prompts for coloring book designs in a SPECIFIC artistic style.
+    num_batches = -(-INTERIOR_PROMPTS_TOTAL // INTERIOR_PROMPTS_BATCH_SIZE)
+    counts = [INTERIOR_PROMPTS_BATCH_SIZE] * (num_batches - 1)
+    counts.append(INTERIOR_PROMPTS_TOTAL - sum(counts))
+    return [
+        {**inputs, "batch_section": batch_section, "prompt_count": count}
+        for count, batch_section in zip(counts, _prompt_batch_sections(theme_context, num_batches))
+    ]
 
-## BOOK DESCRIPTION:
-{description}
-{main_theme_section}
-{style_section}
-{custom_section}
-{feedback_section}
+
+async def _agenerate_prompts_internal(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "", early_abort: bool = False, variant: int = 0) -> list:
+    """
+    Generate MidJourney prompts influenced by theme and artistic style.
+
+    The INTERIOR_PROMPTS_TOTAL prompts are requested as parallel batches of
+    INTERIOR_PROMPTS_BATCH_SIZE, each focused on a different slice of the book.
+    Responses are streamed; with early_abort, generation stops once the first
+    PROMPTS_EARLY_CHECK_COUNT completed prompts show too many black-and-white rule
+    violations, and the prompts completed so far are returned as an _AbortedPrompts
+    naming the offending prompts (judged by prompts_abort_verdict, never kept as final).
+    `variant` (the refine attempt index) separates the cache entries of retries
+    with unchanged feedback.
+    """
+    batch_inputs = _prompt_batch_inputs(description, feedback, theme_context, custom_instructions)
+    return await _agenerate_prompt_batches(batch_inputs, early_abort, variant)
+
+
+def _generate_prompts_internal(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "", early_abort: bool = False) -> list:
+    """Sync wrapper around :func:`_agenerate_prompts_internal`."""
+    return run_sync(_agenerate_prompts_internal(description, feedback, theme_context, custom_instructions, early_abort))
+
+
+COVER_PROMPTS_PROMPT = """
+You are an expert at creating MidJourney prompts for BOOK COVER BACKGROUND images. These are full-color illustrated backgrounds; the user will add the book title in another tool. No text or title in the image.
 
 ## PROMPT FORMAT:
-Create approximately 50 prompts (target 48–55). Each prompt MUST follow this EXACT format:
+Create exactly {cover_count} prompts. Each prompt MUST follow this format:
 
-"[subject], [style keywords], [details], [art style], coloring book page, clean and simple line art, black and white --no color --ar 1:1"
+"[theme/subject], [style keywords], book cover, [details], rich colors, illustrated, no text, no letters, no words --ar 2:1"
 
 ## CRITICAL RULES:
-1. Approximately 50 prompts (e.g. 48–55); quality and theme consistency matter more than exact count.
-2. Keywords ONLY - NO sentences or phrases
-3. Each keyword is 1-3 words max
-4. MUST include "coloring book page" in every prompt
-5. MUST include "clean and simple line art" in every prompt
-6. MUST include "black and white" in every prompt
-7. MUST end with "--no color --ar 1:1"
-8. EVERY prompt must center on the MAIN THEME (primary subject) when specified above; do not drift into generic style-only prompts.
-9. EVERY prompt must include the ARTISTIC STYLE in the keywords (how it's drawn).
-10. NEVER include color-related keywords - these are black and white line art pages. Banned: red, blue, green, yellow, orange, purple, pink, vibrant, colorful, colourful, pastel, hue, multicolored, rainbow, golden, silver, crimson, azure, etc.
-
-## GOOD (exact main theme + style): Highland cow, Celtic knot border, floral wreath, coloring book page, clean and simple line art, black and white --no color --ar 1:1
-## BAD (generic subject when theme is specific): cow, Celtic knot border... — use "highland cow" when main theme is "Highland cows", not "cow"
-## BAD (style only, no main theme): Celtic knot, mandala, decorative border, coloring book page... — missing the main subject
+1. EXACTLY {cover_count} prompts.
+2. Keywords ONLY - NO sentences.
+3. MUST include "book cover" or "cover art" or "cover design" in every prompt.
+4. MUST include "no text" or "no words" or "no letters" so the image has no title/text.
+5. MUST end with "--ar 2:1" (landscape book cover ratio).
+6. MUST imply full color (e.g. "rich colors", "illustrated", "full color"). Do NOT use "black and white" or "--no color".
+7. Do NOT include: "coloring book page", "clean and simple line art", "black and white" — those are for inside pages only.
+8. Match the book theme and artistic style below so the cover fits the inside pages.
 
-## BAD PROMPTS (DO NOT DO THIS):
-"A beautiful owl sitting majestically in an enchanted forest" - TOO WORDY, uses banned words, no style keywords
-"owl, vibrant feathers, red flowers, blue sky, coloring book page..." - CONTAINS COLOR WORDS (vibrant, red, blue) - forbidden for black and white line art
+## GOOD: forest animals, art nouveau border, book cover, decorative frame, rich colors, illustrated, no text --ar 2:1
+## BAD: owl, coloring book page, clean and simple line art, black and white --no color --ar 1:1 (that is for inside pages)
 
-Return a JSON array with approximately 50 prompts. No markdown, just the array.""")
+## BOOK DESCRIPTION:
+{description}
+{style_section}
+{custom_section}
+{feedback_section}
 
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({
-        "description": description,
-        "main_theme_section": main_theme_section,
-        "style_section": style_section,
-        "custom_section": custom_section,
-        "feedback_section": feedback_section
-    })
-    
-    try:
-        result = result.strip()
-        if result.startswith("```json"):
-            result = result[7:]
-        if result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        return json.loads(result.strip())
-    except json.JSONDecodeError:
-        return []
+Return exactly {cover_count} prompts."""
 
 
-def _generate_cover_prompts_internal(
+def _cover_prompts_inputs(
     description: str,
     feedback: str = "",
     theme_context: dict = None,
     custom_instructions: str = "",
-) -> list:
-    """Internal function to generate MidJourney prompts for book cover backgrounds (full color, no text)."""
-    llm = get_llm()
-
-    feedback_section = ""
+) -> dict:
+    """Template inputs for COVER_PROMPTS_PROMPT."""
+    inputs = dict(_EMPTY_SECTIONS, description=description, cover_count=COVER_PROMPTS_COUNT)
     if feedback:
-        feedback_section = f"""
+        inputs["feedback_section"] = _FEEDBACK_SECTION.format_map({"feedback": feedback})
 
-IMPORTANT - Previous attempt had issues. Fix these problems:
-{feedback}
-"""
-
-    custom_section = ""
     if custom_instructions:
-        custom_section = f"""
-## USER'S SPECIAL INSTRUCTIONS (MUST FOLLOW):
-{custom_instructions}
-
-Apply these when creating the cover prompts!
-"""
+        inputs["custom_section"] = _CUSTOM_SECTION.format_map({
+            "custom_instructions": custom_instructions,
+            "apply_hint": "Apply these when creating the cover prompts!",
+        })
 
     main_theme = ""
-    style_section = ""
     if theme_context:
         main_theme = theme_context.get("main_theme") or ""
         if not main_theme and theme_context.get("original_input"):
@@ -613,117 +1116,58 @@ Apply these when creating the cover prompts!
         artistic_style = theme_context.get("artistic_style", "")
         style_keywords = theme_context.get("style_keywords", [])
         visual_elements = theme_context.get("visual_elements", [])
-        style_section = f"""
+        inputs["style_section"] = f"""
 ## THEME & STYLE (match the inside pages):
 - **Main theme (use EXACT subject—do not generalize):** {main_theme}
   - Every cover prompt must feature this exact subject (e.g. if "Highland cows", use "highland cow" or "Highland cows", NOT just "cow").
 - **Artistic style**: {artistic_style}
-- **Style keywords**: {', '.join(style_keywords)}
-- **Visual elements**: {', '.join(visual_elements)}
+- **Style keywords**: {_join_capped(style_keywords)}
+- **Visual elements**: {_join_capped(visual_elements)}
 """
+    return inputs
 
-    prompt = ChatPromptTemplate.from_template("""
-You are an expert at creating MidJourney prompts for BOOK COVER BACKGROUND images. These are full-color illustrated backgrounds; the user will add the book title in another tool. No text or title in the image.
-
-## BOOK DESCRIPTION:
-{description}
-{style_section}
-{custom_section}
-{feedback_section}
-
-## PROMPT FORMAT:
-Create exactly {cover_count} prompts. Each prompt MUST follow this format:
-
-"[theme/subject], [style keywords], book cover, [details], rich colors, illustrated, no text, no letters, no words --ar 2:1"
 
-## CRITICAL RULES:
-1. EXACTLY {cover_count} prompts.
-2. Keywords ONLY - NO sentences.
-3. MUST include "book cover" or "cover art" or "cover design" in every prompt.
-4. MUST include "no text" or "no words" or "no letters" so the image has no title/text.
-5. MUST end with "--ar 2:1" (landscape book cover ratio).
-6. MUST imply full color (e.g. "rich colors", "illustrated", "full color"). Do NOT use "black and white" or "--no color".
-7. Do NOT include: "coloring book page", "clean and simple line art", "black and white" — those are for inside pages only.
-8. Match the book theme and artistic style above so the cover fits the inside pages.
+def _generate_cover_prompts_internal(
+    description: str,
+    feedback: str = "",
+    theme_context: dict = None,
+    custom_instructions: str = "",
+) -> list:
+    """Internal function to generate MidJourney prompts for book cover backgrounds (full color, no text)."""
+    inputs = _cover_prompts_inputs(description, feedback, theme_context, custom_instructions)
+    chain = _structured_chain(COVER_PROMPTS_PROMPT, CoverPromptsList)
+    try:
+        return llm_cache.cached_call(
+            _llm_key(COVER_PROMPTS_PROMPT, inputs),
+            lambda: chain.invoke(inputs).prompts,
+        )
+    except ValueError:
+        return []
 
-## GOOD: forest animals, art nouveau border, book cover, decorative frame, rich colors, illustrated, no text --ar 2:1
-## BAD: owl, coloring book page, clean and simple line art, black and white --no color --ar 1:1 (that is for inside pages)
 
-Return a JSON array with exactly {cover_count} prompts. No markdown, just the array.""")
+async def _agenerate_cover_prompts_internal(
+    description: str,
+    feedback: str = "",
+    theme_context: dict = None,
+    custom_instructions: str = "",
+    variant: int = 0,
+) -> list:
+    """Async variant of :func:`_generate_cover_prompts_internal`; `variant` is the refine attempt index."""
+    inputs = _cover_prompts_inputs(description, feedback, theme_context, custom_instructions)
+    chain = _structured_chain(COVER_PROMPTS_PROMPT, CoverPromptsList)
 
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({
-        "description": description,
-        "style_section": style_section,
-        "custom_section": custom_section,
-        "feedback_section": feedback_section,
-        "cover_count": COVER_PROMPTS_COUNT,
-    })
+    async def generate() -> list:
+        return (await chain.ainvoke(inputs)).prompts
 
     try:
-        result = result.strip()
-        if result.startswith("```json"):
-            result = result[7:]
-        if result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        return json.loads(result.strip())
-    except json.JSONDecodeError:
+        return await llm_cache.acached_call(_llm_key(COVER_PROMPTS_PROMPT, inputs, variant), generate)
+    except ValueError:
         return []
 
 
-def _generate_keywords_internal(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> list:
-    """Internal function to generate SEO keywords influenced by theme and artistic style."""
-    llm = get_llm()
-    
-    feedback_section = ""
-    if feedback:
-        feedback_section = f"""
-
-IMPORTANT - Previous attempt had issues. Fix these problems:
-{feedback}
-"""
-    
-    # Build custom instructions section
-    custom_section = ""
-    if custom_instructions:
-        custom_section = f"""
-## USER'S SPECIAL INSTRUCTIONS (MUST FOLLOW):
-{custom_instructions}
-
-Apply these instructions when selecting keywords!
-"""
-    
-    # Build theme-specific keyword guidance
-    theme_section = ""
-    if theme_context:
-        artistic_style = theme_context.get('artistic_style', '')
-        signature_artist = theme_context.get('signature_artist', '')
-        unique_angle = theme_context.get('unique_angle', '')
-        style_keywords = theme_context.get('style_keywords', [])
-        target_audience = theme_context.get('target_audience', '')
-        
-        theme_section = f"""
-## THEME & STYLE CONTEXT:
-- **Artistic Style**: {artistic_style}
-- **Artist Inspiration**: {signature_artist}
-- **Unique Angle**: {unique_angle}
-- **Target Audience**: {target_audience}
-- **Style Keywords**: {', '.join(style_keywords)}
-
-Include keywords that capture both the THEME and the ARTISTIC STYLE!
-"""
-    
-    prompt = ChatPromptTemplate.from_template("""
+KEYWORDS_PROMPT = """
 You are an SEO expert specializing in coloring book marketing on Amazon.
 
-## BOOK DESCRIPTION:
-{description}
-{theme_section}
-{custom_section}
-{feedback_section}
-
 ## TASK:
 Generate EXACTLY 10 SEO keywords that capture both the THEME and ARTISTIC STYLE.
 
@@ -751,26 +1195,73 @@ Generate EXACTLY 10 SEO keywords that capture both the THEME and ARTISTIC STYLE.
 - "book" (too generic)
 - "beautiful artistic creative coloring experience" (not a real search term)
 
-Return a JSON array with exactly 10 keywords. No markdown, just the array.""")
+## BOOK DESCRIPTION:
+{description}
+{theme_section}
+{custom_section}
+{feedback_section}
+
+Return exactly 10 keywords."""
+
+
+def _keywords_inputs(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """Template inputs for KEYWORDS_PROMPT."""
+    inputs = dict(_EMPTY_SECTIONS, description=description)
+    if feedback:
+        inputs["feedback_section"] = _FEEDBACK_SECTION.format_map({"feedback": feedback})
     
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({
-        "description": description,
-        "theme_section": theme_section,
-        "custom_section": custom_section,
-        "feedback_section": feedback_section
-    })
+    # Build custom instructions section
+    if custom_instructions:
+        inputs["custom_section"] = _CUSTOM_SECTION.format_map({
+            "custom_instructions": custom_instructions,
+            "apply_hint": "Apply these instructions when selecting keywords!",
+        })
     
+    # Build theme-specific keyword guidance
+    if theme_context:
+        artistic_style = theme_context.get('artistic_style', '')
+        signature_artist = theme_context.get('signature_artist', '')
+        unique_angle = theme_context.get('unique_angle', '')
+        style_keywords = theme_context.get('style_keywords', [])
+        target_audience = theme_context.get('target_audience', '')
+        
+        inputs["theme_section"] = f"""
+## THEME & STYLE CONTEXT:
+- **Artistic Style**: {artistic_style}
+- **Artist Inspiration**: {signature_artist}
+- **Unique Angle**: {unique_angle}
+- **Target Audience**: {target_audience}
+- **Style Keywords**: {_join_capped(style_keywords)}
+
+Include keywords that capture both the THEME and the ARTISTIC STYLE!
+"""
+    return inputs
+
+
+def _generate_keywords_internal(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "") -> list:
+    """Internal function to generate SEO keywords influenced by theme and artistic style."""
+    inputs = _keywords_inputs(description, feedback, theme_context, custom_instructions)
+    chain = _structured_chain(KEYWORDS_PROMPT, KeywordsList)
     try:
-        result = result.strip()
-        if result.startswith("```json"):
-            result = result[7:]
-        if result.startswith("```"):
-            result = result[3:]
-        if result.endswith("```"):
-            result = result[:-3]
-        return json.loads(result.strip())
-    except json.JSONDecodeError:
+        return llm_cache.cached_call(
+            _llm_key(KEYWORDS_PROMPT, inputs),
+            lambda: chain.invoke(inputs).keywords,
+        )
+    except ValueError:
+        return []
+
+
+async def _agenerate_keywords_internal(description: str, feedback: str = "", theme_context: dict = None, custom_instructions: str = "", variant: int = 0) -> list:
+    """Async variant of :func:`_generate_keywords_internal`; `variant` is the refine attempt index."""
+    inputs = _keywords_inputs(description, feedback, theme_context, custom_instructions)
+    chain = _structured_chain(KEYWORDS_PROMPT, KeywordsList)
+
+    async def generate() -> list:
+        return (await chain.ainvoke(inputs)).keywords
+
+    try:
+        return await llm_cache.acached_call(_llm_key(KEYWORDS_PROMPT, inputs, variant), generate)
+    except ValueError:
         return []
 
 
@@ -778,238 +1269,353 @@ Return a JSON array with exactly 10 keywords. No markdown, just the array.""")
 # GENERATE AND REFINE TOOLS (exposed as tools with evaluation loop)
 # =============================================================================
 
-@tool
-def generate_and_refine_title_description(user_input: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+def _retrieve_speculative_result(task: asyncio.Task) -> None:
+    """Done callback: mark a speculative task's exception as retrieved, even if nobody awaits it."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _start_speculative(attempt_num: int, feedback: str, generate, likely_valid: bool) -> tuple | None:
     """
-    Generate and refine a title and description with automatic quality evaluation.
-    Uses the theme context (artistic style, signature artist) to influence the output.
-    Attempts up to 5 times until quality score >= 80.
-    Each attempt builds on the BEST previous attempt.
-    
-    Args:
-        user_input: The user's description of the coloring book theme.
-        theme_context: Optional dict with expanded_theme, artistic_style, signature_artist, etc.
-        custom_instructions: Optional free text instructions from user (e.g., "make it more playful").
-        
-    Returns:
-        Dictionary with final_content and attempts history.
+    Start generating the next attempt with the current feedback while attempt
+    attempt_num is evaluated. Returns (feedback, task), or None on the last
+    attempt, when speculation is off, or when the feedback is likely to change.
+
+    The speculative result is only usable when the evaluated attempt does not
+    become the new best and the loop goes on, so callers pass likely_valid=False
+    on the first attempt, after an attempt that raised the best score (scores
+    tend to keep rising), and when one more stall would stop the loop.
     """
-    attempts = []
-    feedback = ""
-    best_attempt = None
-    best_score = -1
-    
-    for attempt_num in range(1, MAX_ATTEMPTS + 1):
-        print(f"   📝 Title/Description - Attempt {attempt_num}/{MAX_ATTEMPTS}")
-        
-        # Generate (with feedback from best attempt if available)
-        content = _generate_title_description_internal(user_input, feedback, theme_context, custom_instructions)
-        
-        # Evaluate
-        evaluation = evaluate_title_description(
-            content.get("title", ""),
-            content.get("description", "")
-        )
-        
-        score = evaluation.get("score", 0)
-        
-        # Record attempt
-        attempt_record = {
-            "attempt": attempt_num,
-            "content": content,
-            "evaluation": evaluation,
-            "feedback": feedback
-        }
-        attempts.append(attempt_record)
-        
-        # Track best attempt
-        if score > best_score:
-            best_score = score
-            best_attempt = attempt_record
-            print(f"      Score: {score}/100 ⭐ NEW BEST")
-        else:
-            print(f"      Score: {score}/100 (best: {best_score})")
-        
-        passed = evaluation.get("passed", False) or score >= PASS_THRESHOLD
-        
-        if passed:
-            print(f"      ✅ PASSED")
-            return {
-                "final_content": content,
-                "attempts": attempts,
-                "passed": True,
-                "final_score": score,
-                "attempts_needed": attempt_num
-            }
-        
-        # Prepare feedback for next attempt - BUILD ON BEST ATTEMPT
-        feedback = format_feedback(best_attempt["evaluation"], "Title & Description")
-        # Include the best content so far for the LLM to improve upon
-        feedback += f"\n\n📋 BEST ATTEMPT SO FAR (score {best_score}/100) - IMPROVE THIS:\n"
-        feedback += f"Title: {best_attempt['content'].get('title', '')}\n"
-        feedback += f"Description excerpt: {best_attempt['content'].get('description', '')[:200]}..."
-    
-    # Return BEST attempt if none passed
-    print(f"      ❌ Max attempts reached. Using best attempt (score: {best_score})")
-    return {
-        "final_content": best_attempt["content"],
-        "attempts": attempts,
-        "passed": False,
-        "final_score": best_score,
-        "attempts_needed": MAX_ATTEMPTS
-    }
+    if not REFINE_SPECULATIVE_NEXT or not likely_valid or attempt_num >= MAX_ATTEMPTS:
+        return None
+    task = asyncio.create_task(generate(feedback))
+    task.add_done_callback(_retrieve_speculative_result)
+    return feedback, task
 
 
-@tool
-def generate_and_refine_prompts(description: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+def _refine_stalled(stall_streak: int, attempt_num: int) -> bool:
     """
-    Generate and refine MidJourney prompts with automatic quality evaluation.
-    Uses the theme context (artistic style, visual elements) to influence the prompts.
-    Attempts up to 5 times until quality score >= 80.
-    Each attempt builds on the BEST previous attempt.
-    
-    Args:
-        description: The coloring book description to base prompts on.
-        theme_context: Optional dict with artistic_style, style_keywords, visual_elements, etc.
-        custom_instructions: Optional free text instructions from user (e.g., "add more fantasy elements").
-        
-    Returns:
-        Dictionary with final_content (list of prompts) and attempts history.
+    True once the best score has gained less than REFINE_MIN_GAIN points for
+    REFINE_EARLY_STOP_PATIENCE attempts in a row; further attempts rarely pass.
     """
-    attempts = []
-    feedback = ""
-    best_attempt = None
-    best_score = -1
-    
-    for attempt_num in range(1, MAX_ATTEMPTS + 1):
-        print(f"   🎨 MidJourney Prompts - Attempt {attempt_num}/{MAX_ATTEMPTS}")
-        
-        # Generate (with feedback from best attempt if available)
-        prompts = _generate_prompts_internal(description, feedback, theme_context, custom_instructions)
-        
-        # Evaluate (pass theme_context so evaluator can check main-theme consistency)
-        evaluation = evaluate_prompts(prompts, theme_context=theme_context)
-        
-        score = evaluation.get("score", 0)
-        
-        # Record attempt
-        attempt_record = {
-            "attempt": attempt_num,
-            "content": prompts,
-            "evaluation": evaluation,
-            "feedback": feedback
-        }
-        attempts.append(attempt_record)
-        
-        # Track best attempt
-        if score > best_score:
-            best_score = score
-            best_attempt = attempt_record
-            print(f"      Score: {score}/100, Count: {len(prompts)} ⭐ NEW BEST")
-        else:
-            print(f"      Score: {score}/100, Count: {len(prompts)} (best: {best_score})")
-        
-        passed = evaluation.get("passed", False) or score >= PASS_THRESHOLD
-        
-        if passed:
-            print(f"      ✅ PASSED")
-            return {
-                "final_content": prompts,
-                "attempts": attempts,
-                "passed": True,
-                "final_score": score,
-                "attempts_needed": attempt_num
-            }
-        
-        # Prepare feedback for next attempt - BUILD ON BEST ATTEMPT
-        feedback = format_feedback(best_attempt["evaluation"], "MidJourney Prompts")
-        # Include some of the best prompts for reference
-        best_prompts = best_attempt["content"]
-        if best_prompts:
-            feedback += f"\n\n📋 BEST PROMPTS SO FAR (score {best_score}/100) - USE AS REFERENCE:\n"
-            for i, p in enumerate(best_prompts[:5], 1):
-                feedback += f"{i}. {p}\n"
-            feedback += f"... and {len(best_prompts) - 5} more. Keep the good ones, fix the issues."
-    
-    # Return BEST attempt if none passed
-    print(f"      ❌ Max attempts reached. Using best attempt (score: {best_score})")
-    return {
-        "final_content": best_attempt["content"],
-        "attempts": attempts,
-        "passed": False,
-        "final_score": best_score,
-        "attempts_needed": MAX_ATTEMPTS
-    }
+    if stall_streak >= REFINE_EARLY_STOP_PATIENCE and attempt_num >= REFINE_MIN_ATTEMPTS:
+        logger.info("      ⏹️ No real improvement in %d attempts, stopping early", stall_streak)
+        return True
+    return False
 
 
-@tool
-def generate_and_refine_cover_prompts(description: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+def _cancel_speculative(speculative: tuple | None) -> None:
+    """Drop an unneeded speculative generation."""
+    if speculative is not None:
+        speculative[1].cancel()
+
+
+async def _next_candidate(speculative: tuple | None, feedback: str, generate):
     """
-    Generate and refine MidJourney prompts for book cover backgrounds (full color, no title text).
-    Uses theme context so cover matches the inside pages. Attempts up to 5 times until quality passes.
+    Reuse the speculative generation when it was started with the same feedback
+    (the evaluated attempt did not become the new best); otherwise cancel it and
+    generate with the new feedback.
+    """
+    if speculative is not None:
+        spec_feedback, task = speculative
+        if spec_feedback == feedback:
+            return await task
+        task.cancel()
+    return await generate(feedback)
 
-    Args:
-        description: The coloring book description to base cover prompts on.
-        theme_context: Optional dict with artistic_style, style_keywords, visual_elements, etc.
-        custom_instructions: Optional free text (e.g. "space for title at top").
+
+async def _refine_loop(label: str, component: str, generate, evaluate, feedback_tail, keep_attempts: bool = True, seed: dict = None) -> dict:
+    """
+    Generate, evaluate and retry until an attempt passes, the best score stalls,
+    or MAX_ATTEMPTS is reached. Each retry gets feedback built on the BEST
+    attempt so far; the next attempt is generated speculatively while the
+    current one is evaluated, unless the last attempt raised the best score.
+    Attempts judged "truncated" (generation stopped early) are never chosen
+    as best; their issues are put in front of the next attempt's feedback.
+
+    Args:
+        label: Progress label, e.g. "📝 Title/Description".
+        component: Component name for format_feedback.
+        generate: async (feedback, attempt_num) -> content.
+        evaluate: async (content) -> evaluation dict.
+        feedback_tail: (best_content, best_score) -> text appended to the feedback.
+        keep_attempts: Keep every attempt record for display. When False only the
+            best attempt is held, and "attempts" contains just the returned one.
+        seed: An attempt record judged before the loop (e.g. from the combined
+            generation). It is the best so far, so attempt 1 already gets its
+            feedback; it is not added to "attempts".
 
     Returns:
-        Dictionary with final_content (list of cover prompts) and attempts history.
+        Dictionary with final_content, attempts, passed, final_score and attempts_needed.
     """
     attempts = []
+    attempts_run = 0
     feedback = ""
+    feedback_for = None
     best_attempt = None
     best_score = -1
+    speculative = None
+    stall_streak = 0
+    improved = True
+    last_attempt = None
+    if seed is not None:
+        best_attempt = feedback_for = seed
+        best_score = seed["evaluation"].get("score", 0)
+        feedback = "".join((format_feedback(seed["evaluation"], component), feedback_tail(seed["content"], best_score)))
 
     for attempt_num in range(1, MAX_ATTEMPTS + 1):
-        print(f"   📖 Cover Prompts - Attempt {attempt_num}/{MAX_ATTEMPTS}")
-
-        prompts = _generate_cover_prompts_internal(description, feedback, theme_context, custom_instructions)
-        evaluation = evaluate_cover_prompts(prompts, theme_context=theme_context)
+        logger.info("   %s - Attempt %d/%d", label, attempt_num, MAX_ATTEMPTS)
 
+        # Generate (with feedback from best attempt if available)
+        content = await _next_candidate(speculative, feedback, lambda fb: generate(fb, attempt_num))
+
+        # Evaluate, generating the next attempt meanwhile when the feedback is likely to stay current
+        speculative = _start_speculative(
+            attempt_num, feedback, lambda fb: generate(fb, attempt_num + 1),
+            likely_valid=(
+                best_attempt is not None and not improved
+                # a non-improving attempt must not end the loop, or the speculative result goes unused
+                and (stall_streak + 1 < REFINE_EARLY_STOP_PATIENCE or attempt_num < REFINE_MIN_ATTEMPTS)
+            ),
+        )
+        evaluation = await evaluate(content)
         score = evaluation.get("score", 0)
+
         attempt_record = {
             "attempt": attempt_num,
-            "content": prompts,
+            "content": content,
             "evaluation": evaluation,
             "feedback": feedback,
         }
-        attempts.append(attempt_record)
+        attempts_run = attempt_num
+        if keep_attempts:
+            attempts.append(attempt_record)
+
+        # A truncated attempt (generation stopped early) is never kept as best and
+        # does not count as a stall; its issues lead the next attempt's feedback
+        if evaluation.get("truncated"):
+            logger.info("      Score: %s/100 (truncated, best: %s)", score, best_score)
+            _cancel_speculative(speculative)
+            speculative = None
+            feedback = format_feedback(evaluation, component)
+            if best_attempt is not None:
+                feedback += "".join((
+                    format_feedback(best_attempt["evaluation"], component),
+                    feedback_tail(best_attempt["content"], best_score),
+                ))
+            feedback_for = last_attempt = attempt_record
+            improved = True  # the feedback changes again after the next attempt; don't speculate on it
+            continue
 
-        if score > best_score:
+        # Track best attempt
+        count = "" if isinstance(content, dict) else f", Count: {len(content)}"
+        gain = score - best_score
+        improved = score > best_score
+        if improved:
             best_score = score
             best_attempt = attempt_record
-            print(f"      Score: {score}/100, Count: {len(prompts)} ⭐ NEW BEST")
+            logger.info("      Score: %s/100%s ⭐ NEW BEST", score, count)
         else:
-            print(f"      Score: {score}/100, Count: {len(prompts)} (best: {best_score})")
+            logger.info("      Score: %s/100%s (best: %s)", score, count, best_score)
 
+        stall_streak = 0 if gain >= REFINE_MIN_GAIN else stall_streak + 1
         passed = evaluation.get("passed", False) or score >= PASS_THRESHOLD
+
         if passed:
-            print(f"      ✅ PASSED")
+            logger.info("      ✅ PASSED")
+            _cancel_speculative(speculative)
             return {
-                "final_content": prompts,
-                "attempts": attempts,
+                "final_content": content,
+                "attempts": attempts if keep_attempts else [attempt_record],
                 "passed": True,
                 "final_score": score,
                 "attempts_needed": attempt_num,
             }
 
-        feedback = format_feedback(best_attempt["evaluation"], "Cover Prompts")
-        if best_attempt["content"]:
-            feedback += f"\n\n📋 BEST COVER PROMPTS SO FAR (score {best_score}/100):\n"
-            for i, p in enumerate(best_attempt["content"][:5], 1):
-                feedback += f"{i}. {p}\n"
+        if _refine_stalled(stall_streak, attempt_num):
+            _cancel_speculative(speculative)
+            break
 
-    print(f"      ❌ Max attempts reached. Using best attempt (score: {best_score})")
+        # Prepare feedback for next attempt - BUILD ON BEST ATTEMPT
+        # (unchanged best -> the previous feedback string is still current)
+        if feedback_for is not best_attempt:
+            feedback = "".join((
+                format_feedback(best_attempt["evaluation"], component),
+                feedback_tail(best_attempt["content"], best_score),
+            ))
+            feedback_for = best_attempt
+
+    # Return BEST attempt if none passed (the last one if every attempt was truncated)
+    if best_attempt is None:
+        best_attempt, best_score = last_attempt, last_attempt["evaluation"].get("score", 0)
+    logger.info("      ❌ Stopped after %d attempts. Using best attempt (score: %s)", attempts_run, best_score)
     return {
         "final_content": best_attempt["content"],
-        "attempts": attempts,
+        "attempts": attempts if keep_attempts else [best_attempt],
         "passed": False,
         "final_score": best_score,
-        "attempts_needed": MAX_ATTEMPTS,
+        "attempts_needed": attempts_run,
     }
 
 
+def _title_description_feedback_tail(best: dict, best_score: int) -> str:
+    """Best title/description so far, for the LLM to improve upon."""
+    return "\n".join([
+        "",
+        "",
+        f"📋 BEST ATTEMPT SO FAR (score {best_score}/100) - IMPROVE THIS:",
+        f"Title: {best.get('title', '')}",
+        f"Description excerpt: {best.get('description', '')[:200]}...",
+    ])
+
+
+def _prompt_subject(prompt: str) -> str:
+    """The [subject] part of a MidJourney prompt (text before the first comma)."""
+    return str(prompt).split(",", 1)[0].strip()
+
+
+def _prompts_feedback_tail(best: list, best_score: int) -> str:
+    """Subjects of some of the best prompts so far, for reference."""
+    if not best:
+        return ""
+    # Only the subjects: the style keywords and suffix repeat the format rules above
+    lines = ["", "", f"📋 BEST PROMPTS SO FAR (score {best_score}/100) - SUBJECTS TO BUILD ON:"]
+    lines.extend(f"{i}. {_prompt_subject(p)}" for i, p in enumerate(best[:5], 1))
+    lines.append(f"... and {len(best) - 5} more. Keep the good ones, fix the issues.")
+    return "\n".join(lines)
+
+
+def _cover_prompts_feedback_tail(best: list, best_score: int) -> str:
+    """Subjects of some of the best cover prompts so far."""
+    if not best:
+        return ""
+    lines = ["", "", f"📋 BEST COVER PROMPTS SO FAR (score {best_score}/100) - SUBJECTS:"]
+    lines.extend(f"{i}. {_prompt_subject(p)}" for i, p in enumerate(best[:5], 1))
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _keywords_feedback_tail(best: list, best_score: int) -> str:
+    """The best keywords so far, to keep or replace."""
+    if not best:
+        return ""
+    return "\n".join([
+        "",
+        "",
+        f"📋 BEST KEYWORDS SO FAR (score {best_score}/100) - IMPROVE THESE:",
+        ", ".join(best),
+        "",
+        "Keep the good keywords, replace the weak ones.",
+    ])
+
+
+async def _arefine_title_description(user_input: str, theme_context: dict = None, custom_instructions: str = "", keep_attempts: bool = True, seed: dict = None) -> dict:
+    """Refine loop behind :func:`generate_and_refine_title_description`."""
+    return await _refine_loop(
+        "📝 Title/Description", "Title & Description",
+        lambda fb, attempt_num: _agenerate_title_description_internal(user_input, fb, theme_context, custom_instructions, variant=attempt_num - 1),
+        lambda content: aevaluate_title_description(content.get("title", ""), content.get("description", "")),
+        _title_description_feedback_tail,
+        keep_attempts=keep_attempts,
+        seed=seed,
+    )
+
+
+async def _arefine_prompts(description: str, theme_context: dict = None, custom_instructions: str = "", keep_attempts: bool = True, seed: dict = None) -> dict:
+    """Refine loop behind :func:`generate_and_refine_prompts`."""
+    return await _refine_loop(
+        "🎨 MidJourney Prompts", "MidJourney Prompts",
+        # Non-final attempts may stop streaming early when the first prompts clearly break the rules
+        lambda fb, attempt_num: _agenerate_prompts_internal(
+            description, fb, theme_context, custom_instructions,
+            early_abort=attempt_num < MAX_ATTEMPTS, variant=attempt_num - 1,
+        ),
+        lambda prompts: _aevaluate_generated_prompts(prompts, theme_context),
+        _prompts_feedback_tail,
+        keep_attempts=keep_attempts,
+        seed=seed,
+    )
+
+
+async def _arefine_cover_prompts(description: str, theme_context: dict = None, custom_instructions: str = "", keep_attempts: bool = True, seed: dict = None) -> dict:
+    """Refine loop behind :func:`generate_and_refine_cover_prompts`."""
+    return await _refine_loop(
+        "📖 Cover Prompts", "Cover Prompts",
+        lambda fb, attempt_num: _agenerate_cover_prompts_internal(description, fb, theme_context, custom_instructions, variant=attempt_num - 1),
+        lambda prompts: aevaluate_cover_prompts(prompts, theme_context=theme_context),
+        _cover_prompts_feedback_tail,
+        keep_attempts=keep_attempts,
+        seed=seed,
+    )
+
+
+async def _arefine_keywords(description: str, theme_context: dict = None, custom_instructions: str = "", keep_attempts: bool = True, seed: dict = None) -> dict:
+    """Refine loop behind :func:`generate_and_refine_keywords`."""
+    return await _refine_loop(
+        "🔍 SEO Keywords", "SEO Keywords",
+        lambda fb, attempt_num: _agenerate_keywords_internal(description, fb, theme_context, custom_instructions, variant=attempt_num - 1),
+        lambda keywords: aevaluate_keywords(keywords, description[:100]),
+        _keywords_feedback_tail,
+        keep_attempts=keep_attempts,
+        seed=seed,
+    )
+
+
+@tool
+def generate_and_refine_title_description(user_input: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """
+    Generate and refine a title and description with automatic quality evaluation.
+    Uses the theme context (artistic style, signature artist) to influence the output.
+    Attempts up to 5 times until quality score >= 80.
+    Each attempt builds on the BEST previous attempt.
+    
+    Args:
+        user_input: The user's description of the coloring book theme.
+        theme_context: Optional dict with expanded_theme, artistic_style, signature_artist, etc.
+        custom_instructions: Optional free text instructions from user (e.g., "make it more playful").
+        
+    Returns:
+        Dictionary with final_content and attempts history.
+    """
+    return run_sync(_arefine_title_description(user_input, theme_context, custom_instructions))
+
+
+@tool
+def generate_and_refine_prompts(description: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """
+    Generate and refine MidJourney prompts with automatic quality evaluation.
+    Uses the theme context (artistic style, visual elements) to influence the prompts.
+    Attempts up to 5 times until quality score >= 80.
+    Each attempt builds on the BEST previous attempt.
+    
+    Args:
+        description: The coloring book description to base prompts on.
+        theme_context: Optional dict with artistic_style, style_keywords, visual_elements, etc.
+        custom_instructions: Optional free text instructions from user (e.g., "add more fantasy elements").
+        
+    Returns:
+        Dictionary with final_content (list of prompts) and attempts history.
+    """
+    return run_sync(_arefine_prompts(description, theme_context, custom_instructions))
+
+
+@tool
+def generate_and_refine_cover_prompts(description: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """
+    Generate and refine MidJourney prompts for book cover backgrounds (full color, no title text).
+    Uses theme context so cover matches the inside pages. Attempts up to 5 times until quality passes.
+
+    Args:
+        description: The coloring book description to base cover prompts on.
+        theme_context: Optional dict with artistic_style, style_keywords, visual_elements, etc.
+        custom_instructions: Optional free text (e.g. "space for title at top").
+
+    Returns:
+        Dictionary with final_content (list of cover prompts) and attempts history.
+    """
+    return run_sync(_arefine_cover_prompts(description, theme_context, custom_instructions))
+
+
 @tool
 def generate_and_refine_keywords(description: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
     """
@@ -1026,89 +1632,327 @@ def generate_and_refine_keywords(description: str, theme_context: dict = None, c
     Returns:
         Dictionary with final_content (list of keywords) and attempts history.
     """
-    attempts = []
-    feedback = ""
-    best_attempt = None
-    best_score = -1
-    
-    for attempt_num in range(1, MAX_ATTEMPTS + 1):
-        print(f"   🔍 SEO Keywords - Attempt {attempt_num}/{MAX_ATTEMPTS}")
-        
-        # Generate (with feedback from best attempt if available)
-        keywords = _generate_keywords_internal(description, feedback, theme_context, custom_instructions)
-        
-        # Evaluate
-        evaluation = evaluate_keywords(keywords, description[:100])
-        
-        score = evaluation.get("score", 0)
-        
-        # Record attempt
-        attempt_record = {
-            "attempt": attempt_num,
-            "content": keywords,
-            "evaluation": evaluation,
-            "feedback": feedback
-        }
-        attempts.append(attempt_record)
-        
-        # Track best attempt
-        if score > best_score:
-            best_score = score
-            best_attempt = attempt_record
-            print(f"      Score: {score}/100, Count: {len(keywords)} ⭐ NEW BEST")
-        else:
-            print(f"      Score: {score}/100, Count: {len(keywords)} (best: {best_score})")
-        
-        passed = evaluation.get("passed", False) or score >= PASS_THRESHOLD
-        
-        if passed:
-            print(f"      ✅ PASSED")
-            return {
-                "final_content": keywords,
-                "attempts": attempts,
-                "passed": True,
-                "final_score": score,
-                "attempts_needed": attempt_num
-            }
-        
-        # Prepare feedback for next attempt - BUILD ON BEST ATTEMPT
-        feedback = format_feedback(best_attempt["evaluation"], "SEO Keywords")
-        # Include the best keywords for reference
-        best_keywords = best_attempt["content"]
-        if best_keywords:
-            feedback += f"\n\n📋 BEST KEYWORDS SO FAR (score {best_score}/100) - IMPROVE THESE:\n"
-            feedback += ", ".join(best_keywords)
-            feedback += "\n\nKeep the good keywords, replace the weak ones."
-    
-    # Return BEST attempt if none passed
-    print(f"      ❌ Max attempts reached. Using best attempt (score: {best_score})")
+    return run_sync(_arefine_keywords(description, theme_context, custom_instructions))
+
+
+# =============================================================================
+# COMBINED GENERATION (one LLM call for title, description, prompts, keywords)
+# =============================================================================
+
+GENERATE_ALL_PROMPT = """
+You are a professional coloring book designer, MidJourney prompt expert and Amazon SEO expert. Create the complete listing content for one coloring book in a single pass.
+
+## USER'S ORIGINAL REQUEST:
+{user_input}
+{theme_section}
+{custom_section}
+
+## 1. TITLE (max 60 characters)
+- Reflect the ARTISTIC STYLE and UNIQUE ANGLE; not generic like "Beautiful Coloring Book"
+- Include searchable keywords naturally
+
+## 2. DESCRIPTION (approximately 180-220 words)
+- Highlight the artistic style and its inspiration; match the mood
+- Write like a real Amazon seller, not an AI
+- MUST end with this exact section:
+
+{required_section}
+
+## 3. MIDJOURNEY PROMPTS (approximately 50, target 48-55)
+- Exact format: "[subject], [style keywords], [details], [art style], coloring book page, clean and simple line art, black and white --no color --ar 1:1"
+- Keywords only (1-3 words each), no sentences
+- Every prompt centers on the main theme subject and includes the artistic style
+- NEVER include color words (red, blue, vibrant, colorful, pastel, golden, etc.)
+
+## 4. SEO KEYWORDS (exactly 10)
+- 4-5 short-tail (1-2 words) and 5-6 long-tail (3+ words)
+- At least 2 mention the artistic style; no duplicates or near-duplicates
+- Terms people actually search for on Amazon
+
+## BANNED WORDS - DO NOT USE:
+{banned_words}
+
+## RESPONSE FORMAT (JSON object only):
+{{
+    "title": "...",
+    "description": "...",
+    "midjourney_prompts": ["...", "..."],
+    "keywords": ["...", "..."]
+}}
+
+Return ONLY the JSON object."""
+
+
+def _generate_all_internal(user_input: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """
+    Generate title, description, MidJourney prompts and keywords in one LLM call,
+    sharing the theme and instruction context instead of sending it four times.
+
+    Raises:
+        ValueError: when the response does not contain all four parts.
+    """
+    theme_section = ""
+    if theme_context:
+        theme_section = f"""
+## CREATIVE DIRECTION (from theme development):
+- **Main Theme**: {theme_context.get('main_theme') or theme_context.get('expanded_theme', user_input)}
+- **Theme**: {theme_context.get('expanded_theme', user_input)}
+- **Artistic Style**: {theme_context.get('artistic_style', 'Not specified')}
+- **Signature Artist Inspiration**: {theme_context.get('signature_artist', 'Not specified')}
+- **Unique Angle**: {theme_context.get('unique_angle', 'Not specified')}
+- **Target Audience**: {theme_context.get('target_audience', 'Adults')}
+- **Style Keywords**: {_join_capped(theme_context.get('style_keywords'))}
+- **Visual Elements**: {_join_capped(theme_context.get('visual_elements'))}
+- **Mood**: {_join_capped(theme_context.get('mood'))}
+"""
+    custom_section = ""
+    if custom_instructions:
+        custom_section = f"""
+## USER'S SPECIAL INSTRUCTIONS (MUST FOLLOW):
+{custom_instructions}
+"""
+    chain = _structured_chain(GENERATE_ALL_PROMPT, DesignBundle)
+    inputs = {
+        "user_input": user_input,
+        "theme_section": theme_section,
+        "custom_section": custom_section,
+        "required_section": REQUIRED_SECTION,
+        "banned_words": _BANNED_AI_WORDS_JOINED
+    }
+
+    def generate() -> dict:
+        content = chain.invoke(inputs).model_dump()
+        missing = [k for k in ("title", "description", "midjourney_prompts", "keywords") if not content.get(k)]
+        if missing:
+            raise ValueError(f"Combined generation missing: {', '.join(missing)}")
+        return content
+
+    return llm_cache.cached_call(_llm_key(GENERATE_ALL_PROMPT, inputs), generate)
+
+
+def _with_first_attempt(first_attempt: dict, refine_result: dict) -> dict:
+    """Prepend a combined-generation attempt to a refine loop's attempt history."""
+    attempts = [first_attempt] + [
+        {**a, "attempt": a.get("attempt", 0) + 1} for a in refine_result.get("attempts", [])
+    ]
     return {
-        "final_content": best_attempt["content"],
+        **refine_result,
         "attempts": attempts,
-        "passed": False,
-        "final_score": best_score,
-        "attempts_needed": MAX_ATTEMPTS
+        "attempts_needed": refine_result.get("attempts_needed", 0) + 1,
+    }
+
+
+async def generate_all_post_theme(
+    description: str,
+    theme_context: dict = None,
+    custom_instructions: str = "",
+    parts: tuple = ("prompts", "cover_prompts", "keywords"),
+    keep_attempts: bool = True,
+    seeds: dict = None,
+) -> dict:
+    """
+    Run the refine loops for the parts that only depend on the description and
+    theme context concurrently, at most POST_THEME_CONCURRENCY at a time.
+    keep_attempts=False keeps only each part's best attempt. seeds maps a part
+    to an already judged attempt its refine loop builds on (see _refine_loop).
+
+    Returns:
+        dict mapping each requested part to its generate_and_refine_* result
+    """
+    loops = {
+        "prompts": _arefine_prompts,
+        "cover_prompts": _arefine_cover_prompts,
+        "keywords": _arefine_keywords,
+    }
+    semaphore = asyncio.Semaphore(POST_THEME_CONCURRENCY)
+
+    async def run(name: str) -> dict:
+        async with semaphore:
+            return await loops[name](description, theme_context, custom_instructions, keep_attempts, (seeds or {}).get(name))
+
+    results = await asyncio.gather(*(run(name) for name in parts))
+    return dict(zip(parts, results))
+
+
+async def generate_all(
+    theme_context: dict,
+    description: str,
+    user_input: str,
+    custom_instructions: str = "",
+    keep_attempts: bool = True,
+) -> dict:
+    """
+    Run all four refine loops (title/description, prompts, cover prompts, keywords).
+
+    With an existing description the loops are independent and all four run
+    concurrently; without one the title loop runs first and its description
+    feeds the other three, which then run concurrently. keep_attempts=False
+    keeps only each part's best attempt (for callers that do not show history).
+
+    Returns:
+        dict with title_description, prompts, cover_prompts and keywords, each a
+        generate_and_refine_* result.
+    """
+    if not description:
+        title_result = await _arefine_title_description(user_input, theme_context, custom_instructions, keep_attempts)
+        description = title_result["final_content"].get("description", "")
+        return {
+            "title_description": title_result,
+            **await generate_all_post_theme(description, theme_context, custom_instructions, keep_attempts=keep_attempts),
+        }
+    title_result, rest = await asyncio.gather(
+        _arefine_title_description(user_input, theme_context, custom_instructions, keep_attempts),
+        generate_all_post_theme(description, theme_context, custom_instructions, keep_attempts=keep_attempts),
+    )
+    return {"title_description": title_result, **rest}
+
+
+async def generate_books_batch(books: list[dict], keep_attempts: bool = False) -> list[dict]:
+    """
+    Run generate_all for several books concurrently, at most
+    BOOK_BATCH_CONCURRENCY books at a time. Because every book's attempts are
+    in flight together, the retries of books that have not passed overlap
+    instead of waiting for the previous book to finish.
+
+    Args:
+        books: One dict per book with theme_context and user_input, and optionally
+            description and custom_instructions.
+        keep_attempts: Keep every attempt record (off by default for bulk runs).
+
+    Returns:
+        One generate_all result per book, in input order. A book that raised gets
+        {"error": "..."} instead, so one failure does not discard the batch.
+    """
+    semaphore = asyncio.Semaphore(BOOK_BATCH_CONCURRENCY)
+
+    async def run(book: dict) -> dict:
+        async with semaphore:
+            return await generate_all(
+                book.get("theme_context") or {},
+                book.get("description", ""),
+                book.get("user_input", ""),
+                book.get("custom_instructions", ""),
+                keep_attempts=keep_attempts,
+            )
+
+    results = await asyncio.gather(*(run(book) for book in books), return_exceptions=True)
+    return [
+        {"error": f"{type(r).__name__}: {r}"} if isinstance(r, Exception) else r
+        for r in results
+    ]
+
+
+def generate_design_bundle(user_input: str, theme_context: dict = None, custom_instructions: str = "") -> dict:
+    """
+    Generate title/description, MidJourney prompts and keywords with one combined
+    LLM call, judge the three parts in one fused evaluator call, and only run the per-task refine
+    loops for parts that did not pass; each such loop starts from the combined
+    attempt's verdict. Cover prompts and any failed prompts or keywords are then
+    refined concurrently. When refining replaces the description, the prompts and
+    keywords built on the old one are regenerated as well. If the combined call
+    fails, every part falls back to its refine loop.
+
+    Returns:
+        dict with title_description, prompts, cover_prompts and keywords, each
+        shaped like the matching generate_and_refine_* result (final_content,
+        attempts, passed, final_score, attempts_needed).
+    """
+    try:
+        content = _generate_all_internal(user_input, theme_context, custom_instructions)
+    except ValueError as e:
+        logger.warning("   ⚠️ Combined generation unusable (%s); generating parts separately", e)
+        return run_sync(generate_all(theme_context, "", user_input, custom_instructions))
+
+    title_content = {"title": content["title"], "description": content["description"]}
+    parts = {
+        "title_description": title_content,
+        "prompts": _dedupe_prompts(content["midjourney_prompts"]),
+        "keywords": content["keywords"],
     }
+    evaluations = evaluate_bundle({
+        "title_description": title_content,
+        "prompts": {"prompts": parts["prompts"], "theme_context": theme_context},
+        "keywords": {"keywords": parts["keywords"], "theme_hint": content["description"][:100]},
+    })
+
+    results = {}
+    for name, part in parts.items():
+        evaluation = evaluations[name]
+        score = evaluation.get("score", 0)
+        results[name] = {
+            "final_content": part,
+            "attempts": [{"attempt": 1, "content": part, "evaluation": evaluation, "feedback": ""}],
+            "passed": evaluation.get("passed", False) or score >= PASS_THRESHOLD,
+            "final_score": score,
+            "attempts_needed": 1,
+        }
+        logger.info("   📦 Combined %s: %s/100%s", name, score, " ✅" if results[name]["passed"] else "")
+
+    # Refine the title first since the other parts read the description
+    if not results["title_description"]["passed"]:
+        first = results["title_description"]["attempts"][0]
+        results["title_description"] = _with_first_attempt(
+            first,
+            run_sync(_arefine_title_description(user_input, theme_context, custom_instructions, seed=first)),
+        )
+    description = results["title_description"]["final_content"].get("description", "")
+    if description != content["description"]:
+        # The bundle's prompts and keywords were written (and the keywords judged) for the old description
+        pending, seeds = ("prompts", "keywords"), {}
+    else:
+        pending = tuple(name for name in ("prompts", "keywords") if not results[name]["passed"])
+        seeds = {name: results[name]["attempts"][0] for name in pending}
+    refined = run_sync(generate_all_post_theme(
+        description, theme_context, custom_instructions, parts=("cover_prompts",) + pending, seeds=seeds
+    ))
+    results["cover_prompts"] = refined["cover_prompts"]
+    for name in pending:
+        results[name] = _with_first_attempt(seeds[name], refined[name]) if name in seeds else refined[name]
+    return results
 
 
 # =============================================================================
-# REGENERATE FUNCTIONS (for rerun/regenerate - not exposed as tools)
+# BATCH EVALUATION (sync entrypoint - not exposed as a tool)
 # =============================================================================
 
-def regenerate_art_style(theme_context: dict, new_style_hint: str) -> dict:
+def evaluate_design_components(
+    title: str = "",
+    description: str = "",
+    prompts: list = None,
+    cover_prompts: list = None,
+    keywords: list = None,
+    theme_context: dict = None,
+) -> dict:
     """
-    Regenerate art style fields in theme_context with a new style hint.
-    Returns updated theme_context with artistic_style, style_keywords, etc. updated.
+    Judge the finished components of one design together.
 
-    Args:
-        theme_context: Current theme context from expanded_theme.
-        new_style_hint: User's new style suggestion (e.g., "Pop manga", "Asian ink wash").
+    The components are judged in one fused evaluator call (evaluate_bundle);
+    parts the fused response misses fall back to their own evaluator, run
+    concurrently. Components that are empty are skipped.
 
     Returns:
-        Updated theme_context dict with new style applied.
+        dict mapping component name (title_description, prompts, cover_prompts,
+        keywords) to its evaluation dict.
     """
-    llm = get_llm()
-    prompt = ChatPromptTemplate.from_template("""
+    components = {}
+    if title or description:
+        components["title_description"] = {"title": title, "description": description}
+    if prompts:
+        components["prompts"] = {"prompts": prompts, "theme_context": theme_context}
+    if cover_prompts:
+        components["cover_prompts"] = {"prompts": cover_prompts, "theme_context": theme_context}
+    if keywords:
+        components["keywords"] = {"keywords": keywords, "theme_hint": description[:100]}
+    if not components:
+        return {}
+    return evaluate_bundle(components)
+
+
+# =============================================================================
+# REGENERATE FUNCTIONS (for rerun/regenerate - not exposed as tools)
+# =============================================================================
+
+ART_STYLE_PROMPT = """
 Update the artistic style for this coloring book theme. Keep the theme/subject the same, only change the style.
 
 ## CURRENT THEME CONTEXT:
@@ -1131,32 +1975,44 @@ Update: artistic_style, style_description, signature_artist, style_keywords, vis
     "mood": ["mood1", "mood2"]
 }}
 
-Return ONLY the JSON object.""")
-    chain = prompt | llm | StrOutputParser()
+Return ONLY the JSON object."""
+
+
+def regenerate_art_style(theme_context: dict, new_style_hint: str) -> dict:
+    """
+    Regenerate art style fields in theme_context with a new style hint.
+    Returns updated theme_context with artistic_style, style_keywords, etc. updated.
+
+    Args:
+        theme_context: Current theme context from expanded_theme.
+        new_style_hint: User's new style suggestion (e.g., "Pop manga", "Asian ink wash").
+
+    Returns:
+        Updated theme_context dict with new style applied.
+    """
+    chain = _generator_chain(ART_STYLE_PROMPT)
     result = chain.invoke({
         "expanded_theme": theme_context.get("expanded_theme", ""),
         "artistic_style": theme_context.get("artistic_style", ""),
         "new_style_hint": new_style_hint,
     })
     try:
-        result = result.strip()
-        if result.startswith("```"):
-            result = result.split("```")[1]
-            if result.startswith("json"):
-                result = result[4:]
-        result = json.loads(result.strip())
+        parsed = _parse_json_tolerant(result)
+    except json.JSONDecodeError:
+        parsed = None
+    if isinstance(parsed, dict):
         updated = dict(theme_context)
-        for k, v in result.items():
+        for k, v in parsed.items():
             if v is not None:
                 updated[k] = v
         return updated
-    except json.JSONDecodeError:
-        updated = dict(theme_context)
-        updated["artistic_style"] = new_style_hint
-        sk = list(theme_context.get("style_keywords", []))
-        if new_style_hint not in sk:
-            updated["style_keywords"] = [new_style_hint] + sk[:4]
-        return updated
+    # Unusable response: apply the hint directly
+    updated = dict(theme_context)
+    updated["artistic_style"] = new_style_hint
+    sk = list(theme_context.get("style_keywords", []))
+    if new_style_hint not in sk:
+        updated["style_keywords"] = [new_style_hint] + sk[:4]
+    return updated
 
 
 def regenerate_title_description(theme_context: dict, user_input: str = "", custom_instructions: str = "") -> dict:
@@ -1219,6 +2075,51 @@ def regenerate_keywords(theme_context: dict, description: str, custom_instructio
     })
 
 
+async def aregenerate_parts(
+    theme_context: dict,
+    parts: list,
+    user_input: str = "",
+    description: str = "",
+    custom_instructions: str = "",
+) -> dict:
+    """
+    Regenerate several parts with as much overlap as their dependencies allow.
+
+    Title/description runs first when requested, since its new description feeds
+    the others; prompts, cover prompts and keywords then run concurrently.
+
+    Args:
+        theme_context: Theme context from expanded_theme.
+        parts: Any of "title", "prompts", "cover_prompts", "keywords".
+        user_input: Original user input/request (for the title).
+        description: Current book description, used when the title is not regenerated.
+        custom_instructions: Optional free text instructions.
+
+    Returns:
+        dict mapping each requested part to its generate_and_refine_* result.
+    """
+    results = {}
+    if "title" in parts:
+        ui = user_input or f"{theme_context.get('expanded_theme', '')} in {theme_context.get('artistic_style', '')} style"
+        results["title"] = await _arefine_title_description(ui, theme_context, custom_instructions)
+        description = results["title"]["final_content"].get("description", "") or description
+    post_parts = tuple(p for p in ("prompts", "cover_prompts", "keywords") if p in parts)
+    if post_parts:
+        results.update(await generate_all_post_theme(description, theme_context, custom_instructions, parts=post_parts))
+    return results
+
+
+def regenerate_parts(
+    theme_context: dict,
+    parts: list,
+    user_input: str = "",
+    description: str = "",
+    custom_instructions: str = "",
+) -> dict:
+    """Sync wrapper around :func:`aregenerate_parts`."""
+    return run_sync(aregenerate_parts(theme_context, parts, user_input, description, custom_instructions))
+
+
 # =============================================================================
 # LEGACY TOOLS (kept for backwards compatibility)
 # =============================================================================
@@ -1,12 +1,92 @@
 """Web search tools for trend research."""
 
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 from langchain_core.tools import tool
 
-try:
-    from duckduckgo_search import DDGS
-    DDGS_AVAILABLE = True
-except ImportError:
-    DDGS_AVAILABLE = False
+# duckduckgo_search (and its HTTP stack) is imported on the first search, not at
+# module import; find_spec only checks that it is installed
+DDGS_AVAILABLE = importlib.util.find_spec("duckduckgo_search") is not None
+
+
+# Idle DDGS clients kept for reuse so repeat searches skip a new HTTP session
+# (TCP/TLS handshake). A client is used by one thread at a time; clients that
+# raised, or that find the pool full, are closed instead of returned.
+DDGS_POOL_SIZE = 4
+_ddgs_pool: list = []
+_ddgs_pool_lock = threading.Lock()
+
+
+def _close_ddgs(client) -> None:
+    """Close a DDGS client's HTTP session, as leaving `with DDGS()` would."""
+    try:
+        client.__exit__(None, None, None)
+    except Exception:
+        pass
+
+
+@contextmanager
+def _ddgs_client():
+    """Borrow an idle DDGS client from the pool, creating one when none is free."""
+    with _ddgs_pool_lock:
+        client = _ddgs_pool.pop() if _ddgs_pool else None
+    if client is None:
+        from duckduckgo_search import DDGS
+        client = DDGS()
+    pooled = False
+    try:
+        yield client
+        # Only reached when the search succeeded, so a failed client is not reused
+        with _ddgs_pool_lock:
+            if len(_ddgs_pool) < DDGS_POOL_SIZE:
+                _ddgs_pool.append(client)
+                pooled = True
+    finally:
+        if not pooled:
+            _close_ddgs(client)
+
+
+# Formatted search results keyed by normalized query, so agent loops that
+# re-research the same topic do not hit DuckDuckGo again. Empty results are
+# kept briefly; errors are never cached.
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL_SECONDS = 6 * 3600
+TRENDS_CACHE_TTL_SECONDS = 24 * 3600
+EMPTY_RESULT_TTL_SECONDS = 300
+_search_cache: OrderedDict = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_get(key: tuple):
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del _search_cache[key]
+            return None
+        _search_cache.move_to_end(key)
+        return value
+
+
+def _search_cache_put(key: tuple, value: str, ttl: float) -> None:
+    with _search_cache_lock:
+        _search_cache[key] = (time.monotonic() + ttl, value)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search results."""
+    with _search_cache_lock:
+        _search_cache.clear()
 
 
 @tool
@@ -24,12 +104,19 @@ def web_search(query: str, max_results: int = 5) -> str:
     if not DDGS_AVAILABLE:
         return "Web search is not available. Please install duckduckgo-search: uv add duckduckgo-search"
     
+    key = ("text", " ".join(query.lower().split()), max_results)
+    cached = _search_cache_get(key)
+    if cached is not None:
+        return cached
+    
     try:
-        with DDGS() as ddgs:
+        with _ddgs_client() as ddgs:
             results = list(ddgs.text(query, max_results=max_results))
         
         if not results:
-            return f"No results found for: {query}"
+            no_results = f"No results found for: {query}"
+            _search_cache_put(key, no_results, EMPTY_RESULT_TTL_SECONDS)
+            return no_results
         
         formatted_results = []
         for i, result in enumerate(results, 1):
@@ -38,7 +125,9 @@ def web_search(query: str, max_results: int = 5) -> str:
             href = result.get("href", "")
             formatted_results.append(f"{i}. **{title}**\n   {body}\n   URL: {href}")
         
-        return "\n\n".join(formatted_results)
+        formatted = "\n\n".join(formatted_results)
+        _search_cache_put(key, formatted, SEARCH_CACHE_TTL_SECONDS)
+        return formatted
     
     except Exception as e:
         return f"Search error: {str(e)}"
@@ -55,26 +144,40 @@ def search_coloring_book_trends() -> str:
     if not DDGS_AVAILABLE:
         return "Web search is not available. Please install duckduckgo-search: uv add duckduckgo-search"
     
+    key = ("trends",)
+    cached = _search_cache_get(key)
+    if cached is not None:
+        return cached
+    
     queries = [
         "best selling coloring books 2024",
         "trending coloring book themes adults",
     ]
     
+    def run_query(query: str) -> list:
+        # Each thread borrows its own client; DDGS sessions are not shared across threads
+        with _ddgs_client() as ddgs:
+            return list(ddgs.text(query, max_results=3))
+    
     all_results = []
     
     try:
-        with DDGS() as ddgs:
-            for query in queries:
-                results = list(ddgs.text(query, max_results=3))
+        # Queries run concurrently; map keeps the results in query order
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            for results in pool.map(run_query, queries):
                 for result in results:
                     title = result.get("title", "No title")
                     body = result.get("body", "No description")
                     all_results.append(f"- **{title}**: {body}")
         
         if not all_results:
-            return "No trending information found."
+            no_results = "No trending information found."
+            _search_cache_put(key, no_results, EMPTY_RESULT_TTL_SECONDS)
+            return no_results
         
-        return "Current Coloring Book Trends:\n\n" + "\n\n".join(all_results)
+        trends = "Current Coloring Book Trends:\n\n" + "\n\n".join(all_results)
+        _search_cache_put(key, trends, TRENDS_CACHE_TTL_SECONDS)
+        return trends
     
     except Exception as e:
         return f"Search error: {str(e)}"
@@ -1,9 +1,20 @@
 """Design generation tab UI."""
 
 import streamlit as st
+import hashlib
 import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from core.persistence import (
     save_workflow_state,
     load_workflow_state,
@@ -11,22 +22,24 @@ from core.persistence import (
     delete_saved_state,
     create_design_package,
     save_design_package,
+    SAVED_STATES_DIR,
 )
 from features.design_generation.workflow import (
     run_coloring_book_agent,
     run_design_for_concept,
-    run_design_step_for_concept,
+    run_design_pipeline_for_concept,
     create_coloring_book_graph,
     rerun_design_with_modifications,
-    DESIGN_STEPS,
 )
-from features.design_generation.tools.content_tools import generate_concept_variations
+from features.design_generation.tools.content_tools import stream_concept_variations
 from features.design_generation.constants import (
     MAX_SELECTED_CONCEPTS,
     MIN_CONCEPT_VARIATIONS,
     MAX_CONCEPT_VARIATIONS,
 )
 
+_WORD_RE = re.compile(r"\S+")
+
 STEP_DISPLAY_NAMES = [
     "Building theme context from concept",
     "Generating title and description",
@@ -36,12 +49,24 @@ STEP_DISPLAY_NAMES = [
 ]
 
 
+def _state_digest(state: dict) -> str:
+    """Content hash of a workflow state, to detect saves that would write identical files."""
+    encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
 def _save_or_update_design_package(state: dict, name: str | None = None) -> str:
-    """Create or update design package. Returns package path."""
+    """
+    Create or update design package. Returns package path.
+    Updating a package with the same content it was last saved with is skipped.
+    """
     from core.persistence import _update_design_package_metadata
     pkg_path = state.get("design_package_path")
     if pkg_path and Path(pkg_path).exists():
-        _update_design_package_metadata(state, pkg_path)
+        digest = _state_digest(state)
+        if st.session_state.get("_last_saved_package") != (pkg_path, digest):
+            _update_design_package_metadata(state, pkg_path)
+            st.session_state["_last_saved_package"] = (pkg_path, digest)
         return pkg_path
     path = create_design_package(state, name=name)
     state["design_package_path"] = path
@@ -49,6 +74,67 @@ def _save_or_update_design_package(state: dict, name: str | None = None) -> str:
     return path
 
 
+# Identical regenerate requests (same design state and modifications, e.g. a double-click
+# or re-submitting the same instructions) reuse the earlier result instead of re-running the workflow
+@st.cache_data(ttl="30m", max_entries=64, show_spinner=False)
+def _cached_rerun(state: dict, mods: dict) -> dict:
+    """rerun_design_with_modifications, cached per (state, modifications)."""
+    return rerun_design_with_modifications(state, mods)
+
+
+@st.cache_data(ttl="30m", max_entries=64, show_spinner=False)
+def _cached_full_rerun(state: dict) -> dict:
+    """Full rerun from the state's concept, or from its user request when there is none."""
+    concept = state.get("concept_source") or state.get("concept")
+    if concept:
+        return run_design_for_concept(concept)
+    return run_coloring_book_agent(state.get("user_request", ""))
+
+
+# The legacy list parses every saved state file; reruns reuse it until the directory changes.
+# Overwriting a file in place keeps the directory mtime, so entries also expire after 30s.
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_saved_states_cached(dir_mtime_ns: int) -> list:
+    """list_saved_states, cached per saved-states directory mtime."""
+    return list_saved_states()
+
+
+def _saved_states_mtime() -> int:
+    try:
+        return SAVED_STATES_DIR.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_resource
+def _state_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for saved-state disk I/O that should not block the script thread."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="design-state-io")
+
+
+def _prewarm_legacy_loads(states: list) -> dict:
+    """
+    Start loading the listed saved states in the background so a Load click
+    only collects the result. Futures are kept per session, keyed by
+    (filepath, saved_at) so a re-saved file is loaded again.
+    """
+    futures = st.session_state.setdefault("_legacy_state_futures", {})
+    keys = {(s["filepath"], s["saved_at"]) for s in states}
+    for key in [k for k in futures if k not in keys]:
+        del futures[key]
+    for key in keys - futures.keys():
+        futures[key] = _state_executor().submit(load_workflow_state, key[0])
+    return futures
+
+
+SEVERITY_MARKERS = {"CRITICAL": "●", "MAJOR": "●", "MINOR": "○"}
+
+
+def _score_icon(score: int) -> str:
+    """Attempt label icon: passed, close, or far off."""
+    return "✓" if score >= 80 else "~" if score >= 60 else "✗"
+
+
 def render_attempt(attempt: dict, attempt_num: int, component_type: str, is_chosen: bool = False):
     """Render a single attempt with content and evaluation."""
     evaluation = attempt.get("evaluation", {})
@@ -57,12 +143,7 @@ def render_attempt(attempt: dict, attempt_num: int, component_type: str, is_chos
     score = evaluation.get("score", 0)
     passed = evaluation.get("passed", False) or score >= 80
 
-    if score >= 80:
-        icon = "✓"
-    elif score >= 60:
-        icon = "~"
-    else:
-        icon = "✗"
+    icon = _score_icon(score)
 
     label = f"Attempt {attempt_num} - {icon} Score: {score}/100"
     if is_chosen:
@@ -81,7 +162,7 @@ def render_attempt(attempt: dict, attempt_num: int, component_type: str, is_chos
                 st.info(f"{title} ({len(title)} chars)")
 
                 st.markdown("**Description:**")
-                word_count = len(desc.split()) if desc else 0
+                word_count = sum(1 for _ in _WORD_RE.finditer(desc)) if desc else 0
                 st.text_area("Description text", desc, height=150, disabled=True, label_visibility="collapsed", key=f"desc_{component_type}_{attempt_num}")
                 st.caption(f"Word count: {word_count}")
 
@@ -90,8 +171,7 @@ def render_attempt(attempt: dict, attempt_num: int, component_type: str, is_chos
                 st.markdown(f"**Interior (B&W) prompts generated:** {len(prompts)}")
 
                 if prompts:
-                    for i, p in enumerate(prompts[:3], 1):
-                        st.code(p, language="text")
+                    st.code("\n\n".join(prompts[:3]), language="text")
                     if len(prompts) > 3:
                         st.caption(f"... and {len(prompts) - 3} more prompts")
 
@@ -99,8 +179,7 @@ def render_attempt(attempt: dict, attempt_num: int, component_type: str, is_chos
                 prompts = content if isinstance(content, list) else []
                 st.markdown(f"**Cover (color) prompts generated:** {len(prompts)}")
                 if prompts:
-                    for i, p in enumerate(prompts[:3], 1):
-                        st.code(p, language="text")
+                    st.code("\n\n".join(prompts[:3]), language="text")
                     if len(prompts) > 3:
                         st.caption(f"... and {len(prompts) - 3} more")
 
@@ -127,17 +206,19 @@ def render_attempt(attempt: dict, attempt_num: int, component_type: str, is_chos
                 all_issues = evaluation.get("issues", [])
 
             if all_issues:
-                st.markdown("**Issues Found:**")
+                # One markdown element for all issues instead of one (or two) per issue
+                lines = ["**Issues Found:**"]
                 for issue in all_issues:
                     severity = issue.get("severity", "unknown").upper()
                     issue_text = issue.get("issue", "No description")
                     suggestion = issue.get("suggestion", "")
 
-                    severity_marker = {"CRITICAL": "●", "MAJOR": "●", "MINOR": "○"}.get(severity, "○")
+                    severity_marker = SEVERITY_MARKERS.get(severity, "○")
 
-                    st.markdown(f"{severity_marker} **[{severity}]** {issue_text}")
+                    lines.append(f"{severity_marker} **[{severity}]** {issue_text}")
                     if suggestion:
-                        st.markdown(f"   → *Fix: {suggestion}*")
+                        lines.append(f"   → *Fix: {suggestion}*")
+                st.markdown("\n\n".join(lines))
             else:
                 st.success("No issues found!")
 
@@ -158,12 +239,7 @@ def render_theme_attempt(attempt: dict, attempt_num: int, is_chosen: bool = Fals
     score = evaluation.get("score", 0)
     passed = evaluation.get("passed", False) or score >= 80
 
-    if score >= 80:
-        icon = "✓"
-    elif score >= 60:
-        icon = "~"
-    else:
-        icon = "✗"
+    icon = _score_icon(score)
 
     label = f"Attempt {attempt_num} - {icon} Creativity Score: {score}/100"
     if is_chosen:
@@ -230,110 +306,58 @@ def _render_generation_log(state: dict):
                 st.write(f"✓ {entry.get('message', '')}")
 
 
+# (state key prefix, metric label) for each progress column
+PROGRESS_COMPONENTS = (
+    ("theme", "Theme Expansion"),
+    ("title", "Title & Description"),
+    ("prompts", "Interior (B&W)"),
+    ("cover_prompts", "Cover (color)"),
+    ("keywords", "SEO Keywords"),
+)
+
+# Status -> (icon, label, delta color); "completed" is split by pass / low score
+STATUS_DISPLAY = {
+    "completed_pass": ("✓", "Completed", "normal"),
+    "completed_low": ("!", "Completed (Low Score)", "off"),
+    "in_progress": ("...", "In Progress", "normal"),
+    "failed": ("✗", "Failed", "inverse"),
+    "pending": ("○", "Pending", "off"),
+}
+
+
 def render_progress_overview(state: dict):
     """Render high-level progress overview with real-time status."""
     st.markdown("### Workflow Progress")
 
-    theme_status = state.get("theme_status", "pending")
-    title_status = state.get("title_status", "pending")
-    prompts_status = state.get("prompts_status", "pending")
-    cover_prompts_status = state.get("cover_prompts_status", "pending")
-    keywords_status = state.get("keywords_status", "pending")
-
-    def get_status_display(status: str, score: int = 0, passed: bool = False):
+    columns = st.columns(len(PROGRESS_COMPONENTS))
+    for col, (key, label) in zip(columns, PROGRESS_COMPONENTS):
+        status = state.get(f"{key}_status", "pending")
+        score = state.get(f"{key}_score", 0)
         if status == "completed":
-            if passed or score >= 80:
-                return "✓", "Completed", "normal"
-            else:
-                return "!", "Completed (Low Score)", "off"
-        elif status == "in_progress":
-            return "...", "In Progress", "normal"
-        elif status == "failed":
-            return "✗", "Failed", "inverse"
-        else:
-            return "○", "Pending", "off"
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        theme_icon, theme_label, theme_color = get_status_display(
-            theme_status,
-            state.get("theme_score", 0),
-            state.get("theme_passed", False)
-        )
-        st.metric(
-            "Theme Expansion",
-            f"{state.get('theme_score', 0)}/100",
-            delta=theme_label,
-            delta_color=theme_color
-        )
-        if theme_status == "in_progress":
-            st.progress(0.5)
-
-    with col2:
-        title_icon, title_label, title_color = get_status_display(
-            title_status,
-            state.get("title_score", 0),
-            state.get("title_passed", False)
-        )
-        st.metric(
-            "Title & Description",
-            f"{state.get('title_score', 0)}/100",
-            delta=title_label,
-            delta_color=title_color
-        )
-        if title_status == "in_progress":
-            st.progress(0.5)
-
-    with col3:
-        prompts_icon, prompts_label, prompts_color = get_status_display(
-            prompts_status,
-            state.get("prompts_score", 0),
-            state.get("prompts_passed", False)
-        )
-        st.metric(
-            "Interior (B&W)",
-            f"{state.get('prompts_score', 0)}/100",
-            delta=prompts_label,
-            delta_color=prompts_color
-        )
-        if prompts_status == "in_progress":
-            st.progress(0.5)
-
-    with col4:
-        cover_icon, cover_label, cover_color = get_status_display(
-            cover_prompts_status,
-            state.get("cover_prompts_score", 0),
-            state.get("cover_prompts_passed", False)
-        )
-        st.metric(
-            "Cover (color)",
-            f"{state.get('cover_prompts_score', 0)}/100",
-            delta=cover_label,
-            delta_color=cover_color
-        )
-        if cover_prompts_status == "in_progress":
-            st.progress(0.5)
-
-    with col5:
-        keywords_icon, keywords_label, keywords_color = get_status_display(
-            keywords_status,
-            state.get("keywords_score", 0),
-            state.get("keywords_passed", False)
-        )
-        st.metric(
-            "SEO Keywords",
-            f"{state.get('keywords_score', 0)}/100",
-            delta=keywords_label,
-            delta_color=keywords_color
-        )
-        if keywords_status == "in_progress":
-            st.progress(0.5)
-
-
-def render_final_results_compact(state: dict, key_prefix: str = ""):
-    """Render compact final results display with editable fields and rerun controls."""
-    st.markdown("### Generated Design Package")
+            status = "completed_pass" if state.get(f"{key}_passed", False) or score >= 80 else "completed_low"
+        _, status_label, status_color = STATUS_DISPLAY.get(status, STATUS_DISPLAY["pending"])
+        with col:
+            st.metric(label, f"{score}/100", delta=status_label, delta_color=status_color)
+            if status == "in_progress":
+                st.progress(0.5)
+
+
+# Regenerate choice -> (spinner text, parts to regenerate); None reruns the whole design from its concept
+REGENERATE_OPTIONS = {
+    "Title": ("Regenerating title & description...", ("title",)),
+    "Interior prompts": ("Regenerating interior (B&W) prompts...", ("prompts",)),
+    "Cover prompts": ("Regenerating cover (color) prompts...", ("cover_prompts",)),
+    "Keywords": ("Regenerating keywords...", ("keywords",)),
+    "All": ("Regenerating all...", ("title", "prompts", "cover_prompts", "keywords")),
+    "Full Rerun": ("Full rerun from concept...", None),
+}
+
+
+# Fragments: typing instructions or editing fields reruns only the control block, not the whole
+# results page; actions that change the design (regenerate, save) still call a full st.rerun()
+@st.fragment
+def _render_regenerate_controls(state: dict, key_prefix: str = ""):
+    """Regenerate expander: custom instructions plus a part selector and one run button."""
     with st.expander("Regenerate", expanded=False):
         st.caption("Modify and regenerate parts of this design.")
         
@@ -355,96 +379,44 @@ def render_final_results_compact(state: dict, key_prefix: str = ""):
             height=80
         )
         
-        # All buttons on the same line
-        col1, col2, col3, col4, col5, col6 = st.columns(6)
-        with col1:
-            if st.button("Title", key=f"{key_prefix}rerun_title_btn"):
-                with st.spinner("Regenerating title & description..."):
-                    try:
-                        mods = {"regenerate": ["title"]}
-                        if custom_instructions.strip():
-                            mods["custom_instructions"] = custom_instructions.strip()
-                        updated = rerun_design_with_modifications(state, mods)
-                        _save_or_update_design_package(updated)
-                        st.session_state.workflow_state = updated
-                        st.rerun()
-                    except Exception as e:
-                        st.error(str(e))
-        with col2:
-            if st.button("Interior prompts", key=f"{key_prefix}rerun_prompts_btn"):
-                with st.spinner("Regenerating interior (B&W) prompts..."):
-                    try:
-                        mods = {"regenerate": ["prompts"]}
-                        if custom_instructions.strip():
-                            mods["custom_instructions"] = custom_instructions.strip()
-                        updated = rerun_design_with_modifications(state, mods)
-                        _save_or_update_design_package(updated)
-                        st.session_state.workflow_state = updated
-                        st.rerun()
-                    except Exception as e:
-                        st.error(str(e))
-        with col3:
-            if st.button("Cover prompts", key=f"{key_prefix}rerun_cover_btn"):
-                with st.spinner("Regenerating cover (color) prompts..."):
-                    try:
-                        mods = {"regenerate": ["cover_prompts"]}
-                        if custom_instructions.strip():
-                            mods["custom_instructions"] = custom_instructions.strip()
-                        updated = rerun_design_with_modifications(state, mods)
-                        _save_or_update_design_package(updated)
-                        st.session_state.workflow_state = updated
-                        st.rerun()
-                    except Exception as e:
-                        st.error(str(e))
-        with col4:
-            if st.button("Keywords", key=f"{key_prefix}rerun_keywords_btn"):
-                with st.spinner("Regenerating keywords..."):
-                    try:
-                        mods = {"regenerate": ["keywords"]}
-                        if custom_instructions.strip():
-                            mods["custom_instructions"] = custom_instructions.strip()
-                        updated = rerun_design_with_modifications(state, mods)
-                        _save_or_update_design_package(updated)
-                        st.session_state.workflow_state = updated
-                        st.rerun()
-                    except Exception as e:
-                        st.error(str(e))
-        with col5:
-            if st.button("All", key=f"{key_prefix}rerun_all_btn"):
-                with st.spinner("Regenerating all..."):
-                    try:
-                        mods = {"regenerate": ["title", "prompts", "cover_prompts", "keywords"]}
+        # One selector and one button instead of a button per part
+        choice = st.selectbox("Regenerate", options=list(REGENERATE_OPTIONS), key=f"{key_prefix}regen_choice")
+        if st.button("Run", key=f"{key_prefix}regen_run"):
+            spinner_text, parts = REGENERATE_OPTIONS[choice]
+            with st.spinner(spinner_text):
+                try:
+                    if parts is None:
+                        updated = _cached_full_rerun(state)
+                    else:
+                        mods = {"regenerate": list(parts)}
                         if custom_instructions.strip():
                             mods["custom_instructions"] = custom_instructions.strip()
-                        updated = rerun_design_with_modifications(state, mods)
-                        _save_or_update_design_package(updated)
-                        st.session_state.workflow_state = updated
-                        st.rerun()
-                    except Exception as e:
-                        st.error(str(e))
-        with col6:
-            if st.button("Full Rerun", key=f"{key_prefix}rerun_full_btn"):
-                with st.spinner("Full rerun from concept..."):
-                    try:
-                        concept = state.get("concept_source") or state.get("concept")
-                        if concept:
-                            updated = run_design_for_concept(concept)
-                            _save_or_update_design_package(updated)
-                            st.session_state.workflow_state = updated
-                            st.rerun()
-                        else:
-                            updated = run_coloring_book_agent(state.get("user_request", ""))
-                            _save_or_update_design_package(updated)
-                            st.session_state.workflow_state = updated
-                            st.rerun()
-                    except Exception as e:
-                        st.error(str(e))
+                        updated = _cached_rerun(state, mods)
+                    _save_or_update_design_package(updated)
+                    st.session_state.workflow_state = updated
+                    st.rerun()
+                except Exception as e:
+                    st.error(str(e))
+
+
+def _apply_lines_edit(state: dict, widget_key: str, state_key: str) -> None:
+    """on_change callback: store a one-item-per-line text area as a list on the state."""
+    text = st.session_state.get(widget_key, "")
+    state[state_key] = [line.strip() for line in text.split("\n") if line.strip()]
+
+
+@st.fragment
+def _render_edit_controls(state: dict, key_prefix: str = ""):
+    """Edit and Save expander; edits apply to the workflow state and persist on Save."""
     with st.expander("Edit and Save", expanded=False):
         st.caption("Modify the design below and click Save to persist changes.")
         edited_title = st.text_input("Title", value=state.get("title", ""), key="edit_title", max_chars=100)
         edited_desc = st.text_area("Description", value=state.get("description", ""), key="edit_desc", height=150)
         keywords_list = state.get("seo_keywords", [])
-        edited_keywords = st.text_area("Keywords (one per line)", value="\n".join(keywords_list) if isinstance(keywords_list, list) else str(keywords_list), key="edit_keywords", height=100)
+        st.text_area(
+            "Keywords (one per line)", value="\n".join(keywords_list) if isinstance(keywords_list, list) else str(keywords_list),
+            key="edit_keywords", height=100, on_change=_apply_lines_edit, args=(state, "edit_keywords", "seo_keywords"),
+        )
         expanded_theme_edit = state.get("expanded_theme") or {}
         with st.expander("Theme & Artistic Style (advanced)", expanded=False):
             col1, col2 = st.columns(2)
@@ -462,15 +434,18 @@ def render_final_results_compact(state: dict, key_prefix: str = ""):
             state["expanded_theme"]["target_audience"] = expanded_theme_edit.get("target_audience", "")
         with st.expander("Interior prompts (B&W) (advanced)", expanded=False):
             prompts_list = state.get("midjourney_prompts", [])
-            edited_prompts = st.text_area("Prompts (one per line)", value="\n".join(prompts_list) if isinstance(prompts_list, list) else "", key="edit_prompts", height=200)
-            state["midjourney_prompts"] = [p.strip() for p in edited_prompts.split("\n") if p.strip()]
+            st.text_area(
+                "Prompts (one per line)", value="\n".join(prompts_list) if isinstance(prompts_list, list) else "",
+                key="edit_prompts", height=200, on_change=_apply_lines_edit, args=(state, "edit_prompts", "midjourney_prompts"),
+            )
         with st.expander("Cover prompts (color) (advanced)", expanded=False):
             cover_list = state.get("cover_prompts", [])
-            edited_cover = st.text_area("Cover prompts (one per line)", value="\n".join(cover_list) if isinstance(cover_list, list) else "", key="edit_cover_prompts", height=120)
-            state["cover_prompts"] = [p.strip() for p in edited_cover.split("\n") if p.strip()]
+            st.text_area(
+                "Cover prompts (one per line)", value="\n".join(cover_list) if isinstance(cover_list, list) else "",
+                key="edit_cover_prompts", height=120, on_change=_apply_lines_edit, args=(state, "edit_cover_prompts", "cover_prompts"),
+            )
         state["title"] = edited_title
         state["description"] = edited_desc
-        state["seo_keywords"] = [k.strip() for k in edited_keywords.split("\n") if k.strip()]
         st.session_state.workflow_state = state
         if st.button("Save changes", key="save_edits_btn"):
             if not edited_title.strip():
@@ -485,6 +460,13 @@ def render_final_results_compact(state: dict, key_prefix: str = ""):
                     st.rerun()
                 except Exception as e:
                     st.error(f"Error saving: {e}")
+
+
+def render_final_results_compact(state: dict, key_prefix: str = ""):
+    """Render compact final results display with editable fields and rerun controls."""
+    st.markdown("### Generated Design Package")
+    _render_regenerate_controls(state, key_prefix)
+    _render_edit_controls(state, key_prefix)
     title = state.get("title", "")
     description = state.get("description", "")
     expanded_theme = state.get("expanded_theme", {})
@@ -572,19 +554,31 @@ def render_final_results_compact(state: dict, key_prefix: str = ""):
             }
         }
 
+        # Encode once: st.json takes the same string instead of re-serializing the dict
+        if ORJSON_AVAILABLE:
+            report_json = orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            report_json = json.dumps(report, indent=2)
         st.download_button(
             "Download Full Report (JSON)",
-            data=json.dumps(report, indent=2),
+            data=report_json,
             file_name="coloring_book_report.json",
             mime="application/json"
         )
 
-        st.json(report)
+        st.json(report_json)
 
 
+@st.fragment
 def render_attempt_history_collapsed(state: dict):
-    """Render collapsed attempt history at bottom."""
-    with st.expander("View Detailed Attempt History", expanded=False):
+    """
+    Render the attempt history at the bottom, behind a toggle.
+
+    A collapsed st.expander still runs its body on every rerun, so the history
+    (every attempt of every component) is only built while the toggle is on.
+    As a fragment, flipping the toggle reruns just this section.
+    """
+    if st.toggle("View Detailed Attempt History", value=False, key="show_attempt_history"):
         st.markdown("### Per-Component Attempt History")
         st.markdown("*Review each attempt to verify evaluator quality*")
 
@@ -631,8 +625,50 @@ def render_attempt_history_collapsed(state: dict):
         )
 
 
-def _normalize_concept(theme: str, style: str, variations: list = None) -> dict:
-    """Build a concept dict from theme + style, optionally enriching from variations."""
+def _variation_theme_style(v: dict) -> tuple[str, str]:
+    """(theme, style) of a concept variation, falling back to its mixable_components."""
+    mixable = v.get("mixable_components", {})
+    return v.get("theme_concept") or mixable.get("theme") or "", v.get("art_style") or mixable.get("style") or ""
+
+
+def _index_variations(variations: list) -> dict:
+    """Map each theme and each style to the first variation carrying it."""
+    by_theme, by_style = {}, {}
+    for v in variations:
+        theme, style = _variation_theme_style(v)
+        by_theme.setdefault(theme, v)
+        by_style.setdefault(style, v)
+    return {"theme": by_theme, "style": by_style}
+
+
+def _variation_lookup(variations: list) -> dict:
+    """
+    Per-variation (theme, style) pairs, the variation index and the distinct
+    mix-and-match options, kept in session state for the current variations list.
+    Regenerating variations assigns a new list, which invalidates the entry.
+    """
+    cached = st.session_state.get("_variation_lookup")
+    if cached is not None and cached["variations"] is variations:
+        return cached
+    theme_styles = [_variation_theme_style(v) for v in variations]
+    themes = [t for t in dict.fromkeys(theme.strip() for theme, _ in theme_styles) if t] or [""]
+    styles = [s for s in dict.fromkeys(style.strip() for _, style in theme_styles) if s] or [""]
+    lookup = {
+        "variations": variations,
+        "theme_styles": theme_styles,
+        "index": _index_variations(variations),
+        "themes": themes,
+        "styles": styles,
+    }
+    st.session_state["_variation_lookup"] = lookup
+    return lookup
+
+
+def _normalize_concept(theme: str, style: str, index: dict = None) -> dict:
+    """
+    Build a concept dict from theme + style, optionally enriching it from the
+    variation index (the variation with this theme, else the one with this style).
+    """
     concept = {
         "theme": theme,
         "style": style,
@@ -640,18 +676,33 @@ def _normalize_concept(theme: str, style: str, variations: list = None) -> dict:
         "art_style": style,
         "mixable_components": {"theme": theme, "style": style},
     }
-    if variations:
-        for v in variations:
-            if (v.get("theme_concept") or v.get("mixable_components", {}).get("theme")) == theme:
-                concept["style_description"] = v.get("style_description", "")
-                concept["unique_angle"] = v.get("unique_angle", "")
-                break
-            if (v.get("art_style") or v.get("mixable_components", {}).get("style")) == style:
-                concept["style_description"] = concept.get("style_description") or v.get("style_description", "")
-                concept["unique_angle"] = concept.get("unique_angle") or v.get("unique_angle", "")
+    if index:
+        v = index["theme"].get(theme) or index["style"].get(style)
+        if v:
+            concept["style_description"] = v.get("style_description", "")
+            concept["unique_angle"] = v.get("unique_angle", "")
     return concept
 
 
+# Session keys of the design tab and factories for their initial values
+SESSION_DEFAULTS = (
+    ("concept_variations", list),
+    ("selected_concepts", list),
+    ("generated_designs", list),
+    ("generation_in_progress", lambda: False),
+    ("generation_job", lambda: None),
+    ("generated_designs_version", lambda: 0),
+)
+
+
+def _init_session_defaults() -> None:
+    """Set every missing design-tab session key to a fresh default."""
+    session = st.session_state
+    for key, factory in SESSION_DEFAULTS:
+        if key not in session:
+            session[key] = factory()
+
+
 def render_concept_research_section():
     """Render the preliminary concept research section with variations and mix-and-match."""
     st.markdown("### 1. Concept Research")
@@ -659,12 +710,9 @@ def render_concept_research_section():
         f"Enter an idea to get creative variations. Select concepts for design generation (up to {MAX_SELECTED_CONCEPTS})."
     )
 
-    if "concept_variations" not in st.session_state:
-        st.session_state.concept_variations = []
-    if "selected_concepts" not in st.session_state:
-        st.session_state.selected_concepts = []
-    if "generated_designs" not in st.session_state:
-        st.session_state.generated_designs = []
+    _init_session_defaults()
+    # Read once per render; every handler that changes it ends with st.rerun()
+    is_running = st.session_state.get("is_running", False)
 
     idea_input = st.text_input(
         "Your idea (e.g., dog, forest animals, ocean life):",
@@ -682,12 +730,19 @@ def render_concept_research_section():
     if st.button(
         f"Generate {num_variations} Concept Variations",
         key="gen_variations_btn",
-        disabled=st.session_state.get("is_running", False),
+        disabled=is_running,
     ):
         if idea_input.strip():
             with st.spinner(f"Generating {num_variations} creative variations..."):
                 try:
-                    variations = generate_concept_variations(idea_input.strip(), num_variations=num_variations)
+                    # Show each variation as soon as its JSON element has streamed in
+                    variations = []
+                    preview = st.empty()
+                    for variation in stream_concept_variations(idea_input.strip(), num_variations=num_variations):
+                        variations.append(variation)
+                        preview.markdown("\n".join(
+                            f"- **{v['theme_concept']}** — {v['art_style']}" for v in variations
+                        ))
                     st.session_state.concept_variations = variations
                     st.rerun()
                 except Exception as e:
@@ -697,6 +752,12 @@ def render_concept_research_section():
 
     variations = st.session_state.concept_variations
     selected = st.session_state.selected_concepts
+    # (theme, style) of every selected concept, for the add buttons' duplicate checks
+    selected_keys = {(c.get("theme", ""), c.get("style", "")) for c in selected}
+    # (theme, style) per variation and the lookup index, extracted once per variations list
+    lookup = _variation_lookup(variations)
+    theme_styles = lookup["theme_styles"]
+    variation_index = lookup["index"]
 
     if variations:
         st.markdown("#### Concept Variations")
@@ -705,18 +766,15 @@ def render_concept_research_section():
         if st.button(
             "Add all variations",
             key="add_all_btn",
-            disabled=st.session_state.get("is_running", False) or len(selected) >= MAX_SELECTED_CONCEPTS,
+            disabled=is_running or len(selected) >= MAX_SELECTED_CONCEPTS,
         ):
-            existing_keys = {(c.get("theme", ""), c.get("style", "")) for c in st.session_state.selected_concepts}
-            for v in variations:
+            for theme, style in theme_styles:
                 if len(st.session_state.selected_concepts) >= MAX_SELECTED_CONCEPTS:
                     break
-                theme = v.get("theme_concept") or v.get("mixable_components", {}).get("theme", "")
-                style = v.get("art_style") or v.get("mixable_components", {}).get("style", "")
-                if (theme, style) not in existing_keys:
-                    concept = _normalize_concept(theme, style, variations)
-                    st.session_state.selected_concepts = st.session_state.selected_concepts + [concept]
-                    existing_keys.add((theme, style))
+                if (theme, style) not in selected_keys:
+                    concept = _normalize_concept(theme, style, variation_index)
+                    st.session_state.selected_concepts.append(concept)
+                    selected_keys.add((theme, style))
             st.rerun()
 
         cards_per_row = 3
@@ -728,8 +786,8 @@ def render_concept_research_section():
                     break
                 v = variations[i]
                 with col:
-                    theme = v.get("theme_concept") or v.get("mixable_components", {}).get("theme", "?")
-                    style = v.get("art_style") or v.get("mixable_components", {}).get("style", "?")
+                    theme, style = theme_styles[i]
+                    theme, style = theme or "?", style or "?"
                     with st.container(border=True):
                         st.markdown(f"**{theme}**")
                         st.caption(style)
@@ -738,23 +796,15 @@ def render_concept_research_section():
                         if st.button(
                             "Add to concepts",
                             key=f"add_variation_{i}",
-                            disabled=len(selected) >= MAX_SELECTED_CONCEPTS or st.session_state.get("is_running", False),
+                            disabled=len(selected) >= MAX_SELECTED_CONCEPTS or is_running,
                         ):
-                            existing_keys = {(c.get("theme", ""), c.get("style", "")) for c in st.session_state.selected_concepts}
-                            if (theme, style) not in existing_keys:
-                                concept = _normalize_concept(theme, style, variations)
-                                st.session_state.selected_concepts = st.session_state.selected_concepts + [concept]
+                            if (theme, style) not in selected_keys:
+                                concept = _normalize_concept(theme, style, variation_index)
+                                st.session_state.selected_concepts.append(concept)
                             st.rerun()
 
         with st.expander("Create custom concept (mix and match)", expanded=False):
-            themes = list(
-                {(v.get("theme_concept") or v.get("mixable_components", {}).get("theme") or "").strip() for v in variations}
-            )
-            themes = [t for t in themes if t] or [""]
-            styles = list(
-                {(v.get("art_style") or v.get("mixable_components", {}).get("style") or "").strip() for v in variations}
-            )
-            styles = [s for s in styles if s] or [""]
+            themes, styles = lookup["themes"], lookup["styles"]
             col1, col2 = st.columns(2)
             with col1:
                 sel_theme = st.selectbox("Theme", options=themes, key="mix_theme")
@@ -762,9 +812,9 @@ def render_concept_research_section():
                 sel_style = st.selectbox("Art Style", options=styles, key="mix_style")
             if st.button("Add Custom Concept", key="add_concept_btn"):
                 if sel_theme and sel_style:
-                    concept = _normalize_concept(sel_theme, sel_style, variations)
+                    concept = _normalize_concept(sel_theme, sel_style, variation_index)
                     if len(st.session_state.selected_concepts) < MAX_SELECTED_CONCEPTS:
-                        st.session_state.selected_concepts = st.session_state.selected_concepts + [concept]
+                        st.session_state.selected_concepts.append(concept)
                         st.rerun()
                     else:
                         st.warning(f"Maximum {MAX_SELECTED_CONCEPTS} concepts. Remove one to add another.")
@@ -783,27 +833,204 @@ def render_concept_research_section():
                 st.markdown(f"**{idx + 1}.** {theme} | {style}")
             with chip_col2:
                 if st.button("Remove", key=f"remove_concept_{idx}"):
-                    st.session_state.selected_concepts = [x for i, x in enumerate(selected) if i != idx]
+                    del st.session_state.selected_concepts[idx]
                     st.rerun()
 
     return variations, st.session_state.selected_concepts
 
 
+@dataclass
+class GenerationJob:
+    """Progress of a background design-generation run, shared between the worker thread and the UI."""
+
+    queue: list[dict]
+    single_insert_idx: int | None = None
+    current_index: int = 0
+    current_step: int = 0
+    results: list[dict] = field(default_factory=list)
+    error: str = ""
+    done: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # Status label per queued concept, built once instead of on every progress refresh
+    labels: list[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        total = len(self.queue)
+        self.labels = [
+            f"Design {i + 1} of {total}: {c.get('theme', '')} | {c.get('style', '')}"
+            for i, c in enumerate(self.queue)
+        ]
+
+    def update(self, **kwargs) -> None:
+        with self._lock:
+            for k, v in kwargs.items():
+                setattr(self, k, v)
+
+    def add_result(self, state: dict) -> None:
+        with self._lock:
+            self.results.append(state)
+
+    def snapshot(self) -> dict:
+        """Return a copy of the progress fields for the UI to read."""
+        with self._lock:
+            return {
+                "current_index": self.current_index,
+                "current_step": self.current_step,
+                "results": list(self.results),
+                "error": self.error,
+                "done": self.done,
+            }
+
+
+def _run_generation_worker(job: GenerationJob, io_pool: ThreadPoolExecutor) -> None:
+    """
+    Run every design step for every queued concept in one thread, publishing
+    progress on the job. Stops at the first failing concept.
+
+    Design packages are written on io_pool so the next concept starts without
+    waiting on disk; their paths are attached before the job is marked done.
+    """
+    packages = []
+    for idx, concept in enumerate(job.queue):
+        job.update(current_index=idx, current_step=0)
+        try:
+            for step_idx, (_, state) in enumerate(run_design_pipeline_for_concept(concept), start=1):
+                job.update(current_step=step_idx)
+        except Exception as e:
+            job.update(error=f"Error generating design {idx + 1}: {e}", done=True)
+            return
+        packages.append((state, io_pool.submit(create_design_package, state)))
+        job.add_result(state)
+    for state, future in packages:
+        try:
+            path = future.result()
+            state["design_package_path"] = path
+            state["images_folder_path"] = path
+        except Exception:
+            pass
+    job.update(done=True)
+
+
+def _start_generation(concepts: list, insert_idx: int | None = None) -> None:
+    """Start a background generation run; insert_idx places a single result at that concept's slot."""
+    job = GenerationJob(queue=list(concepts), single_insert_idx=insert_idx)
+    st.session_state.generation_job = job
+    st.session_state.generation_in_progress = True
+    st.session_state.is_running = True
+    threading.Thread(target=_run_generation_worker, args=(job, _state_executor()), daemon=True).start()
+
+
+def _design_summaries(designs: list) -> list:
+    """
+    Card headers (title, prompt count, keyword count, generation log) of every
+    generated design, rebuilt only when generated_designs_version changes.
+    """
+    version = st.session_state.generated_designs_version
+    cached = st.session_state.get("_design_summaries")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    summaries = [
+        (d.get("title", "Untitled"), len(d.get("midjourney_prompts", ())), len(d.get("seo_keywords", ())), d.get("generation_log", ()))
+        for d in designs
+    ]
+    st.session_state["_design_summaries"] = (version, summaries)
+    return summaries
+
+
+def _finish_generation(job: GenerationJob, progress: dict) -> None:
+    """
+    Apply a finished job's results to generated_designs (or keep its error for
+    display). This is the only writer of generated_designs, so it bumps
+    generated_designs_version.
+    """
+    st.session_state.generation_in_progress = False
+    st.session_state.is_running = False
+    st.session_state.generation_job = None
+    if progress["error"]:
+        st.session_state.generation_error = progress["error"]
+        return
+    results = progress["results"]
+    single_idx = job.single_insert_idx
+    if single_idx is not None and results:
+        # Fill the concept's slot in place, growing the list up to it when needed
+        designs = st.session_state.generated_designs
+        if len(designs) <= single_idx:
+            designs.extend({} for _ in range(single_idx + 1 - len(designs)))
+        designs[single_idx] = results[0]
+    else:
+        st.session_state.generated_designs = results
+    st.session_state.generated_designs_version += 1
+
+
+# Only this block reruns while the worker runs; the page reruns once, when the job is done
+@st.fragment(run_every=2.0)
+def _render_generation_progress():
+    """Status of the running generation job, polled from the worker's progress."""
+    job = st.session_state.get("generation_job")
+    if job is None:
+        return
+    progress = job.snapshot()
+    if progress["done"]:
+        _finish_generation(job, progress)
+        st.rerun()
+
+    completed_count = progress["current_step"]
+    with st.status(job.labels[progress["current_index"]], state="running", expanded=True):
+        lines = []
+        for i, name in enumerate(STEP_DISPLAY_NAMES):
+            mark = "✓" if i < completed_count else ("⟳" if i == completed_count else "○")
+            lines.append(f"- {mark} {name}")
+        st.markdown("\n".join(lines))
+
+
+# A click inside one card reruns only that card before its handler calls the app-wide st.rerun()
+@st.fragment
+def _render_concept_card(idx: int, concept: dict, is_running: bool, design: dict | None = None, summary: tuple = ()):
+    """
+    Expander for one selected concept: its generated design with use/regenerate, or a generate button.
+    summary is the design's (title, prompt count, keyword count, generation log).
+    """
+    with st.expander(f"Concept {idx + 1}: {concept.get('theme', '')} | {concept.get('style', '')}", expanded=design is not None):
+        if design is not None:
+            title, prompt_count, keyword_count, gen_log = summary
+            st.markdown(f"**{title}**")
+            st.caption(f"{prompt_count} prompts | {keyword_count} keywords")
+            if gen_log:
+                with st.expander("Generation log", expanded=False):
+                    for entry in gen_log:
+                        st.write(f"✓ {entry.get('message', '')}")
+            col_a, col_b = st.columns(2)
+            with col_a:
+                if st.button("Use this design", key=f"use_design_{idx}"):
+                    design_copy = dict(design)
+                    design_images_folders = st.session_state.get("mj_design_images_folders", {})
+                    if idx in design_images_folders:
+                        design_copy["images_folder_path"] = design_images_folders[idx]
+                    st.session_state.workflow_state = design_copy
+                    st.rerun()
+            with col_b:
+                if st.button("Regenerate", key=f"regen_concept_{idx}", disabled=is_running):
+                    _start_generation([concept], insert_idx=idx)
+                    st.rerun()
+        else:
+            if st.button(f"Generate design {idx + 1}", key=f"gen_single_{idx}", disabled=is_running):
+                _start_generation([concept], insert_idx=idx)
+                st.rerun()
+
+
 def render_design_generation_tab():
     """Render the Design Generation tab with all three sections."""
     st.markdown("## Design Generation")
 
-    if "concept_variations" not in st.session_state:
-        st.session_state.concept_variations = []
-    if "selected_concepts" not in st.session_state:
-        st.session_state.selected_concepts = []
-    if "generated_designs" not in st.session_state:
-        st.session_state.generated_designs = []
+    _init_session_defaults()
 
     variations, selected_concepts = render_concept_research_section()
 
+    # Read once per render; every handler that changes them ends with st.rerun()
     workflow_state = st.session_state.get("workflow_state")
     generated_designs = st.session_state.get("generated_designs", [])
+    is_running = st.session_state.get("is_running", False)
+    in_progress = st.session_state.get("generation_in_progress", False)
 
     if selected_concepts:
         st.markdown("---")
@@ -813,165 +1040,29 @@ def render_design_generation_tab():
             "~2–3 min per design."
         )
 
-        if "generation_queue" not in st.session_state:
-            st.session_state.generation_queue = []
-        if "generation_results" not in st.session_state:
-            st.session_state.generation_results = []
-        if "generation_current_index" not in st.session_state:
-            st.session_state.generation_current_index = 0
-        if "generation_in_progress" not in st.session_state:
-            st.session_state.generation_in_progress = False
-        if "generation_step_state" not in st.session_state:
-            st.session_state.generation_step_state = None
-        if "generation_current_step" not in st.session_state:
-            st.session_state.generation_current_step = 0
-        if "generation_single_insert_idx" not in st.session_state:
-            st.session_state.generation_single_insert_idx = None
-
         n_concepts = len(selected_concepts)
         if st.button(
             f"Generate All {n_concepts} Designs",
             type="primary",
             key="gen_all_btn",
-            disabled=st.session_state.get("is_running", False) or st.session_state.get("generation_in_progress", False),
+            disabled=is_running or in_progress,
         ):
-            st.session_state.generation_queue = list(selected_concepts)
-            st.session_state.generation_results = []
-            st.session_state.generation_current_index = 0
-            st.session_state.generation_in_progress = True
-            st.session_state.generation_step_state = None
-            st.session_state.generation_current_step = 0
-            st.session_state.generation_single_insert_idx = None
-            st.session_state.is_running = True
+            _start_generation(selected_concepts)
             st.rerun()
 
-        if st.session_state.get("generation_in_progress") and st.session_state.generation_queue:
-            queue = st.session_state.generation_queue
-            results = st.session_state.generation_results
-            current_idx = st.session_state.generation_current_index
-            step_state = st.session_state.generation_step_state
-            step_idx = st.session_state.generation_current_step
-
-            if current_idx < len(queue):
-                concept = queue[current_idx]
-                theme = concept.get("theme", "")
-                style = concept.get("style", "")
-
-                if step_idx < len(DESIGN_STEPS):
-                    step_name = DESIGN_STEPS[step_idx]
-                    completed_count = step_idx
-
-                    with st.status(
-                        f"Design {current_idx + 1} of {len(queue)}: {theme} | {style}",
-                        state="running",
-                        expanded=True,
-                    ) as status:
-                        for i, name in enumerate(STEP_DISPLAY_NAMES):
-                            if i < completed_count:
-                                st.write(f"✓ {name}")
-                            elif i == completed_count:
-                                st.write(f"⟳ {name}")
-                            else:
-                                st.write(f"○ {name}")
-
-                        try:
-                            new_state = run_design_step_for_concept(concept, step_name, step_state)
-                            st.session_state.generation_step_state = new_state
-
-                            if step_name == "keywords":
-                                new_results = results + [new_state]
-                                st.session_state.generation_results = new_results
-                                try:
-                                    path = create_design_package(new_state)
-                                    new_state["design_package_path"] = path
-                                    new_state["images_folder_path"] = path
-                                except Exception:
-                                    pass
-                                st.session_state.generation_step_state = None
-                                st.session_state.generation_current_step = 0
-                                st.session_state.generation_current_index = current_idx + 1
-                                if st.session_state.generation_current_index >= len(queue):
-                                    st.session_state.generation_in_progress = False
-                                    st.session_state.is_running = False
-                                    single_idx = st.session_state.generation_single_insert_idx
-                                    if single_idx is not None:
-                                        designs = list(st.session_state.generated_designs)
-                                        while len(designs) <= single_idx:
-                                            designs.append({})
-                                        designs[single_idx] = new_results[0]
-                                        st.session_state.generated_designs = designs
-                                        st.session_state.generation_single_insert_idx = None
-                                    else:
-                                        st.session_state.generated_designs = new_results
-                                    status.update(label="All designs complete!", state="complete")
-                            else:
-                                st.session_state.generation_current_step = step_idx + 1
-                        except Exception as e:
-                            st.error(f"Error generating design {current_idx + 1}: {e}")
-                            st.session_state.generation_in_progress = False
-                            st.session_state.is_running = False
-
-                st.rerun()
-            else:
-                st.session_state.generation_in_progress = False
-                st.session_state.is_running = False
-                single_idx = st.session_state.generation_single_insert_idx
-                results = st.session_state.generation_results
-                if single_idx is not None and results:
-                    designs = list(st.session_state.generated_designs)
-                    while len(designs) <= single_idx:
-                        designs.append({})
-                    designs[single_idx] = results[0]
-                    st.session_state.generated_designs = designs
-                    st.session_state.generation_single_insert_idx = None
-                else:
-                    st.session_state.generated_designs = results
-                st.rerun()
-
-        generated_designs = st.session_state.get("generated_designs", [])
+        generation_error = st.session_state.pop("generation_error", "")
+        if generation_error:
+            st.error(generation_error)
+        if in_progress and st.session_state.get("generation_job"):
+            _render_generation_progress()
 
+        summaries = _design_summaries(generated_designs)
+        n_done = len(generated_designs)
         for idx, concept in enumerate(selected_concepts):
-            with st.expander(f"Concept {idx + 1}: {concept.get('theme', '')} | {concept.get('style', '')}", expanded=(idx < len(generated_designs))):
-                if idx < len(generated_designs):
-                    design = generated_designs[idx]
-                    st.markdown(f"**{design.get('title', 'Untitled')}**")
-                    st.caption(f"{len(design.get('midjourney_prompts', []))} prompts | {len(design.get('seo_keywords', []))} keywords")
-                    gen_log = design.get("generation_log", [])
-                    if gen_log:
-                        with st.expander("Generation log", expanded=False):
-                            for entry in gen_log:
-                                st.write(f"✓ {entry.get('message', '')}")
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        if st.button("Use this design", key=f"use_design_{idx}"):
-                            design_copy = dict(design)
-                            design_images_folders = st.session_state.get("mj_design_images_folders", {})
-                            if idx in design_images_folders:
-                                design_copy["images_folder_path"] = design_images_folders[idx]
-                            st.session_state.workflow_state = design_copy
-                            st.rerun()
-                    with col_b:
-                        if st.button("Regenerate", key=f"regen_concept_{idx}"):
-                            st.session_state.generation_queue = [concept]
-                            st.session_state.generation_results = []
-                            st.session_state.generation_current_index = 0
-                            st.session_state.generation_in_progress = True
-                            st.session_state.generation_step_state = None
-                            st.session_state.generation_current_step = 0
-                            st.session_state.generation_single_insert_idx = idx
-                            st.session_state.is_running = True
-                            st.rerun()
-                else:
-                    if st.button(f"Generate design {idx + 1}", key=f"gen_single_{idx}", disabled=st.session_state.get("is_running", False)):
-                        st.session_state.generation_queue = [concept]
-                        st.session_state.generation_results = []
-                        st.session_state.generation_current_index = 0
-                        st.session_state.generation_in_progress = True
-                        st.session_state.generation_step_state = None
-                        st.session_state.generation_current_step = 0
-                        st.session_state.generation_single_insert_idx = idx
-                        st.session_state.is_running = True
-                        st.rerun()
+            if idx < n_done:
+                _render_concept_card(idx, concept, is_running, generated_designs[idx], summaries[idx])
+            else:
+                _render_concept_card(idx, concept, is_running)
 
     st.markdown("---")
     st.markdown("### 3. Or Describe Your Coloring Book (Direct)")
@@ -984,9 +1075,9 @@ def render_design_generation_tab():
 
     col1, col2 = st.columns([1, 4])
     with col1:
-        generate_btn = st.button("Generate", type="primary", disabled=st.session_state.get("is_running", False))
+        generate_btn = st.button("Generate", type="primary", disabled=is_running)
     with col2:
-        if st.button("Clear", disabled=st.session_state.get("is_running", False)):
+        if st.button("Clear", disabled=is_running):
             st.session_state.workflow_state = None
             st.rerun()
 
@@ -996,6 +1087,7 @@ def render_design_generation_tab():
         if st.button("Save Current Design", key="save_design_btn"):
             try:
                 path = _save_or_update_design_package(workflow_state, name=save_name if save_name else None)
+                _list_saved_states_cached.clear()
                 st.success("Design saved!")
                 st.rerun()
             except Exception as e:
@@ -1006,8 +1098,9 @@ def render_design_generation_tab():
     render_design_package_selector(compact=False, key_prefix="design_gen_pkg")
 
     st.markdown("**Legacy Designs** (metadata only)")
-    saved_states = list_saved_states()
+    saved_states = _list_saved_states_cached(_saved_states_mtime())
     if saved_states:
+        legacy_futures = _prewarm_legacy_loads(saved_states[:5])
         for state_info in saved_states[:5]:
             with st.expander(f"{state_info['title']}", expanded=False):
                 st.caption(f"Saved: {state_info['saved_at']}")
@@ -1016,7 +1109,8 @@ def render_design_generation_tab():
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("Load", key=f"load_legacy_{state_info['name']}"):
-                        loaded = load_workflow_state(state_info["filepath"])
+                        future = legacy_futures.pop((state_info["filepath"], state_info["saved_at"]), None)
+                        loaded = future.result() if future else load_workflow_state(state_info["filepath"])
                         if loaded:
                             st.session_state.workflow_state = loaded
                             st.success("Design loaded (images may be missing)")
@@ -1024,6 +1118,7 @@ def render_design_generation_tab():
                 with col2:
                     if st.button("Delete", key=f"del_legacy_{state_info['name']}"):
                         if delete_saved_state(state_info["filepath"]):
+                            _list_saved_states_cached.clear()
                             st.success("Deleted!")
                             st.rerun()
     else:
@@ -1031,7 +1126,7 @@ def render_design_generation_tab():
 
     if workflow_state:
         pending_question = workflow_state.get("pending_question", "")
-        if pending_question and not st.session_state.get("is_running", False):
+        if pending_question and not is_running:
             st.info("**Agent Question**")
             st.markdown(f"**{pending_question}**")
 
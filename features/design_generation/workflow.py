@@ -2,12 +2,20 @@
 
 import os
 import json
+from collections.abc import Iterator
+from functools import lru_cache
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import create_react_agent
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from features.design_generation.agents.executor import get_executor_tools, EXECUTOR_SYSTEM_PROMPT
 from features.design_generation.tools.user_tools import display_results, UserQuestionException, get_pending_question, clear_pending_question
 from features.design_generation.tools.content_tools import (
@@ -15,16 +23,18 @@ from features.design_generation.tools.content_tools import (
     generate_and_refine_prompts,
     generate_and_refine_cover_prompts,
     generate_and_refine_keywords,
+    generate_design_bundle,
     regenerate_art_style,
-    regenerate_title_description,
-    regenerate_prompts,
-    regenerate_cover_prompts,
-    regenerate_keywords,
+    regenerate_parts,
 )
 from core.state import ColoringBookState
 
 load_dotenv()
 
+# Tool results carry every refine attempt, so they are decoded with orjson when available.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.JSONDecoder().decode
+
 
 def _build_theme_context_from_concept(concept: dict) -> dict:
     """Build theme_context dict from a concept for content generation tools."""
@@ -52,8 +62,14 @@ def _build_theme_context_from_concept(concept: dict) -> dict:
     }
 
 
+@lru_cache(maxsize=1)
 def create_executor_node():
-    """Create the executor node that generates content."""
+    """
+    Create the executor node that generates content.
+
+    Cached: the compiled agent graph holds no per-run state (no checkpointer),
+    so every executor run reuses it instead of rebuilding the client and graph.
+    """
     from config import EXECUTOR_MODEL, EXECUTOR_MODEL_TEMPERATURE
     llm = ChatOpenAI(
         model=EXECUTOR_MODEL,
@@ -92,50 +108,41 @@ def executor_node(state: ColoringBookState) -> ColoringBookState:
         new_state["theme_status"] = "completed"
         new_state["style_research"] = {}
 
-        # Generate title and description
-        generation_log.append({"step": "title", "message": "Generating title and description..."})
-        print("   📝 Generating title and description...")
-        title_result = generate_and_refine_title_description.invoke({"user_input": user_request, "theme_context": theme_context})
-        if isinstance(title_result, dict) and "final_content" in title_result:
-            fc = title_result["final_content"]
-            new_state["title"] = fc.get("title", "")
-            new_state["description"] = fc.get("description", "")
-            new_state["title_attempts"] = title_result.get("attempts", [])
-            new_state["title_score"] = title_result.get("final_score", 0)
-            new_state["title_passed"] = title_result.get("passed", False)
+        # Generate title, description, prompts and keywords in one combined call;
+        # parts that fail evaluation fall back to their own refine loops, which run
+        # concurrently with cover prompt generation
+        generation_log.append({"step": "title", "message": "Generating title, description, prompts and keywords..."})
+        generation_log.append({"step": "cover_prompts", "message": "Generating cover prompts..."})
+        print("   📝 Generating title, description, prompts, cover prompts and keywords...")
+        bundle = generate_design_bundle(user_request, theme_context)
+        title_result = bundle["title_description"]
+        fc = title_result["final_content"]
+        new_state["title"] = fc.get("title", "")
+        new_state["description"] = fc.get("description", "")
+        new_state["title_attempts"] = title_result.get("attempts", [])
+        new_state["title_score"] = title_result.get("final_score", 0)
+        new_state["title_passed"] = title_result.get("passed", False)
         new_state["title_status"] = "completed"
 
-        # Generate prompts
-        generation_log.append({"step": "prompts", "message": "Generating MidJourney prompts..."})
-        print("   🎨 Generating MidJourney prompts...")
-        prompts_result = generate_and_refine_prompts.invoke({"description": new_state.get("description", ""), "theme_context": theme_context})
-        if isinstance(prompts_result, dict) and "final_content" in prompts_result:
-            new_state["midjourney_prompts"] = prompts_result["final_content"]
-            new_state["prompts_attempts"] = prompts_result.get("attempts", [])
-            new_state["prompts_score"] = prompts_result.get("final_score", 0)
-            new_state["prompts_passed"] = prompts_result.get("passed", False)
+        prompts_result = bundle["prompts"]
+        new_state["midjourney_prompts"] = prompts_result["final_content"]
+        new_state["prompts_attempts"] = prompts_result.get("attempts", [])
+        new_state["prompts_score"] = prompts_result.get("final_score", 0)
+        new_state["prompts_passed"] = prompts_result.get("passed", False)
         new_state["prompts_status"] = "completed"
 
-        # Generate cover prompts
-        generation_log.append({"step": "cover_prompts", "message": "Generating cover prompts..."})
-        print("   📖 Generating cover prompts...")
-        cover_result = generate_and_refine_cover_prompts.invoke({"description": new_state.get("description", ""), "theme_context": theme_context})
-        if isinstance(cover_result, dict) and "final_content" in cover_result:
-            new_state["cover_prompts"] = cover_result["final_content"]
-            new_state["cover_prompts_attempts"] = cover_result.get("attempts", [])
-            new_state["cover_prompts_score"] = cover_result.get("final_score", 0)
-            new_state["cover_prompts_passed"] = cover_result.get("passed", False)
+        cover_result = bundle["cover_prompts"]
+        new_state["cover_prompts"] = cover_result["final_content"]
+        new_state["cover_prompts_attempts"] = cover_result.get("attempts", [])
+        new_state["cover_prompts_score"] = cover_result.get("final_score", 0)
+        new_state["cover_prompts_passed"] = cover_result.get("passed", False)
         new_state["cover_prompts_status"] = "completed"
 
-        # Generate keywords
-        generation_log.append({"step": "keywords", "message": "Generating SEO keywords..."})
-        print("   🔍 Generating SEO keywords...")
-        keywords_result = generate_and_refine_keywords.invoke({"description": new_state.get("description", ""), "theme_context": theme_context})
-        if isinstance(keywords_result, dict) and "final_content" in keywords_result:
-            new_state["seo_keywords"] = keywords_result["final_content"]
-            new_state["keywords_attempts"] = keywords_result.get("attempts", [])
-            new_state["keywords_score"] = keywords_result.get("final_score", 0)
-            new_state["keywords_passed"] = keywords_result.get("passed", False)
+        keywords_result = bundle["keywords"]
+        new_state["seo_keywords"] = keywords_result["final_content"]
+        new_state["keywords_attempts"] = keywords_result.get("attempts", [])
+        new_state["keywords_score"] = keywords_result.get("final_score", 0)
+        new_state["keywords_passed"] = keywords_result.get("passed", False)
         new_state["keywords_status"] = "completed"
 
         generation_log.append({"step": "complete", "message": "Design package complete!"})
@@ -228,7 +235,7 @@ def executor_node(state: ColoringBookState) -> ColoringBookState:
                 # Parse content if it's a string
                 if isinstance(content, str):
                     try:
-                        content = json.loads(content)
+                        content = _json_loads(content)
                     except json.JSONDecodeError:
                         continue
                 
@@ -670,6 +677,20 @@ def run_design_step_for_concept(
     return new_state
 
 
+def run_design_pipeline_for_concept(concept: dict) -> Iterator[tuple[str, ColoringBookState]]:
+    """
+    Run every step in DESIGN_STEPS for a concept, chaining each step's state
+    into the next.
+
+    Yields (step_name, state) after each step, so callers can report progress
+    without driving the steps themselves. The last state is the finished design.
+    """
+    state = None
+    for step_name in DESIGN_STEPS:
+        state = run_design_step_for_concept(concept, step_name, state)
+        yield step_name, state
+
+
 def rerun_design_with_modifications(
     existing_state: ColoringBookState,
     modifications: dict,
@@ -722,44 +743,48 @@ def rerun_design_with_modifications(
     user_input = theme_context.get("original_input", new_state.get("user_request", ""))
     description = new_state.get("description", "")
 
-    if "title" in regenerate_list:
-        print("   📝 Regenerating title and description...")
-        result = regenerate_title_description(theme_context, user_input, custom_instructions)
-        if isinstance(result, dict) and "final_content" in result:
-            fc = result["final_content"]
-            new_state["title"] = fc.get("title", "")
-            new_state["description"] = fc.get("description", "")
-            new_state["title_attempts"] = result.get("attempts", [])
-            new_state["title_score"] = result.get("final_score", 0)
-            new_state["title_passed"] = result.get("passed", False)
-        description = new_state.get("description", description)
-
-    if "prompts" in regenerate_list:
-        print("   🎨 Regenerating MidJourney prompts...")
-        result = regenerate_prompts(theme_context, description, custom_instructions)
-        if isinstance(result, dict) and "final_content" in result:
-            new_state["midjourney_prompts"] = result["final_content"]
-            new_state["prompts_attempts"] = result.get("attempts", [])
-            new_state["prompts_score"] = result.get("final_score", 0)
-            new_state["prompts_passed"] = result.get("passed", False)
-
-    if "cover_prompts" in regenerate_list:
-        print("   📖 Regenerating cover prompts...")
-        result = regenerate_cover_prompts(theme_context, description, custom_instructions)
-        if isinstance(result, dict) and "final_content" in result:
-            new_state["cover_prompts"] = result["final_content"]
-            new_state["cover_prompts_attempts"] = result.get("attempts", [])
-            new_state["cover_prompts_score"] = result.get("final_score", 0)
-            new_state["cover_prompts_passed"] = result.get("passed", False)
-
-    if "keywords" in regenerate_list:
-        print("   🔍 Regenerating SEO keywords...")
-        result = regenerate_keywords(theme_context, description, custom_instructions)
-        if isinstance(result, dict) and "final_content" in result:
-            new_state["seo_keywords"] = result["final_content"]
-            new_state["keywords_attempts"] = result.get("attempts", [])
-            new_state["keywords_score"] = result.get("final_score", 0)
-            new_state["keywords_passed"] = result.get("passed", False)
+    # Title/description first (its description feeds the rest), then prompts,
+    # cover prompts and keywords concurrently
+    labels = {
+        "title": "📝 Regenerating title and description...",
+        "prompts": "🎨 Regenerating MidJourney prompts...",
+        "cover_prompts": "📖 Regenerating cover prompts...",
+        "keywords": "🔍 Regenerating SEO keywords...",
+    }
+    parts = [p for p in labels if p in regenerate_list]
+    for part in parts:
+        print(f"   {labels[part]}")
+    results = regenerate_parts(theme_context, parts, user_input, description, custom_instructions) if parts else {}
+
+    result = results.get("title")
+    if isinstance(result, dict) and "final_content" in result:
+        fc = result["final_content"]
+        new_state["title"] = fc.get("title", "")
+        new_state["description"] = fc.get("description", "")
+        new_state["title_attempts"] = result.get("attempts", [])
+        new_state["title_score"] = result.get("final_score", 0)
+        new_state["title_passed"] = result.get("passed", False)
+
+    result = results.get("prompts")
+    if isinstance(result, dict) and "final_content" in result:
+        new_state["midjourney_prompts"] = result["final_content"]
+        new_state["prompts_attempts"] = result.get("attempts", [])
+        new_state["prompts_score"] = result.get("final_score", 0)
+        new_state["prompts_passed"] = result.get("passed", False)
+
+    result = results.get("cover_prompts")
+    if isinstance(result, dict) and "final_content" in result:
+        new_state["cover_prompts"] = result["final_content"]
+        new_state["cover_prompts_attempts"] = result.get("attempts", [])
+        new_state["cover_prompts_score"] = result.get("final_score", 0)
+        new_state["cover_prompts_passed"] = result.get("passed", False)
+
+    result = results.get("keywords")
+    if isinstance(result, dict) and "final_content" in result:
+        new_state["seo_keywords"] = result["final_content"]
+        new_state["keywords_attempts"] = result.get("attempts", [])
+        new_state["keywords_score"] = result.get("final_score", 0)
+        new_state["keywords_passed"] = result.get("passed", False)
 
     new_state["status"] = "complete"
     return new_state
@@ -0,0 +1,85 @@
+"""Tests for the design content generators."""
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from langchain_core.prompts import ChatPromptTemplate
+
+import features.design_generation.tools.content_tools as ct
+
+
+THEME = {
+    "original_input": "Highland cows",
+    "expanded_theme": "Highland cows in misty glens",
+    "artistic_style": "Celtic knotwork",
+    "signature_artist": "Aidan Meehan",
+    "style_keywords": ["celtic knot", "interlace"],
+    "visual_elements": ["thistles", "stone walls"],
+    "mood": ["calm"],
+}
+
+
+def _render(template: str, inputs: dict) -> str:
+    return ChatPromptTemplate.from_template(template).format_messages(**inputs)[0].content
+
+
+@pytest.mark.parametrize("template, build", [
+    (ct.TITLE_DESCRIPTION_PROMPT, lambda fb: ct._title_description_inputs("Highland cows", fb, THEME)),
+    (ct.INTERIOR_PROMPTS_PROMPT, lambda fb: ct._prompt_batch_inputs("A calm book", fb, THEME)[0]),
+    (ct.COVER_PROMPTS_PROMPT, lambda fb: ct._cover_prompts_inputs("A calm book", fb, THEME)),
+    (ct.KEYWORDS_PROMPT, lambda fb: ct._keywords_inputs("A calm book", fb, THEME)),
+], ids=["title_description", "prompts", "cover_prompts", "keywords"])
+def test_refine_attempts_share_prompt_prefix(template, build):
+    """Static instructions and theme context precede the per-attempt feedback."""
+    first = _render(template, build("Fix issue A"))
+    second = _render(template, build("Fix issue B"))
+    shared = len(os.path.commonprefix([first, second]))
+    assert shared >= first.index("Fix issue A")
+    assert first.index("Celtic knotwork") < first.index("Fix issue A")
+
+
+@pytest.mark.parametrize("scores, patience", [
+    ([50, 60, 70, 72, 73], 2),
+    ([50, 40, 41, 42, 43, 85], 5),
+], ids=["improving", "stalled_then_pass"])
+def test_refine_loop_makes_one_generate_call_per_attempt(monkeypatch, scores, patience):
+    """Speculative next attempts are only started when they will be used."""
+    monkeypatch.setattr(ct, "REFINE_EARLY_STOP_PATIENCE", patience)
+    calls = []
+
+    async def generate(feedback, attempt_num):
+        calls.append(attempt_num)
+        return {"attempt": attempt_num}
+
+    async def evaluate(content):
+        await asyncio.sleep(0)  # let a speculative generation start, as a real judge call would
+        return {"score": scores[content["attempt"] - 1], "passed": False}
+
+    result = asyncio.run(ct._refine_loop("test", "title", generate, evaluate, lambda best, score: ""))
+    assert result["attempts_needed"] == len(scores)
+    assert len(calls) == len(scores)
+
+
+def test_refine_loop_never_keeps_truncated_prompts():
+    """An early-aborted set is never final and its offending prompts reach the next feedback."""
+    feedbacks = []
+
+    async def generate(feedback, attempt_num):
+        feedbacks.append(feedback)
+        if attempt_num == 1:
+            return ct._AbortedPrompts(["cat, red roses"], ["cat, red roses"])
+        return [f"cat {attempt_num}"]
+
+    async def evaluate(prompts):
+        if isinstance(prompts, ct._AbortedPrompts):
+            return ct.prompts_abort_verdict(prompts, prompts.violations)
+        return {"score": 20, "passed": False}
+
+    result = asyncio.run(ct._refine_loop("test", "MidJourney Prompts", generate, evaluate, lambda best, score: ""))
+    assert "cat, red roses" in feedbacks[1]
+    assert result["final_content"] != ["cat, red roses"]
+    assert result["final_score"] == 20
@@ -0,0 +1,166 @@
+"""Tests for the design evaluator helpers."""
+
+import json
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+import features.design_generation.agents.evaluator as evaluator
+
+
+KEYWORDS = [
+    "cat coloring book", "cats", "cat mandalas", "kitten art", "cat lovers",
+    "kawaii cat doodle book", "cat coloring pages for adults",
+    "stress relief cat patterns", "zentangle cat designs", "cute kittens",
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from cached evaluator responses and chains."""
+    evaluator.clear_evaluation_cache()
+    evaluator._evaluator_chain.cache_clear()
+    yield
+    evaluator.clear_evaluation_cache()
+    evaluator._evaluator_chain.cache_clear()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace the evaluator LLM with a canned JSON response."""
+    response = json.dumps({"passed": True, "score": 90, "issues": [], "summary": "ok"})
+    monkeypatch.setattr(
+        evaluator, "get_evaluator_llm",
+        lambda: FakeListChatModel(responses=[response] * 10),
+    )
+
+
+def test_evaluate_batch_runs_all_components(fake_llm):
+    """Every requested component gets its own evaluation."""
+    results = evaluator.evaluate_batch({
+        "keywords": {"keywords": KEYWORDS},
+        "cover_prompts": {"prompts": ["cat book cover, no text --ar 2:1"]},
+    })
+    assert set(results) == {"keywords", "cover_prompts"}
+    assert results["keywords"]["metrics"]["short_tail_count"] == 5
+    assert results["cover_prompts"]["score"] == 90
+
+
+def test_evaluation_error_returns_failure(monkeypatch):
+    """LLM errors become a failed evaluation instead of raising."""
+    monkeypatch.setattr(
+        evaluator, "get_evaluator_llm",
+        lambda: FakeListChatModel(responses=["not json"]),
+    )
+    result = evaluator.evaluate_keywords(KEYWORDS)
+    assert result["passed"] is False
+    assert result["score"] == 0
+
+
+def test_repeated_evaluation_uses_cache(monkeypatch):
+    """Identical inputs are judged once; results are independent copies."""
+    calls = []
+    response = json.dumps({"passed": True, "score": 88, "issues": []})
+
+    def make_llm():
+        calls.append(1)
+        return FakeListChatModel(responses=[response])
+
+    monkeypatch.setattr(evaluator, "get_evaluator_llm", make_llm)
+    first = evaluator.evaluate_keywords(KEYWORDS, "dogs")
+    first["issues"].append("mutated")
+    second = evaluator.evaluate_keywords(KEYWORDS, "dogs")
+    assert len(calls) == 1
+    assert second["issues"] == []
+    assert second["score"] == 88
+
+
+def test_evaluate_bundle_fuses_judge_calls(monkeypatch):
+    """One call judges several parts; a part missing from it is judged on its own."""
+    verdict = {"passed": True, "score": 90, "issues": []}
+    llm = FakeListChatModel(responses=[
+        json.dumps({"cover_prompts": verdict}),
+        json.dumps({**verdict, "score": 70}),
+    ])
+    monkeypatch.setattr(type(llm), "bind", lambda self, **kwargs: self)
+    monkeypatch.setattr(evaluator, "get_evaluator_llm", lambda: llm)
+    results = evaluator.evaluate_bundle({
+        "cover_prompts": {"prompts": ["cat book cover, no text --ar 2:1"]},
+        "keywords": {"keywords": KEYWORDS},
+    })
+    assert results["cover_prompts"]["score"] == 90
+    assert results["keywords"]["score"] == 70
+
+
+def test_cover_precheck_flags_inside_page_wording(fake_llm):
+    """Cover prompts are checked for aspect ratio, cover wording and no-text."""
+    result = evaluator.evaluate_cover_prompts(
+        ["fox coloring book page, black and white --ar 1:1"]
+        + ["Fox Book Cover art, NO TEXT --ar 2:1"] * 4
+    )
+    issues = result["metrics"]["pre_check_issues"]
+    assert len(issues) == 4
+    assert all(i.startswith("Prompt 1 ") for i in issues)
+    assert result["score"] == 75
+
+
+def test_broken_keywords_skip_llm_judge(monkeypatch):
+    """A wrong keyword count fails on pre-checks without calling the LLM."""
+    monkeypatch.setattr(evaluator, "get_evaluator_llm", lambda: pytest.fail("LLM called"))
+    result = evaluator.evaluate_keywords(["cats", "cats"])
+    assert result["passed"] is False
+    assert result["score"] == evaluator.PRECHECK_FAIL_SCORE
+    assert result["metrics"]["duplicates"] == ["cats"]
+
+
+def test_color_word_prompts_skip_llm_judge(monkeypatch):
+    """Widespread color words fail on pre-checks; '--no color' alone is not flagged."""
+    monkeypatch.setattr(evaluator, "get_evaluator_llm", lambda: pytest.fail("LLM called"))
+    suffix = "coloring book page, clean and simple line art, black and white --no color --ar 1:1"
+    prompts = [f"cat {i}, red roses, {suffix}" for i in range(5)] + [f"cat, {suffix}"] * 45
+    result = evaluator.evaluate_prompts(prompts)
+    assert result["score"] == evaluator.PRECHECK_FAIL_SCORE
+    assert "Prompt 1: red" in result["issues"][0]["issue"]
+    assert len(result["metrics"]["pre_check_issues"]) == 5
+
+
+
+def test_short_prompt_set_scores_zero_and_names_bw_violations(monkeypatch):
+    """A short set never scores above 0 and its issues name the B&W violations."""
+    monkeypatch.setattr(evaluator, "get_evaluator_llm", lambda: pytest.fail("LLM called"))
+    suffix = "coloring book page, clean and simple line art --no color --ar 1:1"
+    result = evaluator.evaluate_prompts([f"cat, red roses, {suffix}", f"cat, black and white, {suffix}"])
+    assert result["score"] == 0
+    issues = " ".join(i["issue"] for i in result["issues"])
+    assert "Only 2 prompts" in issues
+    assert "Prompt 1: red" in issues
+    assert "missing 'black and white': prompts 1" in issues
+
+def test_stub_title_description_skips_llm_judge(monkeypatch):
+    """An empty title or stub description fails on pre-checks without calling the LLM."""
+    monkeypatch.setattr(evaluator, "get_evaluator_llm", lambda: pytest.fail("LLM called"))
+    result = evaluator.evaluate_title_description("Cat Mandalas", "Relaxing cat pages.")
+    assert result["score"] == evaluator.PRECHECK_FAIL_SCORE
+    assert result["title_issues"] == []
+    assert evaluator.evaluate_title_description("", "")["score"] == 0
+
+
+def test_check_cliches_matches_fallback(monkeypatch):
+    """Automaton and substring fallback report the same clichés in list order."""
+    text = "Look no further! Hours of fun and ENDLESS HOURS, the perfect gift."
+    ctx = evaluator.make_text_ctx(text)
+    found = evaluator.check_cliches(ctx)
+    monkeypatch.setattr(evaluator, "_CLICHE_AUTOMATON", None)
+    assert found == evaluator.check_cliches(ctx)
+    assert found == ["hours of fun", "endless hours", "perfect gift", "look no further"]
+
+
+def test_find_near_duplicate_keywords():
+    """Reordered or pluralized keywords are near-duplicates; distinct ones are not."""
+    pairs = evaluator.find_near_duplicate_keywords(
+        ["adult coloring", "coloring for adults", "dog mandalas", "ocean life"]
+    )
+    assert pairs == [("adult coloring", "coloring for adults")]